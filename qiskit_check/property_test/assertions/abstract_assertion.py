@@ -2,13 +2,20 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Sequence, Callable, Tuple, Union
 from uuid import uuid4
 
+from numpy import ndarray
 from qiskit.circuit import Instruction, Measure
 from qiskit_check.property_test.test_results.test_result import TestResult
 
+from qiskit_check.property_test.statistics import OneSampleTTests
 from qiskit_check.property_test.property_test_errors import IncorrectPropertyTestError, NoExperimentsError
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
 
 class AbstractAssertion(ABC):
+    # optional combiner receiving counts of a qubit in all experiments at once as an array of shape (instructions,
+    # experiments, 2) holding counts of state 0 and 1, it returns an array of shape (values, experiments) and is used
+    # instead of combiner when set
+    vectorized_combiner: Union[Callable[[ndarray], ndarray], None] = None
+
     def __init__(self, measurements: Sequence[Instruction], location: Union[int, None], combiner: Callable[[List[List[Dict[str, int]]]], List[List[float]]]) -> None:
         self.verify_measurements(measurements)
         
@@ -21,6 +28,21 @@ class AbstractAssertion(ABC):
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
         pass
 
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> Union[OneSampleTTests, None]:
+        """
+        get t-tests whose p-values combined by fisher method give p-value of the assertion, assessor computes t-tests
+        of all assertions of a test case together instead of calling get_p_value of each assertion
+        Args:
+            experiments: test results obtained from running property test
+            resource_matcher: mapping between qubit templates and ConcreteQubit
+            num_measurements: number of measurements per experiment
+            num_experiments: number of experiments done
+
+        Returns: t-tests of the assertion, none if p-value of the assertion is computed only by get_p_value
+
+        """
+        return None
+
     def verify(self, confidence_level: float, p_value: float) -> None:
         if 1 - confidence_level >= p_value:
             threshold = round(1 - confidence_level, 5)
@@ -1,14 +1,45 @@
 from abc import ABC
 from math import pi
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
+from numpy import array, ndarray
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction, Measure
 
 from qiskit_check.property_test.assertions.abstract_assertion import AbstractAssertion
+from qiskit_check.property_test.classical_shadows import get_shadow_bloch_vectors, get_shadow_expectations, \
+    get_shadow_measurements
+from qiskit_check.property_test.property_test_errors import IncorrectPropertyTestError
+from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
+from qiskit_check.property_test.test_results.array_test_result import get_count_array
+from qiskit_check.property_test.test_results.test_result import TestResult
 
 
 class AbstractDirectInversionStateAssertion(AbstractAssertion, ABC):
+    """
+    assertion on bloch vector of a qubit estimated by direct inversion of its measurements in x, y and z basis or
+    (opt-in) from its classical shadow, shadow of a qubit is measured in a family of settings each of which measures
+    every qubit in a randomly drawn pauli basis, so all qubits asserted in shadow mode are measured by the same
+    circuits and multi-qubit observables can be estimated from them as well, settings split number of measurements of
+    the test case among themselves so a shadow costs a third of the shots of direct inversion
+    """
+    def __init__(self, location: Union[int, None], num_shadow_settings: Union[int, None] = None) -> None:
+        """
+        initialize
+        Args:
+            location: where in the circuit measure the qubits state (index in QuantumCircuit.data)
+            num_shadow_settings: number of settings (multiple of 3) of classical shadow, none to estimate bloch vector
+            by direct inversion
+        """
+        if num_shadow_settings is None:
+            super().__init__(self.get_xyz_measurements(), location, self.combiner)
+        else:
+            if num_shadow_settings <= 0 or num_shadow_settings % 3 != 0:
+                raise IncorrectPropertyTestError("number of shadow settings must be a positive multiple of 3")
+            super().__init__(get_shadow_measurements(num_shadow_settings), location, self.shadow_combiner)
+            self.vectorized_combiner = get_shadow_expectations
+        self.num_shadow_settings = num_shadow_settings
+
     @staticmethod
     def get_xyz_measurements() -> Tuple[Instruction]:
         return (AbstractDirectInversionStateAssertion.get_x_measurement(), AbstractDirectInversionStateAssertion.get_y_measurement(), AbstractDirectInversionStateAssertion.get_z_measurement())
@@ -35,17 +66,38 @@ class AbstractDirectInversionStateAssertion(AbstractAssertion, ABC):
     
     @staticmethod
     def combiner(experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
-        results = [[], [], []] #list of x coordinates, y coordinates, z coordinates for each test run
-        for i in range(3):
-            for experiment in experiments[i]:
-                p = experiment["1"]/(experiment["0"] + experiment["1"])
-                if i == 0: # x coordinate
-                    results[i].append(1 - 2 * p)
-                    continue                
-                if i == 1: # y coordinate
-                    results[i].append(2 * p - 1)
-                    continue                
-                if i == 2: # z coordinate:
-                    results[i].append(1 - 2 * p)
-                    continue
-        return results
\ No newline at end of file
+        return AbstractDirectInversionStateAssertion.vectorized_combiner(get_count_array(experiments)).tolist()
+
+    @staticmethod
+    def vectorized_combiner(counts: ndarray) -> ndarray:
+        """
+        estimate bloch vector coordinates of a qubit by direct inversion
+        Args:
+            counts: counts of state 0 and 1 of the qubit measured in x, y and z basis of shape (3, experiments, 2)
+
+        Returns: array of shape (3, experiments) of x, y and z coordinates for each experiment
+
+        """
+        p = counts[:3, :, 1] / counts[:3].sum(axis=-1)
+        # y measurement rotates +y onto state 1 so its coordinate has opposite sign
+        return array([[1], [-1], [1]]) * (1 - 2 * p)
+
+    @staticmethod
+    def shadow_combiner(experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
+        return get_shadow_expectations(get_count_array(experiments)).tolist()
+
+    def get_bloch_vector_samples(
+            self, experiments: TestResult, qubit: Qubit, resource_matcher: Dict[Qubit, ConcreteQubit]) -> ndarray:
+        """
+        get estimates of bloch vector of a qubit in each experiment
+        Args:
+            experiments: test results obtained from running property test
+            qubit: qubit of the assertion
+            resource_matcher: mapping between qubit templates and ConcreteQubit
+
+        Returns: array of shape (3, experiments) of x, y and z coordinates for each experiment
+
+        """
+        if self.num_shadow_settings is None:
+            return array(experiments.individual_measurements[qubit][:3], dtype=float)
+        return get_shadow_bloch_vectors(experiments.individual_measurements[qubit], resource_matcher[qubit].qubit_index)
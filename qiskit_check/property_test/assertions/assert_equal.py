@@ -1,12 +1,14 @@
-from math import isnan
 from typing import Dict, List, Sequence, Union
 
-from scipy.stats import ttest_ind, ttest_rel, combine_pvalues
+from numpy import asarray, isnan, ndarray, where
+from scipy.stats import ttest_ind, ttest_rel
 from qiskit.circuit import Instruction, Measure
 from qiskit_check.property_test import test_results
+from qiskit_check.property_test.test_results.array_test_result import get_count_array
 
 from qiskit_check.property_test.assertions import AbstractAssertion
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
+from qiskit_check.property_test.statistics import OneSampleTTests, combine_p_values, get_combined_p_values
 
 
 class AssertEqualByProbability(AbstractAssertion):
@@ -30,24 +32,27 @@ class AssertEqualByProbability(AbstractAssertion):
         self.test = ttest_ind if ideal else ttest_rel
     
     def combiner(self, experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
-        counts_for_measurement = []
-        for experiments_for_measurement in experiments:
-            counts = []
-            for experiment in experiments_for_measurement:
-                counts.append(experiment[self.state_to_check])
-            counts_for_measurement.append(counts)
-        return counts_for_measurement
+        return self.vectorized_combiner(get_count_array(experiments)).tolist()
+
+    def vectorized_combiner(self, counts: ndarray) -> ndarray:
+        return counts[..., int(self.state_to_check)]
 
     def get_p_value(self, experiments: test_results, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
-        qubit_0_results = experiments.individual_measurements[self.qubit_0]
-        qubit_1_results = experiments.individual_measurements[self.qubit_1]
-
-        p_values = []
-        for qubit_0_per_measurement, qubit_1_results_per_measurement in zip(qubit_0_results, qubit_1_results):
-            p_value = self.test(qubit_0_per_measurement, qubit_1_results_per_measurement, nan_policy='omit').pvalue
-            if isnan(p_value):
-                p_value = 1 #TODO: figure out a better way to handle cases where tests return nan
-            p_values.append(p_value)
-
-        _, p_value = combine_pvalues(p_values)
-        return p_value
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        if t_tests is not None:
+            return float(get_combined_p_values([t_tests])[0])
+
+        # independent t-tests of all measurements are computed by a single call
+        qubit_0_results = asarray(experiments.individual_measurements[self.qubit_0], dtype=float)
+        qubit_1_results = asarray(experiments.individual_measurements[self.qubit_1], dtype=float)
+        p_values = self.test(qubit_0_results, qubit_1_results, axis=-1, nan_policy='omit').pvalue
+        p_values = where(isnan(p_values), 1, p_values)  #TODO: figure out a better way to handle cases where tests return nan
+        return float(combine_p_values(p_values, [len(p_values)])[0])
+
+    def get_one_sample_t_tests(self, experiments: test_results, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> Union[OneSampleTTests, None]:
+        if self.test is not ttest_rel:
+            return None
+        # paired t-test is one sample t-test of differences
+        qubit_0_results = asarray(experiments.individual_measurements[self.qubit_0], dtype=float)
+        qubit_1_results = asarray(experiments.individual_measurements[self.qubit_1], dtype=float)
+        return OneSampleTTests(qubit_0_results - qubit_1_results, 0)
@@ -1,15 +1,16 @@
-from math import sqrt, atan2, pi, isclose
 from typing import Dict, List
 
 import numpy as np
+from numpy import ndarray
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction
-from scipy.stats import ttest_1samp
 
 from qiskit_check.property_test.assertions import AbstractAssertion
 from qiskit_check.property_test.test_results.test_result import TestResult
+from qiskit_check.property_test.test_results.array_test_result import get_count_array
 
 from qiskit_check.property_test.resources import Qubit, ConcreteQubit
+from qiskit_check.property_test.statistics import OneSampleTTests, get_combined_p_values
 
 
 class AssertPhase(AbstractAssertion):
@@ -55,27 +56,28 @@ class AssertPhase(AbstractAssertion):
 
     @staticmethod
     def combiner(experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
-        results = [] #list of x phase, y phase, z phase for each test run
+        return AssertPhase.vectorized_combiner(get_count_array(experiments)).tolist()
 
-        for i in range(len(experiments[0])):
-            p0x = experiments[0][i]["0"]/(experiments[0][i]["0"] + experiments[0][i]["1"])
-            p1x = experiments[0][i]["1"]/(experiments[0][i]["0"] + experiments[0][i]["1"])
-            dx = p0x - p1x
-
-            p0y = experiments[1][i]["0"]/(experiments[1][i]["0"] + experiments[1][i]["1"])
-            p1y = experiments[1][i]["1"]/(experiments[1][i]["0"] + experiments[1][i]["1"])
-            dy = p0y - p1y
+    @staticmethod
+    def vectorized_combiner(counts: ndarray) -> ndarray:
+        """
+        estimate phase of a qubit from ramsey x and y measurements
+        Args:
+            counts: counts of state 0 and 1 of the qubit measured in x and y basis of shape (2, experiments, 2)
 
+        Returns: array of shape (1, experiments) of phases for each experiment, nan where phase is undefined
 
-            norm = dx**2 + dy**2
-            if norm == 0:
-                expected_phase = np.NaN
-            else:
-                x = dx/sqrt(norm)
-                y = dy/sqrt(norm)
-                expected_phase = atan2(y, x)
-            results.append(expected_phase)
+        """
+        probabilities = counts[:2] / counts[:2].sum(axis=-1, keepdims=True)
+        dx, dy = probabilities[..., 0] - probabilities[..., 1]
+        # atan2 doesn't depend on the norm of (dx, dy) but phase of a zero vector is undefined
+        phases = np.where((dx == 0) & (dy == 0), np.NaN, np.arctan2(dy, dx))
+        return phases.reshape(1, -1)
 
-        return [results]
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
-        return ttest_1samp(experiments.individual_measurements[self.qubit][0], self.expected_phases, alternative="two-sided").pvalue
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        return float(get_combined_p_values([t_tests])[0])
+
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> OneSampleTTests:
+        # experiments in which phase is undefined are omitted
+        return OneSampleTTests(experiments.individual_measurements[self.qubit][:1], self.expected_phases)
@@ -1,12 +1,13 @@
-from math import isnan
 from typing import Union, Dict, List, Sequence
 
-from scipy.stats import ttest_1samp, combine_pvalues
+from numpy import ndarray
 from qiskit.circuit import Instruction, Measure
 from qiskit_check.property_test.test_results.test_result import TestResult
+from qiskit_check.property_test.test_results.array_test_result import get_count_array
 
 from qiskit_check.property_test.assertions import AbstractAssertion
 from qiskit_check.property_test.property_test_errors import IncorrectQubitStateError
+from qiskit_check.property_test.statistics import OneSampleTTests, get_combined_p_values
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
 
 
@@ -23,21 +24,27 @@ class AssertProbability(AbstractAssertion):
         self.probability = probability
 
     def combiner(self, experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
-        probabilities_for_measurement = []
-        for experiments_for_measurement in experiments:
-            probabilities = []
-            for experiment in experiments_for_measurement:
-                probabilities.append(experiment[self.state]/sum(experiment.values()))
-            probabilities_for_measurement.append(probabilities)
-        return probabilities_for_measurement
+        return self.vectorized_combiner(get_count_array(experiments)).tolist()
+
+    def vectorized_combiner(self, counts: ndarray) -> ndarray:
+        return self.get_probabilities(counts, self.state)
+
+    @staticmethod
+    def get_probabilities(counts: ndarray, state: str) -> ndarray:
+        """
+        get probability of a qubit being in a state in each experiment
+        Args:
+            counts: counts of state 0 and 1 of the qubit of shape (instructions, experiments, 2)
+            state: state "0" or "1"
+
+        Returns: array of probabilities of shape (instructions, experiments)
+
+        """
+        return counts[..., int(state)] / counts.sum(axis=-1)
 
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
-        results = experiments.individual_measurements[self.qubit]
-        p_values = []
-        for result_per_measurement in results:
-            p_value = ttest_1samp(result_per_measurement, self.probability, alternative="two-sided", nan_policy='omit').pvalue
-            if isnan(p_value):
-                p_value = 1 #TODO: figure out a better way to handle cases where tests return nan
-            p_values.append(p_value)
-        _, p_value = combine_pvalues(p_values)
-        return p_value
\ No newline at end of file
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        return float(get_combined_p_values([t_tests])[0])
+
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> OneSampleTTests:
+        return OneSampleTTests(experiments.individual_measurements[self.qubit], self.probability)
@@ -1,13 +1,12 @@
-from math import isnan
 from sys import maxsize
-from typing import Callable, Sequence, Tuple, Dict, List
+from typing import Callable, Sequence, Tuple, Dict, List, Union
 
 from numpy import asarray
-from scipy.stats import ttest_1samp, combine_pvalues
 from qiskit_check.property_test.test_results.test_result import TestResult
 
 from qiskit_check.property_test.assertions.abstract_state_assertions import AbstractDirectInversionStateAssertion
 from qiskit_check.property_test.resources import Qubit, ConcreteQubit
+from qiskit_check.property_test.statistics import OneSampleTTests, get_combined_p_values
 from qiskit_check.property_test.utils import hopf_coordinates_to_bloch_vector
 
 
@@ -16,24 +15,16 @@ class AssertStateEqualConcreteValue(AbstractDirectInversionStateAssertion):
     assert if qubit is in given state at given time of circuit execution via quantum tomography
     """
     def __init__(
-            self, qubit: Qubit, expected_state: Tuple[float, float], location: int = None) -> None:
-        super().__init__(self.get_xyz_measurements(), location, self.combiner)
+            self, qubit: Qubit, expected_state: Tuple[float, float], location: int = None,
+            num_shadow_settings: Union[int, None] = None) -> None:
+        super().__init__(location, num_shadow_settings)
         self.qubit = qubit
         self.expected_state = hopf_coordinates_to_bloch_vector(*expected_state)
-        self.test = ttest_1samp
 
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
-        x_p_value = self.test(experiments.individual_measurements[self.qubit][0], self.expected_state[0], alternative="two-sided").pvalue
-        if isnan(x_p_value):
-            x_p_value = 1
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        return float(get_combined_p_values([t_tests])[0])
 
-        y_p_value = self.test(experiments.individual_measurements[self.qubit][1], self.expected_state[1], alternative="two-sided").pvalue
-        if isnan(y_p_value):
-            y_p_value = 1
-
-        z_p_value = self.test(experiments.individual_measurements[self.qubit][2], self.expected_state[2], alternative="two-sided").pvalue
-        if isnan(z_p_value):
-            z_p_value = 1
-
-        _, p_value = combine_pvalues([x_p_value, y_p_value, z_p_value])
-        return p_value
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> OneSampleTTests:
+        # x, y and z coordinates are tested separately
+        return OneSampleTTests(self.get_bloch_vector_samples(experiments, self.qubit, resource_matcher), self.expected_state)
@@ -1,13 +1,12 @@
-from math import isnan
-from typing import Dict, List
+from typing import Dict, List, Union
 
 from numpy import asarray
 from scipy.spatial.transform import Rotation
-from scipy.stats import ttest_1samp, combine_pvalues
 from qiskit_check.property_test.test_results.test_result import TestResult
 
 from qiskit_check.property_test.assertions.abstract_state_assertions import AbstractDirectInversionStateAssertion
 from qiskit_check.property_test.resources import Qubit, ConcreteQubit
+from qiskit_check.property_test.statistics import OneSampleTTests, get_combined_p_values
 from qiskit_check.property_test.utils import vector_state_to_hopf_coordinates, hopf_coordinates_to_bloch_vector
 from qiskit_check.property_test.utils import round_floats
 
@@ -16,18 +15,21 @@ class AssertTransformedByState(AbstractDirectInversionStateAssertion):
     """
     assert if qubit has been rotated by given rotation at a given location in circuit (via quantum tomography)
     """
-    def __init__(self, qubit: Qubit, rotation: Rotation, location: int = None) -> None:
+    def __init__(
+            self, qubit: Qubit, rotation: Rotation, location: int = None,
+            num_shadow_settings: Union[int, None] = None) -> None:
         """
         initialize
         Args:
             qubit: qubit which state to measure
             location: where in the circuit measure the qubits state (index in QuantumCircuit.data)
             rotation: scipy rotation object that specifies the expected rotation in 3d
+            num_shadow_settings: number of settings (multiple of 3) of classical shadow of the qubit, none to measure
+            it in x, y and z basis
         """
-        super().__init__(self.get_xyz_measurements(), location, self.combiner)
+        super().__init__(location, num_shadow_settings)
         self.qubit = qubit
         self.rotation = rotation
-        self.test = ttest_1samp
 
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
         """
@@ -39,6 +41,10 @@ class AssertTransformedByState(AbstractDirectInversionStateAssertion):
         Returns: p-value of the assertion
 
         """
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        return float(get_combined_p_values([t_tests])[0])
+
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> OneSampleTTests:
         qubit_initial_value = resource_matcher[self.qubit].value.data
         theta, phi = vector_state_to_hopf_coordinates(qubit_initial_value[0], qubit_initial_value[1])
         initial_bloch_vector = hopf_coordinates_to_bloch_vector(theta, phi)
@@ -49,18 +55,5 @@ class AssertTransformedByState(AbstractDirectInversionStateAssertion):
             round_floats(expected_bloch_vector[2])
         )
 
-        x_p_value = self.test(experiments.individual_measurements[self.qubit][0], expected_bloch_vector[0], alternative="two-sided").pvalue
-        if isnan(x_p_value):
-            x_p_value = 1
-
-        y_p_value = self.test(experiments.individual_measurements[self.qubit][1], expected_bloch_vector[1], alternative="two-sided").pvalue
-        if isnan(y_p_value):
-            y_p_value = 1
-
-        z_p_value = self.test(experiments.individual_measurements[self.qubit][2], expected_bloch_vector[2], alternative="two-sided").pvalue
-        if isnan(z_p_value):
-            z_p_value = 1
-
-        _, p_value = combine_pvalues([x_p_value, y_p_value, z_p_value])
-        return p_value
-
+        # x, y and z coordinates are tested separately
+        return OneSampleTTests(self.get_bloch_vector_samples(experiments, self.qubit, resource_matcher), expected_bloch_vector)
@@ -1,10 +1,13 @@
 from typing import Dict, List, Sequence
 
+from numpy import ndarray
 from qiskit.circuit import Instruction, Measure
 from qiskit_check.property_test.test_results.test_result import TestResult
+from qiskit_check.property_test.test_results.array_test_result import get_count_array
 
 from qiskit_check.property_test.assertions import AbstractAssertion, AssertProbability
 from qiskit_check.property_test.property_test_errors import NoQubitFoundError
+from qiskit_check.property_test.statistics import OneSampleTTests, get_combined_p_values
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
 
 
@@ -20,18 +23,19 @@ class AssertTeleportedByProbability(AbstractAssertion):
 
     # TODO: extract this into a super class that will encapsulate assert probability, assert teleported etc
     def combiner(self, experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
-        probabilities_for_measurement = []
-        for experiments_for_measurement in experiments:
-            probabilities = []
-            for experiment in experiments_for_measurement:
-                probabilities.append(experiment[self.state]/sum(experiment.values()))
-            probabilities_for_measurement.append(probabilities)
-        return probabilities_for_measurement
+        return self.vectorized_combiner(get_count_array(experiments)).tolist()
+
+    def vectorized_combiner(self, counts: ndarray) -> ndarray:
+        return AssertProbability.get_probabilities(counts, self.state)
 
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        return float(get_combined_p_values([t_tests])[0])
+
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> OneSampleTTests:
         if self.qubit_to_teleport not in resource_matcher or self.target_qubit not in resource_matcher:
             raise NoQubitFoundError("qubit specified in the assertion is not specified in qubits property of the test")
 
         expected_ground_state_probability = resource_matcher[self.qubit_to_teleport].value.probabilities()[0]
         assert_probability = AssertProbability(self.target_qubit, self.state, expected_ground_state_probability, self.measurements, self.location)
-        return assert_probability.get_p_value(experiments, resource_matcher, num_measurements, num_experiments)
+        return assert_probability.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
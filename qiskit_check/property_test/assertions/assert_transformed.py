@@ -2,11 +2,14 @@ from typing import Dict, List, Sequence
 from math import acos, cos
 
 from scipy.spatial.transform import Rotation
+from numpy import ndarray
 from qiskit.circuit import Instruction, Measure
 from qiskit_check.property_test.test_results import TestResult
+from qiskit_check.property_test.test_results.array_test_result import get_count_array
 
 from qiskit_check.property_test.assertions import AbstractAssertion, AssertProbability
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
+from qiskit_check.property_test.statistics import OneSampleTTests, get_combined_p_values
 from qiskit_check.property_test.utils import vector_state_to_hopf_coordinates, hopf_coordinates_to_bloch_vector
 
 
@@ -21,16 +24,17 @@ class AssertTransformedByProbability(AbstractAssertion):
         self.state = "0"
         
     def combiner(self, experiments: List[List[Dict[str, int]]]) -> List[List[float]]:
-        probabilities_for_measurement = []
-        for experiments_for_measurement in experiments:
-            probabilities = []
-            for experiment in experiments_for_measurement:
-                probabilities.append(experiment[self.state]/sum(experiment.values()))
-            probabilities_for_measurement.append(probabilities)
-        return probabilities_for_measurement
+        return self.vectorized_combiner(get_count_array(experiments)).tolist()
+
+    def vectorized_combiner(self, counts: ndarray) -> ndarray:
+        return AssertProbability.get_probabilities(counts, self.state)
 
 
     def get_p_value(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> float:
+        t_tests = self.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
+        return float(get_combined_p_values([t_tests])[0])
+
+    def get_one_sample_t_tests(self, experiments: TestResult, resource_matcher: Dict[Qubit, ConcreteQubit], num_measurements: int, num_experiments: int) -> OneSampleTTests:
         qubit_initial_value = resource_matcher[self.qubit].value.data
         theta, phi = vector_state_to_hopf_coordinates(qubit_initial_value[0], qubit_initial_value[1])
         bloch_vector = hopf_coordinates_to_bloch_vector(theta, phi)
@@ -38,4 +42,4 @@ class AssertTransformedByProbability(AbstractAssertion):
         theta = acos(expected_bloch_vector[2])
         expected_ground_state_probability = cos(theta/2)**2
         assert_probability = AssertProbability(self.qubit, self.state, expected_ground_state_probability, self.measurements, self.location)
-        return assert_probability.get_p_value(experiments, resource_matcher, num_measurements, num_experiments)
+        return assert_probability.get_one_sample_t_tests(experiments, resource_matcher, num_measurements, num_experiments)
@@ -0,0 +1,103 @@
+from typing import List
+
+from numpy import arange, asarray, errstate, ndarray
+from numpy.random import default_rng
+from qiskit import QuantumCircuit
+from qiskit.circuit import Instruction
+
+# bases are drawn from a fixed seed so that every test case (and every assertion measuring a qubit) uses the same
+# bases for a qubit index and its measurements are shared
+shadow_seed = 7129
+shadow_bases = ("x", "y", "z")
+
+
+class ShadowMeasurement(Instruction):
+    """
+    measurement of a qubit in one setting of a family of randomized pauli measurements (classical shadows), basis of
+    the setting depends on index of the measured qubit so the instruction is resolved to a measurement in that basis by
+    get_qubit_measurement once the index is known, until then it is defined as z measurement
+    """
+    def __init__(self, setting: int, num_settings: int) -> None:
+        """
+        initialize
+        Args:
+            setting: index of the setting in the family
+            num_settings: number of settings in the family (multiple of 3)
+        """
+        name = f"shadow_{setting}_{num_settings}"
+        super().__init__(name, 1, 1, [])
+        self.setting = setting
+        self.num_settings = num_settings
+        # settings are shared by their name rather than by basis of the definition
+        self.basis = name
+        definition = QuantumCircuit(1, 1, name=name)
+        definition.measure(0, 0)
+        self.definition = definition
+
+    def get_qubit_measurement(self, qubit_index: int) -> Instruction:
+        """
+        get measurement of a qubit in basis of the setting, it keeps name of the setting so results are parsed the same
+        way for all qubits
+        Args:
+            qubit_index: index of the measured qubit in the circuit
+
+        Returns: measurement instruction, 0 is the +1 eigenstate of the pauli of the basis
+
+        """
+        basis = get_shadow_bases(self.num_settings, qubit_index)[self.setting]
+        qc = QuantumCircuit(1, 1, name=self.name)
+        if shadow_bases[basis] == "x":
+            qc.h(0)
+        elif shadow_bases[basis] == "y":
+            qc.sdg(0)
+            qc.h(0)
+        qc.measure(0, 0)
+        return qc.to_instruction(label=self.name)
+
+
+def get_shadow_measurements(num_settings: int) -> List[ShadowMeasurement]:
+    return [ShadowMeasurement(setting, num_settings) for setting in range(num_settings)]
+
+
+def get_shadow_bases(num_settings: int, qubit_index: int) -> ndarray:
+    """
+    get bases in which a qubit is measured in each setting, bases of different qubits are drawn independently but each
+    basis is used by the same number of settings so that estimates don't depend on which bases were drawn
+    Args:
+        num_settings: number of settings (multiple of 3)
+        qubit_index: index of the qubit in the circuit
+
+    Returns: array of indices of bases (into shadow_bases) of each setting
+
+    """
+    return default_rng([shadow_seed, qubit_index]).permutation(arange(num_settings) % len(shadow_bases))
+
+
+def get_shadow_expectations(counts: ndarray) -> ndarray:
+    """
+    get expectation value of the pauli measured in each setting
+    Args:
+        counts: counts of state 0 and 1 of a qubit in each setting of shape (settings, experiments, 2)
+
+    Returns: array of shape (settings, experiments) of expectation values
+
+    """
+    with errstate(divide="ignore", invalid="ignore"):
+        return (counts[..., 0] - counts[..., 1]) / counts.sum(axis=-1)
+
+
+def get_shadow_bloch_vectors(expectations: ndarray, qubit_index: int) -> ndarray:
+    """
+    estimate bloch vector of a qubit in each experiment from its classical shadow, snapshot of a shot measured in basis
+    b with outcome s is 3 * s along b and 0 along other axes, so each coordinate is 3 times the mean of the snapshots
+    Args:
+        expectations: expectation values of the pauli measured in each setting of shape (settings, experiments)
+        qubit_index: index of the qubit in the circuit
+
+    Returns: array of shape (3, experiments) of x, y and z coordinates for each experiment
+
+    """
+    expectations = asarray(expectations, dtype=float)
+    num_settings = expectations.shape[0]
+    measured_axes = get_shadow_bases(num_settings, qubit_index)[None, :] == arange(len(shadow_bases))[:, None]
+    return len(shadow_bases) * (measured_axes @ expectations) / num_settings
@@ -10,6 +10,10 @@ class ArgumentMismatchError(IncorrectPropertyTestError):
         super().__init__(f"number of qubits provided in {test_name} doesn't"
                          f" match number of qubits in the provided circuit")
 
+    def __reduce__(self):
+        # message is built from the property test in __init__, so it is restored directly when unpickling
+        return Exception.__new__, (type(self), ), {"args": self.args}
+
 
 class IncorrectAssertionError(IncorrectPropertyTestError):
     def __init__(self, property_test) -> None:
@@ -17,6 +21,10 @@ class IncorrectAssertionError(IncorrectPropertyTestError):
         super().__init__(f"assertions provided in {test_name} are not a Sequence of assertions or an assertion"
                          f"implementing qiskit_check.property_test.assertion.AbstractAssertion")
 
+    def __reduce__(self):
+        # message is built from the property test in __init__, so it is restored directly when unpickling
+        return Exception.__new__, (type(self), ), {"args": self.args}
+
 
 class NoQubitFoundError(IncorrectPropertyTestError):
     pass
@@ -0,0 +1,81 @@
+from typing import Sequence, Union
+
+from numpy import absolute, add, asarray, broadcast_to, concatenate, cumsum, errstate, full, isnan, log, nan, ndarray, \
+    sqrt, where, zeros
+from scipy.special import chdtrc, stdtr
+
+
+class OneSampleTTests:
+    """
+    two sided one sample t-tests (one per row of samples) whose p-values are combined by fisher method into p-value of
+    an assertion, t-tests of many assertions can be computed together with get_combined_p_values
+    """
+    def __init__(self, samples: Union[Sequence[Sequence[float]], ndarray], expected_means: Union[Sequence[float], float]) -> None:
+        """
+        initialize
+        Args:
+            samples: samples of each t-test (rows may differ in length), nan samples are omitted
+            expected_means: expected mean of each t-test (or a single mean for all of them)
+        """
+        self.samples = [asarray(row, dtype=float) for row in samples]
+        self.expected_means = broadcast_to(asarray(expected_means, dtype=float), (len(self.samples), ))
+
+
+def get_combined_p_values(tests: Sequence[OneSampleTTests]) -> ndarray:
+    """
+    compute t-tests of many assertions at once, samples of all t-tests are stacked into a single array (padded with
+    nan) so p-values of all t-tests and their fisher combinations are computed by a few vectorized calls
+    Args:
+        tests: t-tests of each assertion
+
+    Returns: array of combined p-values (in order of tests)
+
+    """
+    if len(tests) == 0:
+        return zeros(0)
+    rows = [row for test in tests for row in test.samples]
+    samples = full((len(rows), max((len(row) for row in rows), default=0)), nan)
+    for index, row in enumerate(rows):
+        samples[index, :len(row)] = row
+    expected_means = concatenate([test.expected_means for test in tests])
+    return combine_p_values(get_t_test_p_values(samples, expected_means), [len(test.samples) for test in tests])
+
+
+def get_t_test_p_values(samples: ndarray, expected_means: ndarray) -> ndarray:
+    """
+    compute two sided one sample t-test along the last axis, p-values of t-tests that can't be computed (fewer than 2
+    samples or samples all equal to the expected mean) are 1
+    Args:
+        samples: array of samples, nan samples are omitted
+        expected_means: expected means (broadcast against samples without the last axis)
+
+    Returns: array of p-values
+
+    """
+    # samples are centered on the expected mean so samples all equal to it give exactly zero mean and variance
+    differences = where(isnan(samples), 0, samples - asarray(expected_means)[..., None])
+    with errstate(divide="ignore", invalid="ignore"):
+        num_samples = (~isnan(samples)).sum(axis=-1)
+        mean_differences = differences.sum(axis=-1) / num_samples
+        deviations = where(isnan(samples), 0, differences - mean_differences[..., None])
+        variances = (deviations ** 2).sum(axis=-1) / (num_samples - 1)
+        statistics = mean_differences / sqrt(variances / num_samples)
+        p_values = 2 * stdtr(num_samples - 1, -absolute(statistics))
+    return where(isnan(p_values), 1, p_values)
+
+
+def combine_p_values(p_values: ndarray, sizes: Sequence[int]) -> ndarray:
+    """
+    combine consecutive groups of p-values with fisher method
+    Args:
+        p_values: p-values of all groups
+        sizes: number of p-values in each group (at least 1)
+
+    Returns: array of combined p-values (one per group)
+
+    """
+    sizes = asarray(sizes)
+    starts = concatenate([[0], cumsum(sizes)[:-1]])
+    with errstate(divide="ignore"):
+        statistics = -2 * add.reduceat(log(p_values), starts)
+    return chdtrc(2 * sizes, statistics)
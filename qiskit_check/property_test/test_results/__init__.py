@@ -1 +1,2 @@
 from .test_result import TestResult
+from .array_test_result import ArrayTestResult
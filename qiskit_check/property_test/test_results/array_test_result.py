@@ -0,0 +1,255 @@
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from numpy import add, arange, array, concatenate, int64, ndarray, nonzero, repeat, zeros
+
+from qiskit_check.property_test.resources.test_resource import Qubit
+from qiskit_check.property_test.test_results.test_result import TestResult
+
+
+class SparseOutcomeCounts:
+    """
+    counts of outcomes of shape (instructions, experiments, outcomes) storing only outcomes that occurred, each
+    experiment of an instruction holds at most as many outcomes as it has shots so memory doesn't grow exponentially
+    with number of qubits like the dense array does
+    """
+    def __init__(
+            self, num_outcomes: int, outcomes: Sequence[List[ndarray]],
+            counts: Union[Sequence[List[ndarray]], None] = None) -> None:
+        """
+        initialize
+        Args:
+            num_outcomes: number of possible outcomes (2 ** number of qubits)
+            outcomes: list (one element per instruction) of lists (one element per experiment) of arrays of distinct
+            outcomes that occurred
+            counts: counts of the outcomes (in the same layout as outcomes), none for no experiments
+        """
+        self.num_outcomes = num_outcomes
+        self.outcomes = [list(instruction_outcomes) for instruction_outcomes in outcomes]
+        self.counts = [list(instruction_counts) for instruction_counts in counts] if counts is not None else \
+            [[] for _ in self.outcomes]
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return len(self.outcomes), (len(self.outcomes[0]) if len(self.outcomes) > 0 else 0), self.num_outcomes
+
+    def append(self, instruction_index: int, outcomes: ndarray, counts: ndarray) -> None:
+        """
+        add counts of the next experiment of an instruction
+        Args:
+            instruction_index: index of the instruction
+            outcomes: distinct outcomes that occurred
+            counts: counts of the outcomes
+
+        Returns: None
+
+        """
+        self.outcomes[instruction_index].append(outcomes)
+        self.counts[instruction_index].append(counts)
+
+    def head(self, num_experiments: int) -> "SparseOutcomeCounts":
+        """
+        get counts of the first experiments
+        Args:
+            num_experiments: number of experiments to keep
+
+        Returns: counts sharing arrays of the experiments with these counts
+
+        """
+        return SparseOutcomeCounts(
+            self.num_outcomes, [instruction_outcomes[:num_experiments] for instruction_outcomes in self.outcomes],
+            [instruction_counts[:num_experiments] for instruction_counts in self.counts])
+
+    def get_marginal_counts(self, bit: int) -> ndarray:
+        """
+        get counts of states of a single qubit
+        Args:
+            bit: bit of the outcome holding state of the qubit
+
+        Returns: array of shape (instructions, experiments, 2) with counts of state 0 and 1 of the qubit
+
+        """
+        num_instructions, num_experiments, _ = self.shape
+        marginal_counts = zeros((num_instructions, num_experiments, 2), dtype=int64)
+        if num_experiments == 0:
+            return marginal_counts
+        for instruction_index, instruction_outcomes in enumerate(self.outcomes):
+            experiments = repeat(arange(num_experiments), [len(outcomes) for outcomes in instruction_outcomes])
+            states = (concatenate(instruction_outcomes) >> bit) & 1
+            add.at(
+                marginal_counts[instruction_index], (experiments, states), concatenate(self.counts[instruction_index]))
+        return marginal_counts
+
+
+class ArrayTestResult(TestResult):
+    """
+    test result backed by counts of shape (instructions, experiments, outcomes), outcome is an integer whose k-th bit
+    is the measured state of k-th qubit of the assertion, per qubit marginal counts are derived from them and formats
+    of TestResult (outputs of combine function and counts dicts) are built lazily when accessed
+    """
+    def __init__(
+            self, outcome_counts: Union[ndarray, SparseOutcomeCounts], qubits: Sequence[Qubit],
+            qubit_indices: Sequence[int], num_qubits: int,
+            combiner: Callable[[List[List[Dict[str, int]]]], List[List[float]]],
+            vectorized_combiner: Union[Callable[[ndarray], ndarray], None] = None) -> None:
+        """
+        initialize
+        Args:
+            outcome_counts: counts of outcomes of shape (instructions, experiments, 2 ** number of qubits), dense
+            array or sparse counts when there are more outcomes than shots
+            qubits: measured qubits of the assertion (in order of bits of the outcome)
+            qubit_indices: indices of the qubits in the circuit
+            num_qubits: number of qubits of the circuit (length of keys of counts dicts)
+            combiner: function combining counts of a qubit into values tested by the assertion
+            vectorized_combiner: function combining array of counts of a qubit of shape (instructions, experiments, 2)
+            into array of values tested by the assertion, used instead of combiner if given
+        """
+        super().__init__(None, None)
+        self.outcome_counts = outcome_counts
+        self.qubits = tuple(qubits)
+        self.qubit_indices = tuple(qubit_indices)
+        self.num_qubits = num_qubits
+        self.combiner = combiner
+        self.vectorized_combiner = vectorized_combiner
+        self._marginal_counts = {}
+        self._states = {}
+
+    @property
+    def num_instructions(self) -> int:
+        return self.outcome_counts.shape[0]
+
+    @property
+    def num_experiments(self) -> int:
+        return self.outcome_counts.shape[1]
+
+    def get_marginal_counts(self, qubit: Qubit) -> ndarray:
+        """
+        get counts of states of a single qubit
+        Args:
+            qubit: qubit of the assertion
+
+        Returns: array of shape (instructions, experiments, 2) with counts of state 0 and 1 of the qubit
+
+        """
+        if qubit not in self._marginal_counts and isinstance(self.outcome_counts, SparseOutcomeCounts):
+            self._marginal_counts[qubit] = self.outcome_counts.get_marginal_counts(self.qubits.index(qubit))
+        elif qubit not in self._marginal_counts:
+            position = self.qubits.index(qubit)
+            # with outcomes laid out as (2,) * number of qubits bit k is axis number of qubits - 1 - k
+            outcome_axes = len(self.qubits) * (2,)
+            counts = self.outcome_counts.reshape(self.outcome_counts.shape[:2] + outcome_axes)
+            other_axes = tuple(
+                2 + len(self.qubits) - 1 - other_position for other_position in range(len(self.qubits))
+                if other_position != position)
+            self._marginal_counts[qubit] = counts.sum(axis=other_axes) if len(other_axes) > 0 else counts
+        return self._marginal_counts[qubit]
+
+    @property
+    def individual_measurements(self) -> Dict[Qubit, Union[List[List[float]], ndarray]]:
+        """
+        outputs of combine function of each qubit, vectorized combine function is given marginal counts of the qubit,
+        otherwise combine function is given counts dicts of the qubit (one list per instruction, one dict per
+        experiment) as it was before results were stored in arrays
+        Returns: dictionary with keys as qubit and outputs of combine function for that qubit as values
+
+        """
+        if self._individual_measurements is None:
+            if self.vectorized_combiner is not None:
+                self._individual_measurements = {
+                    qubit: self.vectorized_combiner(self.get_marginal_counts(qubit)) for qubit in self.qubits}
+            else:
+                self._individual_measurements = {
+                    qubit: self.combiner(self.get_qubit_counts(qubit)) for qubit in self.qubits}
+        return self._individual_measurements
+
+    @individual_measurements.setter
+    def individual_measurements(self, individual_measurements: Dict[Qubit, List[List[float]]]) -> None:
+        # none builds the outputs from outcome counts when they are accessed next
+        self._individual_measurements = individual_measurements
+
+    @property
+    def counts(self) -> List[List[Dict[str, int]]]:
+        """
+        counts dicts of each instruction and experiment, accessing key[i] gives state of qubit with index i in the
+        circuit, qubits that aren't measured by the assertion are marked with '-'
+        Returns: list (one element per instruction) of lists (one element per experiment) of counts dicts
+
+        """
+        if self._counts is None and isinstance(self.outcome_counts, SparseOutcomeCounts):
+            self._counts = [
+                [self._to_dict(outcomes, counts) for outcomes, counts in zip(instruction_outcomes, instruction_counts)]
+                for instruction_outcomes, instruction_counts in zip(
+                    self.outcome_counts.outcomes, self.outcome_counts.counts)]
+        elif self._counts is None:
+            self._counts = [
+                [self._to_dict(*self._get_occurred_outcomes(experiment_counts))
+                 for experiment_counts in instruction_counts]
+                for instruction_counts in self.outcome_counts]
+        return self._counts
+
+    @counts.setter
+    def counts(self, counts: List[List[Dict[str, int]]]) -> None:
+        # none builds the counts dicts from outcome counts when they are accessed next
+        self._counts = counts
+
+    def get_qubit_counts(self, qubit: Qubit) -> List[List[Dict[str, int]]]:
+        """
+        get counts of a single qubit in the format used by combine functions
+        Args:
+            qubit: qubit of the assertion
+
+        Returns: list (one element per instruction) of lists (one element per experiment) of dicts with counts of
+        '0' and '1' states
+
+        """
+        return [
+            [{"0": int(zeros), "1": int(ones)} for zeros, ones in instruction_counts]
+            for instruction_counts in self.get_marginal_counts(qubit)]
+
+    def _get_state(self, outcome: int) -> str:
+        if outcome not in self._states:
+            state = ["-"] * self.num_qubits
+            for bit, qubit_index in enumerate(self.qubit_indices):
+                state[qubit_index] = str((outcome >> bit) & 1)
+            self._states[outcome] = "".join(state)
+        return self._states[outcome]
+
+    @staticmethod
+    def _get_occurred_outcomes(experiment_counts: ndarray) -> Tuple[ndarray, ndarray]:
+        outcomes = nonzero(experiment_counts)[0]
+        return outcomes, experiment_counts[outcomes]
+
+    def _to_dict(self, outcomes: ndarray, counts: ndarray) -> Dict[str, int]:
+        # only outcomes that occurred are turned into states, there are at most as many of them as shots
+        return {self._get_state(int(outcome)): int(count) for outcome, count in zip(outcomes, counts)}
+
+
+def get_outcome(state: str, qubit_indices: Sequence[int]) -> int:
+    """
+    get integer outcome of measured qubits
+    Args:
+        state: key of counts dict, accessing state[i] gives state of qubit with index i in the circuit
+        qubit_indices: indices of the measured qubits (in order of bits of the outcome)
+
+    Returns: integer whose k-th bit is the state of qubit with index qubit_indices[k]
+
+    """
+    outcome = 0
+    for bit, qubit_index in enumerate(qubit_indices):
+        outcome |= int(state[qubit_index]) << bit
+    return outcome
+
+
+def get_count_array(experiments: List[List[Dict[str, int]]]) -> ndarray:
+    """
+    get array of counts of a qubit from counts dicts given to combine functions
+    Args:
+        experiments: list (one element per instruction) of lists (one element per experiment) of dicts with counts of
+        '0' and '1' states
+
+    Returns: array of shape (instructions, experiments, 2) with counts of state 0 and 1
+
+    """
+    count_array = array([
+        [[experiment.get("0", 0), experiment.get("1", 0)] for experiment in instruction_experiments]
+        for instruction_experiments in experiments], dtype=int64)
+    return count_array.reshape(len(experiments), -1, 2)
@@ -1,17 +1,168 @@
-from typing import Dict, List, Tuple, Set, Sequence
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Set, Sequence, Union
 
+from numpy import array, int64, ndarray, zeros
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction
 from qiskit.result import Result
-from qiskit_utils import parse_result, parse_counts
+from qiskit_utils import parse_counts
 
-from qiskit_check.test_engine.measurement_location import MeasurementLocation
+from qiskit_check.test_engine.measurement_location import MeasurementLocation, get_measurement_basis
 from qiskit_check.test_engine.p_value_correction import AbstractCorrection
 from qiskit_check.property_test.assertions.abstract_assertion import AbstractAssertion
 from qiskit_check.property_test.property_test import PropertyTest
 from qiskit_check.property_test.property_test_errors import IncorrectAssertionError
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
-from qiskit_check.property_test.test_results import TestResult
+from qiskit_check.property_test.statistics import get_combined_p_values
+from qiskit_check.property_test.test_results import ArrayTestResult
+from qiskit_check.property_test.test_results.array_test_result import SparseOutcomeCounts, get_outcome
+
+
+class ParsedResults:
+    """
+    measurement counts needed by assertions of a test case parsed from results of experiments as they arrive, qiskit
+    results and circuits are not retained, counts of each assertion have shape (instructions, experiments, outcomes)
+    and are indexed by integer outcome of qubits of the assertion, they are stored in a dense array if there are no
+    more outcomes than shots of an experiment (e.g. single qubit assertions) and sparsely otherwise so memory doesn't
+    grow exponentially with number of qubits of an assertion
+    """
+    def __init__(self, assessor: "Assessor") -> None:
+        """
+        initialize
+        Args:
+            assessor: assessor of the test case whose assertions use the counts
+        """
+        self.assessor = assessor
+        self.num_experiments = 0
+        self.qubits = [assertion.get_qubits() for assertion in assessor.assertions]
+        self.qubit_indices = [
+            tuple(assessor.resource_matcher[qubit].qubit_index for qubit in qubits) for qubits in self.qubits]
+        self.measurement_names = [
+            frozenset(assessor.get_measurement_names(assertion, assessor.assertions))
+            for assertion in assessor.assertions]
+        self.encodings = [
+            [assessor.encode_measurement(qubits, assertion.location, instruction, assessor.resource_matcher)
+             for instruction in assertion.measurements]
+            for assertion, qubits in zip(assessor.assertions, self.qubits)]
+        # number of qubits of circuits in which assertions are measured (updated once experiments are added)
+        self.num_qubits = [max(qubit_indices, default=-1) + 1 for qubit_indices in self.qubit_indices]
+        # per assertion dense array of shape (instructions, allocated experiments, outcomes) or sparse counts, chosen
+        # once number of shots is known from the first experiment
+        self._outcome_counts: List[Union[ndarray, SparseOutcomeCounts, None]] = [None] * len(assessor.assertions)
+
+    def __len__(self) -> int:
+        return self.num_experiments
+
+    def get_outcome_counts(self, assertion_index: int) -> Union[ndarray, SparseOutcomeCounts]:
+        """
+        get counts of an assertion
+        Args:
+            assertion_index: index of the assertion in assertions of the assessor
+
+        Returns: dense array or sparse counts of shape (instructions, experiments, outcomes), outcome is an integer
+        whose k-th bit is the state of k-th qubit of the assertion
+
+        """
+        outcome_counts = self._outcome_counts[assertion_index]
+        if outcome_counts is None:
+            return SparseOutcomeCounts(
+                2 ** len(self.qubits[assertion_index]), [[] for _ in self.encodings[assertion_index]])
+        if isinstance(outcome_counts, SparseOutcomeCounts):
+            return outcome_counts.head(self.num_experiments)
+        return outcome_counts[:, :self.num_experiments]
+
+    def add(self, experiment_results: Dict[str, Tuple[Result, QuantumCircuit]]) -> None:
+        """
+        parse results of an experiment, each result is parsed once no matter how many encodings it holds and counts
+        of each encoding are computed once no matter how many assertions and qubits use them
+        Args:
+            experiment_results: mapping between measurement encoding and the result and circuit in which that
+            measurement was done
+
+        Returns: None
+
+        """
+        # results are kept alive by experiment_results so their ids are unique while parsing
+        parsed_counts: Dict[Tuple[int, FrozenSet[str]], Dict[str, int]] = {}
+        encoding_counts: Dict[Tuple[str, FrozenSet[str]], Tuple[ndarray, ndarray]] = {}
+        for assertion_index, encodings in enumerate(self.encodings):
+            measurement_names = self.measurement_names[assertion_index]
+            for instruction_index, encoding in enumerate(encodings):
+                result, circuit = experiment_results[encoding]
+                self.num_qubits[assertion_index] = circuit.num_qubits
+                if (encoding, measurement_names) not in encoding_counts:
+                    if (id(result), measurement_names) not in parsed_counts:
+                        parsed_counts[id(result), measurement_names] = parse_counts(
+                            result, circuit, measurement_names=measurement_names)
+                    encoding_counts[encoding, measurement_names] = self._get_encoding_counts(
+                        parsed_counts[id(result), measurement_names], self.qubit_indices[assertion_index])
+                outcomes, counts = encoding_counts[encoding, measurement_names]
+                outcome_counts = self._reserve(assertion_index, int(counts.sum()))
+                if isinstance(outcome_counts, SparseOutcomeCounts):
+                    outcome_counts.append(instruction_index, outcomes, counts)
+                else:
+                    outcome_counts[instruction_index, self.num_experiments, outcomes] = counts
+        self.num_experiments += 1
+
+    def extend(self, experiments_results: Iterable[Dict[str, Tuple[Result, QuantumCircuit]]]) -> None:
+        """
+        parse results of experiments one at a time
+        Args:
+            experiments_results: iterable (one element per experiment) of mappings between measurement encoding and
+            the result and circuit in which that measurement was done
+
+        Returns: None
+
+        """
+        for experiment_results in experiments_results:
+            self.add(experiment_results)
+
+    @staticmethod
+    def _get_encoding_counts(counts: Dict[str, int], qubit_indices: Tuple[int]) -> Tuple[ndarray, ndarray]:
+        """
+        get counts of outcomes of qubits measured in an encoding, assertions with the same encoding measure the same
+        qubits so the counts are shared by them
+        Args:
+            counts: parsed counts, accessing key[i] gives state of qubit with index i in the circuit
+            qubit_indices: indices of measured qubits (in order of bits of the outcome)
+
+        Returns: array of distinct outcomes that occurred and array of their counts
+
+        """
+        encoding_counts: Dict[int, int] = {}
+        for state, count in counts.items():
+            outcome = get_outcome(state, qubit_indices)
+            encoding_counts[outcome] = encoding_counts.get(outcome, 0) + count
+        return array(list(encoding_counts.keys()), dtype=int64), array(list(encoding_counts.values()), dtype=int64)
+
+    def _reserve(self, assertion_index: int, num_shots: int) -> Union[ndarray, SparseOutcomeCounts]:
+        """
+        make sure counts of an assertion have room for another experiment, storage is chosen on the first experiment
+        (dense if the qubits have no more outcomes than shots, sparse otherwise), allocated size of a dense array is
+        doubled when full
+        Args:
+            assertion_index: index of the assertion in assertions of the assessor
+            num_shots: number of shots of the experiment
+
+        Returns: counts of the assertion
+
+        """
+        outcome_counts = self._outcome_counts[assertion_index]
+        if outcome_counts is None:
+            num_instructions = len(self.encodings[assertion_index])
+            num_outcomes = 2 ** len(self.qubits[assertion_index])
+            if num_outcomes <= num_shots:
+                outcome_counts = zeros((num_instructions, 0, num_outcomes), dtype=int64)
+            else:
+                outcome_counts = SparseOutcomeCounts(num_outcomes, [[] for _ in range(num_instructions)])
+            self._outcome_counts[assertion_index] = outcome_counts
+        if isinstance(outcome_counts, SparseOutcomeCounts):
+            return outcome_counts
+        num_instructions, allocated, num_outcomes = outcome_counts.shape
+        if allocated <= self.num_experiments:
+            grown_counts = zeros((num_instructions, max(1, 2 * allocated), num_outcomes), dtype=int64)
+            grown_counts[:, :allocated] = outcome_counts
+            self._outcome_counts[assertion_index] = outcome_counts = grown_counts
+        return outcome_counts
 
 
 class Assessor:
@@ -34,11 +185,11 @@ class Assessor:
         self.confidence_level = confidence_level
         self.measurement_locations = measurement_locations
 
-    def assess(self, results: List[Dict[str, Tuple[Result, QuantumCircuit]]], corrector: AbstractCorrection, num_measurements: int, num_experiments: int) -> None:
+    def assess(self, results: Union[List[Dict[str, Tuple[Result, QuantumCircuit]]], ParsedResults], corrector: AbstractCorrection, num_measurements: int, num_experiments: int) -> None:
         """
         evaluate assertions given test results
         Args:
-            results: test results from test runner
+            results: test results from test runner (or counts already parsed from them)
             corrector: p-value correction object
             num_measurements: number of measurements per experiment
             num_experiments: number of experiments done
@@ -46,52 +197,150 @@ class Assessor:
         Returns: None, AssertError thrown if assertion fails
 
         """
-        for assertion in self.assertions:
-            assertion_input = TestResult(self._get_result(results, assertion), self._get_counts(results, assertion))
-            p_value = assertion.get_p_value(assertion_input, self.resource_matcher, num_measurements, num_experiments)
+        for assertion, p_value in zip(self.assertions, self.get_p_values(results, num_measurements, num_experiments)):
             confidence_level = corrector.get_corrected_confidence_level()
             assertion.verify(confidence_level, p_value)
 
-    def _get_counts(self, experiment_results: List[Dict[str, Tuple[Result, QuantumCircuit]]], assertion: AbstractAssertion) -> List[List[Dict[str, int]]]:
-        measurement_names = self.get_measurement_names(assertion)
+    def assess_sequentially(
+            self, results: Union[List[Dict[str, Tuple[Result, QuantumCircuit]]], ParsedResults], corrector: AbstractCorrection,
+            num_measurements: int, spent_fraction: float, fraction: float, futility_p_value: float = 0.5,
+            alpha_spending_exponent: float = 3, futility_fraction: float = 0.5) -> bool:
+        """
+        evaluate assertions at one of several interim looks at test results of a group sequential test, significance
+        level 1 - corrected confidence level is spent over the looks with alpha spending function
+        alpha * fraction ** alpha_spending_exponent (conservative early looks for exponents above 1), so that the
+        overall probability of rejecting a true assertion doesn't exceed the significance level
+        Args:
+            results: test results of all experiments done so far (or counts already parsed from them)
+            corrector: p-value correction object
+            num_measurements: number of measurements per experiment
+            spent_fraction: fraction of experiments done at the previous look (0 at the first look)
+            fraction: fraction of experiments done so far (1 at the final look)
+            futility_p_value: assertions with p-value at least this high are considered to hold, test case is stopped
+            early once all assertions are considered to hold (higher values stop less often but lose less power)
+            alpha_spending_exponent: exponent of the alpha spending function
+            futility_fraction: fraction of experiments before which test case isn't stopped for all assertions holding
+            (p-values of few experiments often look like a true assertion when the deviation is small, stopping on
+            them loses most of the power), earlier looks only reject assertions
 
-        # TODO: this can be optimized
-        qubits = assertion.get_qubits()
-        results_per_instruction = []
-        for instruction in assertion.measurements:
-            encoding = self.encode_measurement(qubits, assertion.location, instruction)
-            results = []
-            for experiment_result in experiment_results:
-                results.append(parse_counts(*experiment_result[encoding], measurement_names=measurement_names))
-            results_per_instruction.append(results)
-        return results_per_instruction
+        Returns: true if no more experiments need to be done, AssertError thrown if assertion fails
 
-    
-    def _get_result(self, experiment_results: List[Dict[str, Tuple[Result, QuantumCircuit]]], assertion: AbstractAssertion) -> Dict[Qubit, List[List[float]]]:
-        measurement_names = self.get_measurement_names(assertion)
-        # TODO: this can be optimized
-        parsed_result = {}
-        qubits = assertion.get_qubits()
-        for qubit in qubits:
-            results_per_instruction = []
-            for instruction in assertion.measurements:
-                encoding = self.encode_measurement(qubits, assertion.location, instruction)
-                results = []
-                for experiment_result in experiment_results:
-                    results.append(parse_result(*experiment_result[encoding], measurement_names=measurement_names)[self.resource_matcher[qubit].qubit_index])
-                results_per_instruction.append(results)
-            parsed_result[qubit] = assertion.combiner(results_per_instruction)
-        return parsed_result
+        """
+        significance_level = 1 - corrector.get_corrected_confidence_level()
+        look_significance_level = significance_level * (
+            fraction ** alpha_spending_exponent - spent_fraction ** alpha_spending_exponent)
+        p_values = self.get_p_values(results, num_measurements, len(results))
+        for assertion, p_value in zip(self.assertions, p_values):
+            assertion.verify(1 - look_significance_level, p_value)
+        return fraction >= 1 or (
+            fraction >= futility_fraction and all(p_value >= futility_p_value for p_value in p_values))
+
+    def get_p_values(
+            self, results: Union[List[Dict[str, Tuple[Result, QuantumCircuit]]], ParsedResults],
+            num_measurements: int, num_experiments: int) -> List[float]:
+        """
+        compute p-value of each assertion given test results, t-tests of all assertions that provide them are
+        computed together, remaining assertions compute their p-values themselves
+        Args:
+            results: test results from test runner (or counts already parsed from them)
+            num_measurements: number of measurements per experiment
+            num_experiments: number of experiments done
+
+        Returns: list of p-values (in order of assertions)
+
+        """
+        if not isinstance(results, ParsedResults):
+            results = self.parse_results(results)
+        assertion_inputs = [
+            self.get_test_result(results, assertion_index) for assertion_index in range(len(self.assertions))]
+        t_tests = [
+            assertion.get_one_sample_t_tests(assertion_input, self.resource_matcher, num_measurements, num_experiments)
+            for assertion, assertion_input in zip(self.assertions, assertion_inputs)]
+        batched_p_values = iter(get_combined_p_values([
+            assertion_t_tests for assertion_t_tests in t_tests if assertion_t_tests is not None]))
+
+        p_values = []
+        for assertion, assertion_input, assertion_t_tests in zip(self.assertions, assertion_inputs, t_tests):
+            if assertion_t_tests is not None:
+                p_values.append(float(next(batched_p_values)))
+            else:
+                p_values.append(
+                    assertion.get_p_value(assertion_input, self.resource_matcher, num_measurements, num_experiments))
+        return p_values
+
+    def parse_results(self, experiments_results: Iterable[Dict[str, Tuple[Result, QuantumCircuit]]]) -> ParsedResults:
+        """
+        parse counts needed by the assertions from results of experiments, experiments are parsed one at a time so
+        results of experiments produced lazily don't need to be held together
+        Args:
+            experiments_results: iterable (one element per experiment) of mappings between measurement encoding and
+            the result and circuit in which that measurement was done
+
+        Returns: parsed counts
+
+        """
+        parsed_results = ParsedResults(self)
+        parsed_results.extend(experiments_results)
+        return parsed_results
+
+    def get_test_result(self, parsed_results: ParsedResults, assertion_index: int) -> ArrayTestResult:
+        """
+        get input of an assertion
+        Args:
+            parsed_results: counts parsed from test results
+            assertion_index: index of the assertion
+
+        Returns: array backed test result with counts of qubits of the assertion
+
+        """
+        assertion = self.assertions[assertion_index]
+        return ArrayTestResult(
+            parsed_results.get_outcome_counts(assertion_index), parsed_results.qubits[assertion_index],
+            parsed_results.qubit_indices[assertion_index], parsed_results.num_qubits[assertion_index],
+            assertion.combiner, assertion.vectorized_combiner)
 
     @staticmethod
-    def encode_measurement(qubits: Tuple[Qubit], location: int, instruction: Instruction) -> str:
-        return f"{hash(qubits)}-{location}-{instruction.name}"
-    
+    def encode_measurement(
+            qubits: Tuple[Qubit], location: int, instruction: Instruction,
+            resource_matcher: Union[Dict[Qubit, ConcreteQubit], None] = None) -> str:
+        """
+        encode measurement of qubits, measurement is encoded by its basis rather than the instruction so assertions
+        measuring the same qubits in the same basis at the same location share the counts
+        Args:
+            qubits: measured qubits
+            location: location of the measurement in the circuit
+            instruction: measurement instruction
+            resource_matcher: mapping of qubits to their concrete implementations, if given qubits are encoded by
+            their index in the circuit so that the encoding is the same for all test cases of a property test (as
+            done by the assessor), otherwise by the qubit objects
+
+        Returns: encoding of the measurement
+
+        """
+        qubit_key = tuple(resource_matcher[qubit].qubit_index for qubit in qubits) \
+            if resource_matcher is not None else hash(qubits)
+        return f"{qubit_key}-{location}-{get_measurement_basis(instruction)}"
+
     @staticmethod
-    def get_measurement_names(assertion: AbstractAssertion) -> Set[str]:
-        measurement_names = set()
-        for measurement in assertion.measurements:
-            measurement_names.add(measurement.name)
+    def get_measurement_names(
+            assertion: AbstractAssertion, assertions: Sequence[AbstractAssertion] = ()) -> Set[str]:
+        """
+        get names of instructions that may measure qubits of an assertion, measurements are shared by bases so these
+        are names of measurements of the assertion and of all measurements of other assertions in the same bases
+        Args:
+            assertion: assertion whose measurements are parsed
+            assertions: all assertions of the test case (the assessor passes its assertions), none for names of
+            measurements of the assertion only
+
+        Returns: set of names of measurement instructions
+
+        """
+        bases = {get_measurement_basis(measurement) for measurement in assertion.measurements}
+        measurement_names = {measurement.name for measurement in assertion.measurements}
+        for other_assertion in assertions:
+            for measurement in other_assertion.measurements:
+                if measurement.name not in measurement_names and get_measurement_basis(measurement) in bases:
+                    measurement_names.add(measurement.name)
         return measurement_names
 
 
@@ -1,5 +1,5 @@
-from copy import deepcopy
-from typing import Dict, List, Set, Tuple, Union
+from math import ceil
+from typing import Dict, Iterator, List, Sequence, Set, Tuple, Union
 from uuid import uuid4
 
 from qiskit import ClassicalRegister, QuantumCircuit
@@ -8,39 +8,309 @@ from qiskit_utils import insert_instruction
 
 
 from qiskit_check.test_engine.concrete_property_test.test_case import TestCase
+from qiskit_check.property_test.classical_shadows import ShadowMeasurement
 from qiskit_check.property_test.resources.test_resource import ConcreteQubit, Qubit
 
 
+def get_num_shots(num_measurements: int, shot_divisor: int) -> int:
+    """
+    get number of shots of a measurement circuit
+    Args:
+        num_measurements: number of measurements per experiment of the test case
+        shot_divisor: number of circuits sharing the measurements (1 unless they are settings of a classical shadow)
+
+    Returns: number of shots, at least 1
+
+    """
+    return max(1, ceil(num_measurements / shot_divisor))
+
+
+class MeasurementPlan:
+    """
+    immutable set of measurement circuits created for a test case together with encodings of measurements done in
+    each of the circuits, created once per test case and reused by all of its experiments
+    """
+    def __init__(
+            self, circuits: Sequence[QuantumCircuit], encodings: Sequence[Sequence[str]],
+            num_measurements: Union[int, None] = None, shot_divisors: Union[Sequence[int], None] = None) -> None:
+        """
+        initialize
+        Args:
+            circuits: measurement circuits to run
+            encodings: encodings of measurements done in each of the circuits (respectively to circuits)
+            num_measurements: number of measurements requested by assertions (number of circuits without packing),
+            none if it's the number of encodings
+            shot_divisors: number of circuits sharing measurements of each of the circuits (respectively to
+            circuits), none if every circuit is run with all measurements of the test case
+        """
+        self._circuits = tuple(circuits)
+        self._encodings = tuple(tuple(circuit_encodings) for circuit_encodings in encodings)
+        self._num_measurements = num_measurements if num_measurements is not None else sum(
+            len(circuit_encodings) for circuit_encodings in self._encodings)
+        self._shot_divisors = tuple(shot_divisors) if shot_divisors is not None else (1,) * len(self._circuits)
+
+    @property
+    def circuits(self) -> Tuple[QuantumCircuit, ...]:
+        return self._circuits
+
+    @property
+    def encodings(self) -> Tuple[Tuple[str, ...], ...]:
+        return self._encodings
+
+    @property
+    def num_measurements(self) -> int:
+        return self._num_measurements
+
+    def get_num_shots(self, num_measurements: int) -> List[int]:
+        """
+        get number of shots of each circuit, settings of a classical shadow split measurements of the test case among
+        themselves so that the whole shadow costs as many shots as a single measurement
+        Args:
+            num_measurements: number of measurements per experiment of the test case
+
+        Returns: list of number of shots (respectively to circuits)
+
+        """
+        return [get_num_shots(num_measurements, shot_divisor) for shot_divisor in self._shot_divisors]
+
+    def __iter__(self) -> Iterator[Tuple[QuantumCircuit, Tuple[str, ...]]]:
+        return zip(self._circuits, self._encodings)
+
+    def __len__(self) -> int:
+        return len(self._circuits)
+
+
+class MeasurementRequest:
+    """
+    measurement of qubits in a basis at a location in the circuit requested by assertions of a test case, the
+    measurement also serves measurements of some of its qubits in the same basis at the same location (their encodings
+    are added to encodings of the request)
+    """
+    def __init__(
+            self, qubits: Tuple[Qubit], location: Union[int, None], instruction: Instruction, encoding: str,
+            basis: str) -> None:
+        """
+        initialize
+        Args:
+            qubits: measured qubits
+            location: location of the measurement in the circuit, none for the end of the circuit
+            instruction: measurement instruction
+            encoding: encoding of the measurement
+            basis: canonical name of the basis measured by the instruction
+        """
+        self.qubits = qubits
+        self.location = location
+        self.instruction = instruction
+        self.encoding = encoding
+        self.basis = basis
+        self.encodings = [encoding]
+
+    @property
+    def shot_divisor(self) -> int:
+        # settings of a classical shadow share measurements of the test case
+        return self.instruction.num_settings if isinstance(self.instruction, ShadowMeasurement) else 1
+
+    def covers(self, other: "MeasurementRequest") -> bool:
+        """
+        check if counts of other measurement can be taken from this measurement
+        Args:
+            other: other measurement
+
+        Returns: true if the other measurement measures some of the qubits in the same basis at the same location
+
+        """
+        return self.location == other.location and self.basis == other.basis and set(other.qubits) <= set(self.qubits)
+
+    def conflicts_with(self, other: "MeasurementRequest") -> bool:
+        """
+        check if measurements can't be done in the same circuit
+        Args:
+            other: other measurement
+
+        Returns: true if the measurements share a qubit or are run with different number of shots
+
+        """
+        return not set(self.qubits).isdisjoint(other.qubits) or self.shot_divisor != other.shot_divisor
+
+    def disturbs(
+            self, other: "MeasurementRequest", circuit: QuantumCircuit,
+            resource_matcher: Dict[Qubit, ConcreteQubit]) -> bool:
+        """
+        check if the measurement changes state measured by other measurement done later in the same circuit, measured
+        qubits are collapsed (and rotated to the measured basis) so measurements can't share a circuit if instructions
+        between them act on qubits measured first
+        Args:
+            other: other measurement
+            circuit: circuit (with initialization of qubits) in which the measurements are done
+            resource_matcher: mapping between qubits and their indices in the circuit
+
+        Returns: true if the measurement is done earlier and disturbs the other measurement
+
+        """
+        if self.location is None or self.location == other.location:
+            return False
+        if other.location is not None and other.location < self.location:
+            return False
+        # we need to account for initialization of qubits (1 per qubit)
+        start = len(circuit.qubits) + self.location
+        end = len(circuit.data) if other.location is None else len(circuit.qubits) + other.location
+        measured_qubits = {circuit.qubits[resource_matcher[qubit].qubit_index] for qubit in self.qubits}
+        return any(not measured_qubits.isdisjoint(qargs) for _, qargs, _ in circuit.data[start:end])
+
+
 class CircuitCreator:
-    def get_circuits(self, test_case: TestCase) -> Tuple[Dict[str, List[str]], Dict[str, QuantumCircuit]]:
-        measurement_locations = deepcopy(test_case.assessor.measurement_locations)
-        circuits = {}
-        circuit_names = {}
-        updated = True
-        while updated:
-            updated = False
-            added_qubits = set()
-            circuit = test_case.circuit.copy()
-            for qubits in measurement_locations.keys():
-                if not self._can_be_inserted(qubits, added_qubits):
-                    continue
-                if len(measurement_locations[qubits]) == 0:
-                    continue
-
-                measurement_location = measurement_locations[qubits].pop()
-                encoding = test_case.assessor.encode_measurement(qubits, measurement_location.location, measurement_location.instruction)
-                 # we need to account for initialization of qubits (1 per qubit)
-                amended_location = len(circuit.qubits) + measurement_location.location if measurement_location.location is not None else None
-                circuit = self._insert_measurements(qubits, circuit, measurement_location.instruction, amended_location, test_case.assessor.resource_matcher)
-                updated = True
-                added_qubits.update(qubits)
-
-                if circuit.name in circuits:
-                    circuits[circuit.name].append(encoding)
-                else:
-                    circuits[circuit.name] = [encoding]
-                    circuit_names[circuit.name] = circuit
-        return circuits, circuit_names
+    """
+    class creating measurement circuits of test cases, measurements requested by assertions are packed into as few
+    circuits as possible by colouring their conflict graph (measurements sharing a qubit or disturbing a later one
+    conflict), measurements are identified by their basis so identical measurements requested by different assertions
+    (or by different instructions measuring the same basis) are done once
+    """
+    def get_circuits(self, test_case: TestCase) -> Tuple[QuantumCircuit, ...]:
+        """
+        create measurement circuits for a test case
+        Args:
+            test_case: test case for which to create measurement circuits
+
+        Returns: measurement circuits of the measurement plan of the test case
+
+        """
+        return self.get_measurement_plan(test_case).circuits
+
+    def get_measurement_plan(self, test_case: TestCase, parameterized: bool = False) -> MeasurementPlan:
+        """
+        create measurement circuits for a test case
+        Args:
+            test_case: test case for which to create measurement circuits
+            parameterized: if true measurement circuits are created from test case template (shared by all test cases
+            of the property test) instead of the test case circuit
+
+        Returns: measurement plan holding circuits and encodings of measurements done in them
+
+        """
+        requests = self.get_measurement_requests(test_case)
+        num_measurements = sum(len(locations) for locations in test_case.assessor.measurement_locations.values())
+        circuits = []
+        encodings = []
+        shot_divisors = []
+        base_circuit = test_case.template if parameterized else test_case.circuit
+        for circuit_requests in self.pack(requests, base_circuit, test_case.assessor.resource_matcher):
+            circuit = base_circuit.copy()
+            # later locations are inserted first so that insertions don't shift locations of the remaining ones
+            for request in sorted(circuit_requests, key=self._get_insertion_order):
+                # we need to account for initialization of qubits (1 per qubit)
+                amended_location = len(circuit.qubits) + request.location if request.location is not None else None
+                circuit = self._insert_measurements(
+                    request.qubits, circuit, request.instruction, amended_location, test_case.assessor.resource_matcher)
+            circuits.append(circuit)
+            encodings.append([encoding for request in circuit_requests for encoding in request.encodings])
+            # measurements run with different number of shots conflict so they all share the same divisor
+            shot_divisors.append(circuit_requests[0].shot_divisor)
+
+        return MeasurementPlan(circuits, encodings, num_measurements, shot_divisors)
+
+    @staticmethod
+    def get_measurement_requests(test_case: TestCase) -> List[MeasurementRequest]:
+        """
+        get measurements requested by assertions of a test case, identical measurements (same qubits, location and
+        basis) requested by multiple assertions are merged and measurements covered by a measurement of more qubits
+        (e.g. z measurement of a qubit by one assertion and of that qubit and another one by other assertion) are done
+        as part of it
+        Args:
+            test_case: test case whose measurements to get
+
+        Returns: list of distinct measurements
+
+        """
+        requests = {}
+        for qubits, locations in test_case.assessor.measurement_locations.items():
+            for measurement_location in locations:
+                encoding = test_case.assessor.encode_measurement(
+                    qubits, measurement_location.location, measurement_location.instruction,
+                    test_case.assessor.resource_matcher)
+                if encoding not in requests:
+                    requests[encoding] = MeasurementRequest(
+                        qubits, measurement_location.location, measurement_location.instruction, encoding,
+                        measurement_location.basis)
+
+        covering_requests = []
+        for request in sorted(requests.values(), key=lambda request: -len(set(request.qubits))):
+            covering_request = next(
+                (covering_request for covering_request in covering_requests if covering_request.covers(request)),
+                None)
+            if covering_request is None:
+                covering_requests.append(request)
+            else:
+                covering_request.encodings.append(request.encoding)
+        # keep order in which measurements were requested
+        return [request for request in requests.values() if request in covering_requests]
+
+    @staticmethod
+    def pack(
+            requests: Sequence[MeasurementRequest], circuit: Union[QuantumCircuit, None] = None,
+            resource_matcher: Union[Dict[Qubit, ConcreteQubit], None] = None) -> List[List[MeasurementRequest]]:
+        """
+        pack measurements into circuits by colouring their conflict graph (measurements conflict if they share a qubit
+        or one disturbs the other) with DSatur heuristic (vertex with the most distinct colours among its neighbours
+        is coloured first with a colour free among them), measurements of the same colour are done in the same
+        circuit, number of circuits is at least the largest number of measurements sharing a qubit and DSatur reaches
+        it for the usual shapes of the graph, measurements of different qubits always commute so a measurement goes to
+        a circuit measuring other qubits along the same axis if there is one free (e.g. tomography of any number of
+        qubits takes one circuit per axis x, y and z)
+        Args:
+            requests: distinct measurements
+            circuit: circuit in which the measurements are done, none if measurements don't disturb each other
+            resource_matcher: mapping between qubits and their indices in the circuit (required with circuit)
+
+        Returns: list (one element per circuit) of measurements done in the circuit
+
+        """
+        neighbours = [set() for _ in requests]
+        for index, request in enumerate(requests):
+            for other_index, other in enumerate(requests[:index]):
+                if request.conflicts_with(other) or circuit is not None and (
+                        request.disturbs(other, circuit, resource_matcher) or
+                        other.disturbs(request, circuit, resource_matcher)):
+                    neighbours[index].add(other_index)
+                    neighbours[other_index].add(index)
+        colours = [None] * len(requests)
+        colour_axes: List[Set[str]] = []
+        for _ in range(len(requests)):
+            index = max(
+                (index for index, colour in enumerate(colours) if colour is None),
+                key=lambda index: CircuitCreator._get_colouring_priority(index, neighbours, colours))
+            neighbour_colours = {colours[neighbour] for neighbour in neighbours[index]}
+            free_colours = [colour for colour in range(len(colour_axes)) if colour not in neighbour_colours]
+            axis = CircuitCreator._get_axis(requests[index].basis)
+            colour = next(
+                (colour for colour in free_colours if axis in colour_axes[colour]),
+                free_colours[0] if len(free_colours) > 0 else len(colour_axes))
+            if colour == len(colour_axes):
+                colour_axes.append(set())
+            colour_axes[colour].add(axis)
+            colours[index] = colour
+
+        circuits = [[] for _ in range(max(colours, default=-1) + 1)]
+        for request, colour in zip(requests, colours):
+            circuits[colour].append(request)
+        return circuits
+
+    @staticmethod
+    def _get_colouring_priority(
+            index: int, neighbours: List[Set[int]], colours: List[Union[int, None]]) -> Tuple[int, int, int]:
+        # saturation (distinct colours among neighbours), then uncoloured neighbours, then order of the requests
+        neighbour_colours = {colours[neighbour] for neighbour in neighbours[index]} - {None}
+        uncoloured_neighbours = sum(1 for neighbour in neighbours[index] if colours[neighbour] is None)
+        return len(neighbour_colours), uncoloured_neighbours, -index
+
+    @staticmethod
+    def _get_axis(basis: str) -> str:
+        # measurements of opposite states of the same basis (e.g. y and -y) are aligned as well
+        return basis[1:] if basis.startswith("-") else basis
+
+    @staticmethod
+    def _get_insertion_order(request: MeasurementRequest) -> Tuple[bool, int]:
+        # measurements at the end of the circuit first, then by decreasing location
+        return request.location is not None, -request.location if request.location is not None else 0
 
     def _insert_measurements(
             self, qubits: Tuple[Qubit], circuit: QuantumCircuit, instruction: Instruction,
@@ -50,13 +320,10 @@ class CircuitCreator:
             cl_reg = ClassicalRegister(1)
             circuit.add_register(cl_reg)
             location = len(circuit.data) if location is None else location
-            circuit = insert_instruction(circuit, instruction, [resource_matcher[qubit].qubit_index], cl_reg, location)
+            qubit_index = resource_matcher[qubit].qubit_index
+            # basis of a classical shadow setting depends on the measured qubit
+            qubit_instruction = instruction.get_qubit_measurement(qubit_index) \
+                if isinstance(instruction, ShadowMeasurement) else instruction
+            circuit = insert_instruction(circuit, qubit_instruction, [qubit_index], cl_reg, location)
         circuit.name = str(uuid4())
         return circuit
-
-    def _can_be_inserted(self, qubits_to_add: Tuple[Qubit], added_qubits: Set[Qubit]) -> bool:
-        for qubit in qubits_to_add:
-            if qubit in added_qubits:
-                return False
-        
-        return True
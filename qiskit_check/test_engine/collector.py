@@ -64,14 +64,14 @@ class Collector:
         """
         if os.path.isfile(path):
             module_name = Path(path).name
-            Collector._import_file(path, Collector._get_global_name(module_name))
+            Collector.import_file(path, Collector._get_global_name(module_name))
         elif os.path.isdir(path):
             for dirname, _, files in os.walk(path):
                 for filename in files:
                     module_name, extension = os.path.splitext(filename)
                     if extension == '.py':
                         module_path = os.path.join(dirname, filename)
-                        Collector._import_file(module_path, Collector._get_global_name(module_name))
+                        Collector.import_file(module_path, Collector._get_global_name(module_name))
         else:
             raise ValueError(f"{path} is not a valid path to directory or file")
 
@@ -88,7 +88,7 @@ class Collector:
         return module_name + uuid4().__str__()
 
     @staticmethod
-    def _import_file(module_path: str, global_name: str) -> None:
+    def import_file(module_path: str, global_name: str) -> None:
         """
         import file at a module_path and set its global name name to global_name
 
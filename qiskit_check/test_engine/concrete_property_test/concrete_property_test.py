@@ -1,4 +1,9 @@
-from typing import Type
+import sys
+from hashlib import sha256
+from pathlib import Path
+from typing import Type, Union
+
+from numpy.random import SeedSequence
 
 from qiskit_check.test_engine.assessor import AssessorFactory
 from qiskit_check.test_engine.generator.abstract_input_generator import QubitInputGeneratorFactory
@@ -21,6 +26,9 @@ class ConcretePropertyTestIterator:
         self.max_num_test_cases = max_num_test_cases
         self.num_test_cases_run = 0
 
+    def __iter__(self) -> "ConcretePropertyTestIterator":
+        return self
+
     def __next__(self) -> TestCase:
         """
         return next generated test case for this property test
@@ -59,7 +67,34 @@ class ConcretePropertyTest:
         get iterator that will generate the test cases for this property test
         Returns: iterator
 
+        """
+        return self.get_test_cases()
+
+    def get_test_cases(self, seed: Union[int, None] = None) -> ConcretePropertyTestIterator:
+        """
+        get iterator that will generate the test cases for this property test
+        Args:
+            seed: seed of the generation of initial states, input generator is seeded with a seed derived from this
+            seed and key of the property test so that test cases do not depend on other property tests being run,
+            none for random initial states
+
+        Returns: iterator
+
         """
         qubit_input_generator = self.qubit_input_generator_factory.build()
+        if seed is not None:
+            qubit_input_generator.seed(SeedSequence(seed, spawn_key=(self.get_key(), )))
         unit_test_generator = TestCaseGenerator(self.property_test_class, self.assessor_factory, qubit_input_generator)
         return ConcretePropertyTestIterator(unit_test_generator, self.property_test_class.num_test_cases())
+
+    def get_key(self) -> int:
+        """
+        get key identifying the property test by name of its class and of the file it is defined in, unlike position
+        of the property test among collected tests the key does not change when other tests are added or reordered
+        Returns: non negative integer key
+
+        """
+        module = sys.modules.get(self.property_test_class.__module__)
+        file_name = Path(getattr(module, "__file__", None) or self.property_test_class.__module__).name
+        digest = sha256(f"{file_name}:{self.property_test_class.__qualname__}".encode())
+        return int.from_bytes(digest.digest()[:8], "big")
@@ -1,13 +1,15 @@
 from inspect import signature
-from typing import Type, Dict
+from typing import Type, Dict, List, Tuple, Union
 
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
 
 from qiskit_check.test_engine.assessor import Assessor, AssessorFactory
 from qiskit_check.test_engine.generator.abstract_input_generator import QubitInputGenerator
 from qiskit_check.property_test.property_test import PropertyTest
 from qiskit_check.property_test.property_test_errors import IncorrectPropertyTestError, ArgumentMismatchError
 from qiskit_check.property_test.resources.test_resource import Qubit, ConcreteQubit
+from qiskit_check.property_test.utils import vector_state_to_hopf_coordinates
 
 
 class TestCase:
@@ -16,7 +18,8 @@ class TestCase:
     """
     def __init__(
             self, circuit: QuantumCircuit, assessor: Assessor,
-            num_measurements: int, num_experiments: int) -> None:
+            num_measurements: int, num_experiments: int, template: Union[QuantumCircuit, None] = None,
+            parameter_binds: Union[Dict[Parameter, float], None] = None) -> None:
         """
         initialize
         Args:
@@ -24,11 +27,16 @@ class TestCase:
             assessor: assessor object to verify assertions for this test case
             num_measurements: number of measurements to do for each experiment
             num_experiments: number of experiments to run
+            template: circuit shared by all test cases of the property test with initialization of qubits
+            parametrized by rotations, binding parameter_binds to it gives circuit equivalent to circuit
+            parameter_binds: values of template parameters for this test case
         """
         self.circuit = circuit
         self.assessor = assessor
         self.num_measurements = num_measurements
         self.num_experiments = num_experiments
+        self.template = template
+        self.parameter_binds = parameter_binds
 
 class TestCaseGenerator:
     """
@@ -47,6 +55,8 @@ class TestCaseGenerator:
         self.property_test_class = property_test_class
         self.assessor_factory = assessor_factory
         self.qubit_input_generator = qubit_input_generator
+        self.template = None
+        self.template_parameters = []
 
     def generate(self) -> TestCase:
         """
@@ -63,10 +73,60 @@ class TestCaseGenerator:
 
         assessor = self.assessor_factory.build(concrete_property_test, resource_matcher)
 
-        test_circuit = self._initialize_circuit(concrete_property_test.circuit, resource_matcher)
+        circuit = concrete_property_test.circuit
+        test_circuit = self._initialize_circuit(circuit, resource_matcher)
+        template = self._get_template(circuit)
+        parameter_binds = self._get_parameter_binds(resource_matcher)
 
         return TestCase(test_circuit, assessor, concrete_property_test.num_measurements(),
-                        concrete_property_test.num_experiments())
+                        concrete_property_test.num_experiments(), template, parameter_binds)
+
+    def _get_template(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        """
+        get circuit with initialization of qubits parametrized by single qubit rotation per qubit, the template is
+        created once (from the first generated test case) and shared by all test cases
+        Args:
+            circuit: circuit to prepend initialization to
+
+        Returns: circuit with parametrized initializations prepended
+
+        """
+        if self.template is None:
+            self.template_parameters = self._get_template_parameters(circuit.num_qubits)
+            template = QuantumCircuit(circuit.num_qubits)
+            for qubit_index, (theta, phi) in enumerate(self.template_parameters):
+                template.u(theta, phi, 0, qubit_index)
+            self.template = template + circuit
+        return self.template
+
+    @staticmethod
+    def _get_template_parameters(num_qubits: int) -> List[Tuple[Parameter, Parameter]]:
+        """
+        get hopf coordinate parameters (theta and phi) for each qubit
+        Args:
+            num_qubits: number of qubits in the circuit
+
+        Returns: list of theta, phi parameter pairs (respectively to qubit index)
+
+        """
+        return [(Parameter(f"theta_{i}"), Parameter(f"phi_{i}")) for i in range(num_qubits)]
+
+    def _get_parameter_binds(self, resource_matcher: Dict[Qubit, ConcreteQubit]) -> Dict[Parameter, float]:
+        """
+        get values of template parameters that initialize qubits to states specified in resource matcher
+        Args:
+            resource_matcher: dictionary between user specified qubits and their concrete implementations (circuit
+            qubit index and initial value to which qubit is to be initialized)
+
+        Returns: dictionary with template parameters as keys and their values
+
+        """
+        parameter_binds = {}
+        for concrete_qubit in resource_matcher.values():
+            theta, phi = self.template_parameters[concrete_qubit.get_qubit()]
+            amplitudes = concrete_qubit.get_initial_value().data
+            parameter_binds[theta], parameter_binds[phi] = vector_state_to_hopf_coordinates(amplitudes[0], amplitudes[1])
+        return parameter_binds
 
     @staticmethod
     def _initialize_circuit(circuit: QuantumCircuit, resource_matcher: Dict[Qubit, ConcreteQubit]) -> QuantumCircuit:
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Union
 
 from qiskit_check.test_engine.generator import QubitInputGeneratorFactory
 from qiskit_check.test_engine.test_runner import AbstractTestRunner
@@ -9,9 +10,12 @@ class AbstractConfig(ABC):
     base class for getting configuration for the test engine
     """
     @abstractmethod
-    def get_test_runner(self) -> AbstractTestRunner:
+    def get_test_runner(self, num_workers: Union[int, None] = None) -> AbstractTestRunner:
         """
         get test runner
+        Args:
+            num_workers: number of processes in which the runner runs property tests, none for configured number
+
         Returns: instance of subclass of AbstractTestRunner
 
         """
@@ -1,3 +1,5 @@
+from typing import Union
+
 from yaml import safe_load
 
 from qiskit_check.test_engine.config.default_config import DefaultConfig
@@ -20,17 +22,26 @@ class Config(AbstractConfig):
         self.config = safe_load(open(config_path))
         self.default_config = DefaultConfig()
 
-    def get_test_runner(self) -> AbstractTestRunner:
+    def get_test_runner(self, num_workers: Union[int, None] = None) -> AbstractTestRunner:
         """
         get test runner as specified in the given config file
+        Args:
+            num_workers: number of processes in which the runner runs property tests, if given it is passed to the
+            runner constructor together with arguments from the config file (overriding num_workers set there), none
+            keeps arguments from the config file unchanged
+
         Returns: instance of subclass of AbstractTestRunner
 
         """
         test_runner_key = "test_runner"
         if self.config is None or test_runner_key not in self.config:
-            return self.default_config.get_test_runner()
+            return self.default_config.get_test_runner(num_workers)
 
-        return get_object_from_config(self.config[test_runner_key])
+        runner_config = self.config[test_runner_key]
+        if num_workers is None:
+            return get_object_from_config(runner_config)
+        return get_object_from_config(
+            {**runner_config, "args": {**runner_config.get("args", {}), "num_workers": num_workers}})
 
     def get_input_generator_factory(self) -> QubitInputGeneratorFactory:
         """
@@ -1,3 +1,5 @@
+from typing import Union
+
 from qiskit_check.test_engine.printers import TerminalPrinter
 from qiskit_check.test_engine.config.abstract_config import AbstractConfig
 from qiskit_check.test_engine.generator import QubitInputGeneratorFactory, NaiveInputGeneratorFactory
@@ -8,13 +10,16 @@ class DefaultConfig(AbstractConfig):
     """
     default configuration of test engine to be used in absence of specified coniguration
     """
-    def get_test_runner(self) -> AbstractTestRunner:
+    def get_test_runner(self, num_workers: Union[int, None] = None) -> AbstractTestRunner:
         """
         get default test runner
+        Args:
+            num_workers: number of processes in which the runner runs property tests, none runs them in this process
+
         Returns: instance of subclass of AbstractTestRunner
 
         """
-        return SimulatorTestRunner('aer_simulator', TerminalPrinter())
+        return SimulatorTestRunner('aer_simulator', TerminalPrinter(), num_workers=num_workers or 1)
 
     def get_input_generator_factory(self) -> QubitInputGeneratorFactory:
         """
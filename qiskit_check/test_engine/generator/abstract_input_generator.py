@@ -1,18 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Callable
+from typing import List, Sequence, Callable, Union
 
+from numpy.random import SeedSequence, default_rng
 from qiskit.quantum_info import Statevector
 
 from qiskit_check.property_test.resources.test_resource import Qubit
 
 
+def accept_any_state(state: Statevector) -> bool:
+    """
+    default state filter accepting every generated state (module level function so that generators can be pickled)
+    Args:
+        state: generated state
+
+    Returns: True
+
+    """
+    return True
+
+
 class QubitInputGenerator(ABC):
     """
     base class for qubit input generator which is responsible for generating initial states of qubits in circuit
     """
-    def __init__(self, state_filter: Callable[[Statevector], bool] = lambda x: True, tolerance: int = 100):
+    def __init__(self, state_filter: Callable[[Statevector], bool] = accept_any_state, tolerance: int = 100):
         self.state_filter = state_filter
         self.tolerance = tolerance
+        self.random_generator = default_rng()
+
+    def seed(self, seed: Union[int, SeedSequence, None]) -> None:
+        """
+        reseed random generator from which states are generated, generator seeded with the same seed generates the
+        same states
+        Args:
+            seed: seed of the random generator, none for random seed
+
+        Returns: None
+
+        """
+        self.random_generator = default_rng(seed)
 
     @abstractmethod
     def generate(self, qubits: Sequence[Qubit]) -> List[Statevector]:
@@ -32,7 +58,7 @@ class QubitInputGeneratorFactory:
     """
     class for creating QubitInputGenerator objects
     """
-    def __init__(self, state_filter: Callable[[Statevector], bool] = lambda x: True, tolerance: int = 100):
+    def __init__(self, state_filter: Callable[[Statevector], bool] = accept_any_state, tolerance: int = 100):
         self.state_filter = state_filter
         self.tolerance = tolerance
 
@@ -1,6 +1,5 @@
 from math import asin, sin, sqrt
 
-from numpy.random import uniform
 from qiskit.quantum_info import Statevector
 
 from qiskit_check.property_test.property_test_errors import InitialStateGenerationError
@@ -38,9 +37,9 @@ class HaarInputGenerator(IndependentInputGenerator):
             unif_lower_bound = sin(qubit.values.theta_start/2)**2
             unif_upper_band = sin(qubit.values.theta_end/2)**2
 
-            unif_generating_theta = uniform(unif_lower_bound, unif_upper_band)
+            unif_generating_theta = self.random_generator.uniform(unif_lower_bound, unif_upper_band)
             theta = 2*asin(sqrt(unif_generating_theta))
-            phi = uniform(qubit.values.phi_start, qubit.values.phi_end)
+            phi = self.random_generator.uniform(qubit.values.phi_start, qubit.values.phi_end)
             ground_state_amp, excited_state_amp = hopf_coordinates_to_vector_state(theta, phi)
             generated = Statevector([ground_state_amp, excited_state_amp])
             if self.state_filter(generated):
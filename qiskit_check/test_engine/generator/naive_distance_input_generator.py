@@ -1,13 +1,13 @@
-from typing import Sequence, Tuple, List, Callable
+from typing import Sequence, Tuple, List, Callable, Union
 
 from numpy import ndarray, asarray, cos, sin, dot, arccos, linspace
 from numpy import float as npfloat
 from math import fmod, pi
-from numpy.random import choice
+from numpy.random import Generator, SeedSequence, default_rng
 from qiskit.quantum_info import Statevector
 
 from qiskit_check.property_test.property_test_errors import InitialStateGenerationError
-from qiskit_check.test_engine.generator.abstract_input_generator import QubitInputGeneratorFactory
+from qiskit_check.test_engine.generator.abstract_input_generator import QubitInputGeneratorFactory, accept_any_state
 from qiskit_check.test_engine.generator.abstract_input_generator import QubitInputGenerator
 from qiskit_check.property_test.resources import Qubit, QubitRange
 from qiskit_check.property_test.utils import vector_state_to_hopf_coordinates
@@ -20,7 +20,7 @@ class NaiveDistanceInputGenerator(QubitInputGenerator):
     """
     def __init__(
             self,single_qubit_generator_factory: QubitInputGeneratorFactory, quantization_rate: int,
-            state_filter: Callable[[Statevector], bool] = lambda x: True, tolerance: int = 100) -> None:
+            state_filter: Callable[[Statevector], bool] = accept_any_state, tolerance: int = 100) -> None:
         """
         initialize
         Args:
@@ -39,6 +39,18 @@ class NaiveDistanceInputGenerator(QubitInputGenerator):
         self.state_filter = state_filter
         self.tolerance = tolerance
 
+    def seed(self, seed: Union[int, SeedSequence, None]) -> None:
+        """
+        reseed random generator from which states are generated together with generator for one qubit
+        Args:
+            seed: seed of the random generator, none for random seed
+
+        Returns: None
+
+        """
+        super().seed(seed)
+        self.uniform_generator.seed(self.random_generator.integers(2**63))
+
     def generate(self, qubits: Sequence[Qubit]) -> List[Statevector]:
         """
         generate initial state for qubits
@@ -87,7 +99,8 @@ class NaiveDistanceInputGenerator(QubitInputGenerator):
             hopf_coordinates_qubit = vector_state_to_hopf_coordinates(*generated_qubit.data)
             specific_generator = NaiveDistanceSingleInputGenerator(template_qubit, hopf_coordinates_qubit,
                                                                    self.quantization_rate, self.uniform_generator,
-                                                                   self.state_filter, self.tolerance)
+                                                                   self.state_filter, self.tolerance,
+                                                                   self.random_generator)
             self.specific_generators.append(specific_generator)
 
 
@@ -98,7 +111,8 @@ class NaiveDistanceSingleInputGenerator:
     def __init__(
             self, qubit: Qubit, initial_generation: Tuple[float, float],
             quantization_rate: float, uniform_generator:  QubitInputGenerator,
-            state_filter: Callable[[Statevector], bool] = lambda x: True, tolerance: int = 100) -> None:
+            state_filter: Callable[[Statevector], bool] = accept_any_state, tolerance: int = 100,
+            random_generator: Union[Generator, None] = None) -> None:
         """
         initialize
         Args:
@@ -110,6 +124,7 @@ class NaiveDistanceSingleInputGenerator:
             state_filter: function to filter out statevectors that are not allowed as initial states
             tolerance: num tries of generating statevector that satisfies state_filter, if exceeded and state_filter
             does not return true for any of generated statevectors error is thrown
+            random_generator: random generator from which buckets are chosen, none for unseeded generator
         """
         self.qubit = qubit
         self.quantization_rate = quantization_rate
@@ -118,6 +133,7 @@ class NaiveDistanceSingleInputGenerator:
         self.buckets, self.weights, self.weights_sum = self._get_buckets(qubit)
         self.state_filter = state_filter
         self.tolerance = tolerance
+        self.random_generator = random_generator if random_generator is not None else default_rng()
 
     def generate(self) -> Statevector:
         """
@@ -127,7 +143,7 @@ class NaiveDistanceSingleInputGenerator:
         """
         for _ in range(self.tolerance):
             bucket_probabilities = self._get_normalized_weights()
-            chosen_bucket_index = choice(len(self.buckets), p=bucket_probabilities)
+            chosen_bucket_index = self.random_generator.choice(len(self.buckets), p=bucket_probabilities)
             chosen_bucket = self.buckets[chosen_bucket_index]
 
             bucket_theta_size = self.qubit.values.theta_end - self.qubit.values.theta_start
@@ -254,7 +270,7 @@ class NaiveDistanceInputGeneratorFactory(QubitInputGeneratorFactory):
     """
     def __init__(
             self, single_qubit_generator_factory: QubitInputGeneratorFactory, quantization_rate: int = 1000,
-            state_filter: Callable[[Statevector], bool] = lambda x: True, tolerance: int = 100) -> None:
+            state_filter: Callable[[Statevector], bool] = accept_any_state, tolerance: int = 100) -> None:
         """
         initialize
         Args:
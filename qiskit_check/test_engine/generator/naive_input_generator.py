@@ -1,4 +1,3 @@
-from numpy.random import uniform
 from qiskit.quantum_info import Statevector
 
 from qiskit_check.property_test.property_test_errors import InitialStateGenerationError
@@ -25,8 +24,8 @@ class NaiveInputGenerator(IndependentInputGenerator):
 
         """
         for _ in range(self.tolerance):
-            theta = uniform(qubit.values.theta_start, qubit.values.theta_end)
-            phi = uniform(qubit.values.phi_start, qubit.values.phi_end)
+            theta = self.random_generator.uniform(qubit.values.theta_start, qubit.values.theta_end)
+            phi = self.random_generator.uniform(qubit.values.phi_start, qubit.values.phi_end)
             ground_state_amp, excited_state_amp = hopf_coordinates_to_vector_state(theta, phi)
             possible_state_vector = Statevector([ground_state_amp, excited_state_amp])
             if self.state_filter(possible_state_vector):
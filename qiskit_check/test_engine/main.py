@@ -1,4 +1,5 @@
 from argparse import ArgumentParser, Namespace
+from typing import Union
 
 from qiskit_check.test_engine.collector import Collector
 
@@ -15,6 +16,9 @@ def get_argument_parser() -> ArgumentParser:
     arg_parser.add_argument("-t", "--tests", type=str, required=True,
                             help="location of tests to run - directory or file")
     arg_parser.add_argument("-c", "--config", type=str, required=False, help="path to configuration .yaml file")
+    arg_parser.add_argument("-j", "--workers", type=int, required=False, default=None,
+                            help="number of worker processes to run property tests in, overrides num_workers of "
+                                 "the configured test runner")
     return arg_parser
 
 
@@ -24,20 +28,20 @@ def get_configuration(args: Namespace) -> AbstractConfig:
     else:
         return Config(args.config)
 
-def get_processor(configuration: AbstractConfig, print_output=False):
+def get_processor(configuration: AbstractConfig, print_output=False, num_workers: Union[int, None] = None):
     assessor_factory = AssessorFactory()
 
     qubit_input_generator_factory = configuration.get_input_generator_factory()
-    runner = configuration.get_test_runner()
+    runner = configuration.get_test_runner(num_workers)
 
     if not print_output:
         runner.printer = NoPrinter()
 
     return Processor(assessor_factory, qubit_input_generator_factory, runner)
 
-def get_cli_processor(configuration: AbstractConfig) -> CommandLineProcessor:
+def get_cli_processor(configuration: AbstractConfig, num_workers: Union[int, None] = None) -> CommandLineProcessor:
     test_collector = Collector()
-    processor = get_processor(configuration, print_output=True)
+    processor = get_processor(configuration, print_output=True, num_workers=num_workers)
 
     return CommandLineProcessor(test_collector, processor)
 
@@ -46,5 +50,5 @@ def main() -> None:
     arg_parser = get_argument_parser()
     args = arg_parser.parse_args()
     configuration = get_configuration(args)
-    test_processor = get_cli_processor(configuration)
+    test_processor = get_cli_processor(configuration, args.workers)
     test_processor.process(args.tests)
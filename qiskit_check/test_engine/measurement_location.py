@@ -1,5 +1,7 @@
-from typing import Set
-from qiskit.circuit import Instruction
+from typing import Set, Union
+from numpy import array, eye, ndarray, round as round_array
+from qiskit.circuit import Gate, Instruction
+from qiskit.circuit.exceptions import CircuitError
 
 from qiskit_check.property_test.resources.test_resource import Qubit
 
@@ -8,3 +10,66 @@ class MeasurementLocation:
     def __init__(self, location: int, instruction: Instruction) -> None:
         self.location = location
         self.instruction = instruction
+
+    @property
+    def basis(self) -> str:
+        return get_measurement_basis(self.instruction)
+
+
+_axis_names = {(1, 0, 0): "x", (0, 1, 0): "y", (0, 0, 1): "z", (-1, 0, 0): "-x", (0, -1, 0): "-y", (0, 0, -1): "-z"}
+
+
+def get_measurement_basis(instruction: Instruction) -> str:
+    """
+    get canonical name of the basis in which an instruction measures a qubit, single qubit measurement is described by
+    bloch vector of the state measured as 0 so instructions measuring the same basis (e.g. built separately by different
+    assertions) get the same name no matter how they are named, while instructions with the same name measuring
+    different bases (or the same basis with swapped outcomes) get different names
+    Args:
+        instruction: measurement instruction, measure or custom instruction whose definition is a sequence of gates
+        followed by a measurement of its only qubit, instructions whose basis isn't given by their definition (e.g.
+        classical shadow settings) name it by their basis attribute
+
+    Returns: axis of the basis (e.g. z, -y) or bloch vector of the state measured as 0, name of the instruction if
+    the basis can't be determined
+
+    """
+    if isinstance(getattr(instruction, "basis", None), str):
+        return instruction.basis
+    rotation = get_measurement_rotation(instruction)
+    if rotation is None:
+        return instruction.name
+    # state measured as 0 is the one rotated to |0> by the gates
+    zero, one = rotation.conj().T @ array([1, 0])
+    bloch_vector = round_array([
+        2 * (zero.conjugate() * one).real, 2 * (zero.conjugate() * one).imag, abs(zero) ** 2 - abs(one) ** 2], 6) + 0.
+    return _axis_names.get(tuple(bloch_vector), str(tuple(bloch_vector.tolist())))
+
+
+def get_measurement_rotation(instruction: Instruction) -> Union[ndarray, None]:
+    """
+    get unitary an instruction applies to a qubit before measuring it in z basis
+    Args:
+        instruction: measurement instruction, measure or custom instruction whose definition is a sequence of gates
+        followed by a measurement of its only qubit
+
+    Returns: 2x2 unitary matrix, none if the instruction isn't such a measurement
+
+    """
+    if instruction.name == "measure":
+        return eye(2)
+    definition = instruction.definition
+    if definition is None or instruction.num_qubits != 1 or instruction.num_clbits != 1 or len(definition.data) == 0:
+        return None
+    *gates, (measurement, _, _) = definition.data
+    if measurement.name != "measure" or measurement.condition is not None or not all(
+            isinstance(gate, Gate) and gate.condition is None for gate, _, _ in gates):
+        return None
+
+    rotation = eye(2)
+    try:
+        for gate, _, _ in gates:
+            rotation = gate.to_matrix() @ rotation
+    except CircuitError:
+        return None
+    return rotation
@@ -0,0 +1,99 @@
+from pickle import dumps
+from typing import Any, List, Set, Tuple, Type
+
+from qiskit_check.test_engine.concrete_property_test.concrete_property_test import ConcretePropertyTest
+from qiskit_check.test_engine.concrete_property_test.test_case import TestCase
+from qiskit_check.test_engine.printers.abstract_printer import AbstractPrinter
+from qiskit_check.property_test import PropertyTest
+
+
+class RecordingPrinter(AbstractPrinter):
+    """
+    class recording printer events instead of printing them so that they can be replayed later on another printer
+    (used to print events of tests run in worker processes in order in the parent process)
+    """
+    def __init__(self) -> None:
+        """
+        initialize
+        """
+        super().__init__()
+        self.events: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def replay(self, printer: AbstractPrinter) -> None:
+        """
+        call recorded events on a printer in order in which they were recorded
+        Args:
+            printer: printer on which to replay the events
+
+        Returns: None
+
+        """
+        for method_name, args in self.events:
+            getattr(printer, method_name)(*args)
+
+    def print_introduction(self, collected_tests: Set[Type[PropertyTest]]) -> None:
+        self.events.append(("print_introduction", (collected_tests, )))
+
+    def print_property_test_header(self, property_test: ConcretePropertyTest) -> None:
+        self.events.append(("print_property_test_header", (property_test, )))
+
+    def print_test_case_header(self, test_case: TestCase) -> None:
+        self.events.append(("print_test_case_header", (self._get_picklable_test_case(test_case), )))
+
+    def print_test_case_shots(self, test_case: TestCase, num_shots: int) -> None:
+        self.events.append(("print_test_case_shots", (self._get_picklable_test_case(test_case), num_shots)))
+
+    def print_test_case_success(self, test_case: TestCase) -> None:
+        self.events.append(("print_test_case_success", (self._get_picklable_test_case(test_case), )))
+
+    def print_test_case_failure(self, test_case: TestCase, error: Exception) -> None:
+        self.events.append(
+            ("print_test_case_failure", (self._get_picklable_test_case(test_case), self._get_picklable_error(error))))
+
+    def print_property_test_success(self, property_test: ConcretePropertyTest) -> None:
+        self.events.append(("print_property_test_success", (property_test, )))
+
+    def print_property_test_failure(self, property_test: ConcretePropertyTest, error: Exception) -> None:
+        self.events.append(("print_property_test_failure", (property_test, self._get_picklable_error(error))))
+
+    def print_summary(self, tests_failed: List[str], tests_succeeded: List[str]) -> None:
+        self.events.append(("print_summary", (tests_failed, tests_succeeded)))
+
+    @staticmethod
+    def _get_picklable_test_case(test_case: TestCase) -> TestCase:
+        """
+        get test case that can be sent back from a worker process, test cases whose assertions hold unpicklable
+        objects (e.g. user specified lambdas) are replaced by a test case without the assessor
+        Args:
+            test_case: recorded test case
+
+        Returns: test case itself if it can be pickled, its copy without assessor otherwise
+
+        """
+        if RecordingPrinter._is_picklable(test_case):
+            return test_case
+        return TestCase(
+            test_case.circuit, None, test_case.num_measurements, test_case.num_experiments, test_case.template,
+            test_case.parameter_binds)
+
+    @staticmethod
+    def _get_picklable_error(error: Exception) -> Exception:
+        """
+        get error that can be sent back from a worker process
+        Args:
+            error: recorded error
+
+        Returns: error itself if it can be pickled, RuntimeError with its message otherwise
+
+        """
+        if RecordingPrinter._is_picklable(error):
+            return error
+        return RuntimeError(f"{error.__class__.__name__}: {error}")
+
+    @staticmethod
+    def _is_picklable(obj: Any) -> bool:
+        try:
+            dumps(obj)
+            return True
+        except Exception:
+            return False
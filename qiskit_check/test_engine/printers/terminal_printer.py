@@ -55,6 +55,19 @@ class TerminalPrinter(AbstractPrinter):
         print("starting test with circuit:")
         print(test_case.circuit.draw(output="text"))
 
+    def print_test_case_shots(self, test_case: TestCase, num_shots: int) -> None:
+        """
+        print number of shots spent on test case, this is called before outcome of test case is printed when test
+        runner skips part of the experiments of test cases that are decided early
+        Args:
+            test_case: test case for which this method is called
+            num_shots: number of shots spent on the test case (over all experiments and measurement circuits)
+
+        Returns: None
+
+        """
+        print(f"test case spent {num_shots} shots")
+
     def print_test_case_success(self, test_case: TestCase) -> None:
         """
         print message on test case successfully passing
@@ -1,2 +1,4 @@
 from .abstract_test_runner import AbstractTestRunner
 from .test_runner import SimulatorTestRunner, IBMQDeviceRunner
+from .analytic_test_runner import AnalyticSimulatorTestRunner
+from .snapshot_test_runner import SnapshotSimulatorTestRunner
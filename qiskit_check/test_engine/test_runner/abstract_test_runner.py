@@ -1,5 +1,11 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import Sequence, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from multiprocessing import get_context
+from typing import Dict, Sequence, List, Tuple
+
+from qiskit_check.test_engine.collector import Collector
 from qiskit_check.test_engine.circuit_creator import CircuitCreator
 
 from qiskit_check.test_engine.concrete_property_test.concrete_property_test import ConcretePropertyTest
@@ -7,33 +13,42 @@ from qiskit_check.test_engine.p_value_correction import NoCorrectionFactory
 from qiskit_check.test_engine.p_value_correction.abstract_correction import AbstractCorrectionFactory
 
 from qiskit_check.test_engine.printers import AbstractPrinter
+from qiskit_check.test_engine.printers.recording_printer import RecordingPrinter
 
 
 class AbstractTestRunner(ABC):
     """
     class responsible for running tests
     """
-    def __init__(self, printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory(), circuit_creator: CircuitCreator = CircuitCreator()) -> None:
+    def __init__(
+            self, printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory(),
+            circuit_creator: CircuitCreator = CircuitCreator(), num_workers: int = 1) -> None:
         """
         initialize
         Args:
             printer: object of subtype AbstractPrinter to print test information
             corrector_factory: factory to build corrector objects to correct confidence level to maintain specified
             family wise confidence level
+            circuit_creator: object responsible for creating measurement circuits for test cases
+            num_workers: number of processes running property tests concurrently, 1 runs them in this process
         """
         self.printer = printer
         self.corrector_factory = corrector_factory
         self.circuit_creator= circuit_creator
+        self.num_workers = num_workers
 
     def run_tests(self, property_tests: Sequence[ConcretePropertyTest]) -> Tuple[List[str], List[str]]:
         """
-        run collected tests
+        run collected tests, if num_workers is greater than 1 tests are run in a process pool
         Args:
             property_tests: sequence of property tests to be run
 
         Returns: 2 values: list of the names that failed, list of the names that passed
 
         """
+        if self.num_workers > 1 and len(property_tests) > 1:
+            return self._run_tests_in_pool(property_tests)
+
         failed_tests = []
         succeeded_tests = []
         for property_test in property_tests:
@@ -47,6 +62,40 @@ class AbstractTestRunner(ABC):
                 failed_tests.append(property_test.property_test_class.__name__)
         return failed_tests, succeeded_tests
 
+    def _run_tests_in_pool(self, property_tests: Sequence[ConcretePropertyTest]) -> Tuple[List[str], List[str]]:
+        """
+        run tests in a pool of num_workers processes, each property test is run by a copy of this runner with a
+        recording printer, results and printer events are collected in the order of property_tests (workers are
+        spawned rather than forked since forking a process in which simulator threads already ran can deadlock)
+        Args:
+            property_tests: sequence of property tests to be run
+
+        Returns: 2 values: list of the names that failed, list of the names that passed
+
+        """
+        worker_runner = copy(self)
+        worker_runner.printer = None
+        worker_runner.num_workers = 1
+
+        failed_tests = []
+        succeeded_tests = []
+        with ProcessPoolExecutor(
+                max_workers=self.num_workers, mp_context=get_context("spawn"), initializer=_import_property_test_modules,
+                initargs=(_get_property_test_modules(property_tests), )) as executor:
+            futures = [executor.submit(_run_test_in_worker, worker_runner, property_test) for property_test in property_tests]
+            for property_test, future in zip(property_tests, futures):
+                try:
+                    failed, succeeded, recording_printer = future.result()
+                except Exception as error:
+                    self.printer.print_property_test_header(property_test)
+                    self.printer.print_property_test_failure(property_test, error)
+                    failed_tests.append(property_test.property_test_class.__name__)
+                    continue
+                recording_printer.replay(self.printer)
+                failed_tests.extend(failed)
+                succeeded_tests.extend(succeeded)
+        return failed_tests, succeeded_tests
+
     @abstractmethod
     def _run_test(self, property_test: ConcretePropertyTest) -> None:
         """
@@ -58,3 +107,52 @@ class AbstractTestRunner(ABC):
 
         """
         pass
+
+
+def _get_property_test_modules(property_tests: Sequence[ConcretePropertyTest]) -> Dict[str, str]:
+    """
+    get modules in which property test classes are defined, collector imports test files under unique module names so
+    worker processes have to import them under the same names to be able to unpickle the property test classes
+    Args:
+        property_tests: property tests to be run
+
+    Returns: dictionary with module names as keys and paths to module files as values
+
+    """
+    modules = {}
+    for property_test in property_tests:
+        module = sys.modules.get(property_test.property_test_class.__module__)
+        if getattr(module, "__file__", None) is not None:
+            modules[module.__name__] = module.__file__
+    return modules
+
+
+def _import_property_test_modules(modules: Dict[str, str]) -> None:
+    """
+    import property test modules in a worker process under the names they were imported with by the collector
+    Args:
+        modules: dictionary with module names as keys and paths to module files as values
+
+    Returns: None
+
+    """
+    for module_name, module_path in modules.items():
+        if module_name not in sys.modules:
+            Collector.import_file(module_path, module_name)
+
+
+def _run_test_in_worker(
+        test_runner: AbstractTestRunner, property_test: ConcretePropertyTest) -> Tuple[List[str], List[str], RecordingPrinter]:
+    """
+    run a single property test in a worker process
+    Args:
+        test_runner: runner to run the test with
+        property_test: property test to run
+
+    Returns: list of the names that failed, list of the names that passed and printer holding recorded printer events
+
+    """
+    recording_printer = RecordingPrinter()
+    test_runner.printer = recording_printer
+    failed_tests, succeeded_tests = test_runner.run_tests([property_test])
+    return failed_tests, succeeded_tests, recording_printer
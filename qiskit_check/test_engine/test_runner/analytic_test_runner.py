@@ -0,0 +1,269 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence, Set, Tuple, Union
+
+from numpy.random import Generator, SeedSequence, default_rng
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Barrier, Clbit, Gate, Instruction, Qubit
+from qiskit.providers.aer.library import SaveProbabilitiesDict
+from qiskit.result import Result
+
+from qiskit_check.test_engine.circuit_creator import MeasurementPlan
+from qiskit_check.test_engine.concrete_property_test.concrete_property_test import ConcretePropertyTest, TestCase
+from qiskit_check.test_engine.p_value_correction import NoCorrectionFactory, AbstractCorrectionFactory
+from qiskit_check.test_engine.printers import AbstractPrinter
+from qiskit_check.test_engine.test_runner.test_runner import SimulatorTestRunner
+from qiskit_check.test_engine.test_runner.utils import run_by_num_shots, sample_results, split_memory
+
+
+class AnalyticSimulatorTestRunner(SimulatorTestRunner):
+    """
+    class responsible for running tests on an ideal (noiseless) aer statevector simulator without simulating
+    individual shots, output distribution of each measurement circuit is computed exactly once per test case and
+    counts of all experiments are sampled from it
+    """
+    probabilities_label = "probabilities"
+
+    def __init__(
+            self, printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory(),
+            transpilation_cache_size: int = 256, seed: Union[int, None] = None, test_case_workers: int = 1,
+            sequential_looks: int = 1, futility_p_value: float = 0.5,
+            screening_fraction: Union[float, None] = None, run_options: Union[Dict[str, Any], None] = None,
+            pipeline_depth: int = 0, num_workers: int = 1, futility_fraction: float = 0.5) -> None:
+        """
+        initialize, arguments shared by all runners are described in TestRunner
+        Args:
+            seed: seed of the random generator used for sampling experiments and of generation of initial states,
+            none for random seed
+            run_options: aer options passed to every run of the simulator (e.g. max_parallel_threads, precision),
+            simulation method has to support saving probabilities
+        """
+        super().__init__(
+            "aer_simulator_statevector", printer, corrector_factory,
+            transpilation_cache_size=transpilation_cache_size, test_case_workers=test_case_workers,
+            sequential_looks=sequential_looks, futility_p_value=futility_p_value,
+            screening_fraction=screening_fraction, run_options=run_options, pipeline_depth=pipeline_depth,
+            num_workers=num_workers, futility_fraction=futility_fraction)
+        self.seed = seed
+        self.random_generator = default_rng(seed)
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        restore runner copied to a worker process, unseeded runners get a fresh random generator so that copies don't
+        sample the same experiments
+        Args:
+            state: pickled attributes of the runner
+
+        Returns: None
+
+        """
+        super().__setstate__(state)
+        if self.seed is None:
+            self.random_generator = default_rng()
+
+    def _get_seed(self) -> Union[int, None]:
+        """
+        get seed of the runner from which initial states of test cases are generated
+        Returns: seed, none if the runner is not seeded
+
+        """
+        return self.seed
+
+    def _seed_property_test(self, property_test: ConcretePropertyTest) -> None:
+        """
+        sample experiments of a property test from a random generator seeded with a child seed of seed for the
+        property test
+        Args:
+            property_test: property test about to be run
+
+        Returns: None
+
+        """
+        super()._seed_property_test(property_test)
+        if self.seed is not None:
+            self.random_generator = default_rng(self._seed_sequence)
+
+    @contextmanager
+    def _seed_test_case(self, seed: Union[SeedSequence, None]) -> Iterator[None]:
+        """
+        sample experiments of a test case run in this thread from a random generator seeded with seed of the test
+        case, so that sampled counts do not depend on test cases run concurrently by other threads
+        Args:
+            seed: seed of the test case, none for random seed
+
+        Returns: context in which the test case is run
+
+        """
+        with super()._seed_test_case(seed):
+            self._local.random_generator = default_rng(seed)
+            yield
+
+    def _get_random_generator(self) -> Generator:
+        """
+        get random generator from which experiments are sampled
+        Returns: random generator of the test case run in this thread, random generator of the runner if no test case
+        is run
+
+        """
+        return getattr(self._local, "random_generator", self.random_generator)
+
+    def get_experiment_results(
+            self, test_case: TestCase, num_experiments: Union[int, None] = None,
+            measurement_plan: Union[MeasurementPlan, None] = None) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        compute exact output distribution of each measurement circuit of a test case (in a single job) and sample
+        counts of experiments from it, circuits whose measurements can't be deferred (classically controlled
+        operations, resets, ...) are run once with shots for all experiments split using per shot memory
+        Args:
+            test_case: test case to run
+            num_experiments: number of experiments to run, none for all experiments of the test case
+            measurement_plan: measurement circuits of the test case, none to create them
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        num_experiments, measurement_plan = self._get_experiment_setup(test_case, num_experiments, measurement_plan)
+        test_results = [{} for _ in range(num_experiments)]
+
+        deferred_circuits = [self.get_deferred_measurement_circuit(circuit) for circuit in measurement_plan.circuits]
+        num_shots = measurement_plan.get_num_shots(test_case.num_measurements)
+        analytic_circuits = [circuit for circuit in deferred_circuits if circuit is not None]
+        shot_circuits = [
+            circuit for circuit, deferred_circuit in zip(measurement_plan.circuits, deferred_circuits)
+            if deferred_circuit is None]
+        analytic_results = iter(self._run_circuits(analytic_circuits, 1) if len(analytic_circuits) > 0 else [])
+        shot_results = iter(run_by_num_shots(
+            shot_circuits,
+            [num_experiments * circuit_shots
+             for circuit_shots, deferred_circuit in zip(num_shots, deferred_circuits) if deferred_circuit is None],
+            lambda circuits, circuit_shots: self._run_circuits(circuits, circuit_shots, memory=True)))
+
+        for (circuit, encodings), deferred_circuit, circuit_shots in zip(
+                measurement_plan, deferred_circuits, num_shots):
+            if deferred_circuit is None:
+                experiment_results = split_memory(next(shot_results), num_experiments)
+            else:
+                result = next(analytic_results)
+                experiment_results = sample_results(
+                    result, result.data(0)[self.probabilities_label], circuit_shots, num_experiments,
+                    self._get_random_generator())
+            for test_result, experiment_result in zip(test_results, experiment_results):
+                for encoding in encodings:
+                    test_result[encoding] = (experiment_result, circuit)
+        return test_results
+
+    def _runs_experiments_separately(self) -> bool:
+        """
+        check if get_experiment_results runs each experiment separately with get_test_results
+        Returns: false, experiments of a test case are always sampled together
+
+        """
+        return False
+
+    def _prepare_circuits(self, circuits: Sequence[QuantumCircuit]) -> None:
+        """
+        transpile circuits ahead of running them, circuits whose measurements can be deferred are run as deferred
+        measurement circuits so those are transpiled instead
+        Args:
+            circuits: measurement circuits to be run
+
+        Returns: None
+
+        """
+        deferred_circuits = [self.get_deferred_measurement_circuit(circuit) for circuit in circuits]
+        super()._prepare_circuits([
+            circuit if deferred_circuit is None else deferred_circuit
+            for circuit, deferred_circuit in zip(circuits, deferred_circuits)])
+
+    @staticmethod
+    def get_deferred_measurement_circuit(circuit: QuantumCircuit) -> Union[QuantumCircuit, None]:
+        """
+        get circuit in which measurements are replaced by saving exact probabilities of the measured classical bits,
+        qubits measured at the end of the circuit are saved directly while each measurement followed by operations on
+        its qubit is replaced by a CNOT onto an ancilla qubit assigned to the measured classical bit (deferred
+        measurement principle), the circuit keeps classical registers of the original circuit so that its results are
+        described the same way
+        Args:
+            circuit: measurement circuit
+
+        Returns: deferred measurement circuit, none if measurements in the circuit can't be deferred
+
+        """
+        instructions = []
+        if not AnalyticSimulatorTestRunner._get_deferred_instructions(
+                circuit, circuit.qubits, circuit.clbits, instructions, set()):
+            return None
+        # barriers don't change the state so they don't make a measurement of their qubits intermediate
+        last_uses = {}
+        for index, (instruction, qargs, _) in enumerate(instructions):
+            if not isinstance(instruction, Barrier):
+                last_uses.update((qubit, index) for qubit in qargs)
+        final_measurements = {
+            cargs[0]: qargs[0] for index, (instruction, qargs, cargs) in enumerate(instructions)
+            if instruction.name == "measure" and last_uses[qargs[0]] == index}
+
+        deferred_clbits = [clbit for clbit in circuit.clbits if clbit not in final_measurements]
+        ancillas = QuantumRegister(len(deferred_clbits), "deferred") if len(deferred_clbits) > 0 else None
+        deferred_circuit = QuantumCircuit(
+            *circuit.qregs, *([ancillas] if ancillas is not None else []), *circuit.cregs, name=circuit.name,
+            global_phase=circuit.global_phase)
+        if len(deferred_circuit.qubits) != circuit.num_qubits + len(deferred_clbits) or \
+                len(deferred_circuit.clbits) != circuit.num_clbits:
+            return None
+        clbit_ancillas = dict(zip(deferred_clbits, ancillas if ancillas is not None else []))
+
+        for instruction, qargs, cargs in instructions:
+            if instruction.name != "measure":
+                deferred_circuit.append(instruction, qargs)
+            elif cargs[0] in clbit_ancillas:
+                deferred_circuit.cx(qargs[0], clbit_ancillas[cargs[0]])
+        # k-th saved qubit holds value of k-th clbit
+        saved_qubits = [final_measurements.get(clbit, clbit_ancillas.get(clbit)) for clbit in circuit.clbits]
+        deferred_circuit.append(
+            SaveProbabilitiesDict(len(saved_qubits), label=AnalyticSimulatorTestRunner.probabilities_label),
+            saved_qubits)
+        return deferred_circuit
+
+    @staticmethod
+    def _get_deferred_instructions(
+            circuit: QuantumCircuit, qubits: Sequence[Qubit], clbits: Sequence[Clbit],
+            instructions: List[Tuple[Instruction, List[Qubit], List[Clbit]]],
+            used_bits: Set[Union[Qubit, Clbit]]) -> bool:
+        """
+        collect instructions of a circuit acting on bits of the original circuit, custom instructions containing
+        measurements are expanded by their definition
+        Args:
+            circuit: circuit (or definition of an instruction) whose instructions are collected
+            qubits: qubits of the original circuit on which circuit acts
+            clbits: clbits of the original circuit on which circuit acts
+            instructions: collected instructions with their qubits and clbits (updated in place)
+            used_bits: qubits acted upon and clbits measured into so far (updated in place)
+
+        Returns: true if measurements of all instructions can be deferred, false otherwise
+
+        """
+        qubit_map = dict(zip(circuit.qubits, qubits))
+        clbit_map = dict(zip(circuit.clbits, clbits))
+        for instruction, qargs, cargs in circuit.data:
+            mapped_qubits = [qubit_map[qubit] for qubit in qargs]
+            mapped_clbits = [clbit_map[clbit] for clbit in cargs]
+            if instruction.condition is not None:
+                return False
+            if instruction.name == "measure":
+                # measuring the same clbit twice would need the ancilla to be reset
+                if mapped_clbits[0] in used_bits:
+                    return False
+                instructions.append((instruction, mapped_qubits, mapped_clbits))
+                used_bits.update(mapped_qubits + mapped_clbits)
+            elif len(cargs) > 0:
+                if instruction.definition is None or not AnalyticSimulatorTestRunner._get_deferred_instructions(
+                        instruction.definition, mapped_qubits, mapped_clbits, instructions, used_bits):
+                    return False
+            elif isinstance(instruction, (Gate, Barrier)) or (
+                    instruction.name == "initialize" and used_bits.isdisjoint(mapped_qubits)):
+                # initialization of untouched qubits is deterministic
+                instructions.append((instruction, mapped_qubits, []))
+                used_bits.update(mapped_qubits)
+            else:
+                return False
+        return True
@@ -0,0 +1,99 @@
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple
+
+
+class Pipeline:
+    """
+    chain of stages each run by its own thread and connected by bounded queues, stage i processes item n while stage
+    i + 1 processes item n - 1, so throughput approaches that of the slowest stage, a stage blocks once its output
+    queue is full (which keeps number of items in flight bounded), items are yielded in order of the source and error
+    raised while producing or processing an item is re-raised when that item is reached
+    """
+    _item = "item"
+    _error = "error"
+    _end = "end"
+    poll_interval = 0.05
+
+    def __init__(self, source: Iterable, stages: Sequence[Callable[[Any], Any]], queue_size: int = 1) -> None:
+        """
+        initialize
+        Args:
+            source: iterable of items to process (iterated by the first thread)
+            stages: functions processing items, output of each stage is input of the next one
+            queue_size: maximum number of items waiting between consecutive stages
+        """
+        self.source = source
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def __iter__(self) -> Iterator:
+        """
+        run the pipeline, threads are stopped once iteration finishes, fails or is abandoned (stages finish item they
+        are processing)
+        Returns: iterator over outputs of the last stage
+
+        """
+        stop = Event()
+        queues = [Queue(maxsize=max(1, self.queue_size)) for _ in range(len(self.stages) + 1)]
+        threads = [Thread(target=self._produce, args=(queues[0], stop), daemon=True)]
+        for stage, input_queue, output_queue in zip(self.stages, queues, queues[1:]):
+            threads.append(Thread(target=self._process, args=(stage, input_queue, output_queue, stop), daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                kind, value = queues[-1].get()
+                if kind == self._end:
+                    return
+                if kind == self._error:
+                    raise value
+                yield value
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _produce(self, output_queue: Queue, stop: Event) -> None:
+        try:
+            for item in self.source:
+                if not self._put(output_queue, (self._item, item), stop):
+                    return
+        except Exception as error:
+            self._put(output_queue, (self._error, error), stop)
+            return
+        self._put(output_queue, (self._end, None), stop)
+
+    def _process(self, stage: Callable[[Any], Any], input_queue: Queue, output_queue: Queue, stop: Event) -> None:
+        while not stop.is_set():
+            try:
+                kind, value = input_queue.get(timeout=self.poll_interval)
+            except Empty:
+                continue
+            if kind == self._item:
+                try:
+                    value = stage(value)
+                except Exception as error:
+                    kind, value = self._error, error
+            if not self._put(output_queue, (kind, value), stop) or kind != self._item:
+                return
+
+    def _put(self, queue: Queue, entry: Tuple[str, Any], stop: Event) -> bool:
+        """
+        put entry to a queue waiting while the queue is full
+        Args:
+            queue: queue to put the entry to
+            entry: kind and value of the entry
+            stop: event set when the pipeline is stopped
+
+        Returns: true if entry was put, false if pipeline was stopped first
+
+        """
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=self.poll_interval)
+                return True
+            except Full:
+                continue
+        return False
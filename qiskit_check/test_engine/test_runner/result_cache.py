@@ -0,0 +1,134 @@
+import json
+import os
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Dict, Union
+
+from qiskit import QuantumCircuit
+from qiskit.providers import Backend
+from qiskit.result import Result
+
+from qiskit_check.test_engine.test_runner.transpilation_cache import TranspilationCache
+
+
+class ResultCache:
+    """
+    persistent on disk cache of results of seeded simulator runs, each entry is a json file holding the result of a
+    single circuit keyed by the transpiled circuit, backend (name and options), number of shots, simulator seed,
+    whether memory was stored and other run options, least recently used entries are evicted once the cache exceeds its size limit
+    """
+    extension = ".json"
+
+    def __init__(self, location: str, max_size: int = 256 * 2**20) -> None:
+        """
+        initialize
+        Args:
+            location: path to directory in which results are stored (created if it does not exist)
+            max_size: maximum size of all stored results in bytes
+        """
+        self.location = location
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(location, exist_ok=True)
+        self._size = sum(os.path.getsize(path) for path in self._get_entry_paths())
+        self._lock = Lock()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(
+            transpiled_circuit: QuantumCircuit, backend: Backend, num_shots: int, seed: int, index: int,
+            memory: bool, run_options: Union[Dict[str, Any], None] = None) -> str:
+        """
+        get key of the result of running a circuit
+        Args:
+            transpiled_circuit: circuit transpiled for the backend
+            backend: backend the circuit is run on
+            num_shots: number of shots
+            seed: simulator seed of the job in which the circuit is run
+            index: index of the circuit in the job (simulator derives seed of each circuit from the job seed and
+            index of the circuit)
+            memory: if true per shot measurement results are stored in the result
+            run_options: other options the circuit is run with (simulation method, precision, ...)
+
+        Returns: hex digest identifying the run
+
+        """
+        digest = sha256(TranspilationCache.get_fingerprint(transpiled_circuit).encode())
+        options = getattr(backend, "options", None)
+        options = sorted(vars(options).items()) if options is not None else []
+        run_options = sorted(run_options.items()) if run_options is not None else []
+        digest.update(repr((backend.name(), options, num_shots, seed, index, memory, run_options)).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Union[Result, None]:
+        """
+        get stored result
+        Args:
+            key: key of the result
+
+        Returns: stored result, none if there is no result stored under the key
+
+        """
+        path = self._get_path(key)
+        with self._lock:
+            try:
+                with open(path) as file:
+                    result = Result.from_dict(json.load(file))
+            except (OSError, ValueError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            os.utime(path)
+        return result
+
+    def put(self, key: str, result: Result) -> None:
+        """
+        store result evicting least recently used results if the cache exceeds its size limit
+        Args:
+            key: key of the result
+            result: result of a single circuit to store
+
+        Returns: None
+
+        """
+        path = self._get_path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with self._lock:
+            with open(temporary_path, "w") as file:
+                json.dump(result.to_dict(), file, default=str)
+            if os.path.exists(path):
+                self._size -= os.path.getsize(path)
+            os.replace(temporary_path, path)
+            self._size += os.path.getsize(path)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        remove least recently used results until the cache fits its size limit, must be called holding the lock
+        Returns: None
+
+        """
+        if self._size <= self.max_size:
+            return
+        for path in sorted(self._get_entry_paths(), key=os.path.getmtime):
+            self._size -= os.path.getsize(path)
+            os.remove(path)
+            if self._size <= self.max_size:
+                return
+
+    def _get_entry_paths(self):
+        for filename in os.listdir(self.location):
+            if filename.endswith(self.extension):
+                yield os.path.join(self.location, filename)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.location, key + self.extension)
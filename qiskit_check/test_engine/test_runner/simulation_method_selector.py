@@ -0,0 +1,159 @@
+from typing import List, Tuple, Union
+
+from numpy import array, eye, ndarray, vdot
+from qiskit import QuantumCircuit
+from qiskit.circuit import Barrier, Delay, Gate, Instruction, Measure, Reset
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import HGate, SGate
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Clifford
+
+
+class SimulationMethodSelector:
+    """
+    class choosing aer simulation method of each circuit: stabilizer for circuits made only of clifford gates on
+    qubits initialized to stabilizer states, matrix product state for wide circuits whose statevector would not fit
+    into memory, statevector otherwise
+    """
+    stabilizer_method = "stabilizer"
+    matrix_product_state_method = "matrix_product_state"
+    statevector_method = "statevector"
+    stabilizer_gates = {"id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg", "cx", "cy", "cz", "swap", "pauli"}
+
+    def __init__(self, matrix_product_state_width: int = 24) -> None:
+        """
+        initialize
+        Args:
+            matrix_product_state_width: number of qubits from which non clifford circuits are simulated as matrix
+            product states
+        """
+        self.matrix_product_state_width = matrix_product_state_width
+        self._single_qubit_cliffords = self._get_single_qubit_cliffords()
+
+    def select(self, circuit: QuantumCircuit) -> Tuple[str, QuantumCircuit]:
+        """
+        choose simulation method of a (transpiled) circuit
+        Args:
+            circuit: circuit to run
+
+        Returns: name of the simulation method and circuit to run with it (circuits run with stabilizer method have
+        their single qubit gates and initializations rewritten to gates supported by the stabilizer simulator, their
+        qubits and classical registers are the same as those of the original circuit)
+
+        """
+        stabilizer_circuit = self.get_stabilizer_circuit(circuit)
+        if stabilizer_circuit is not None:
+            return self.stabilizer_method, stabilizer_circuit
+        if circuit.num_qubits >= self.matrix_product_state_width:
+            return self.matrix_product_state_method, circuit
+        return self.statevector_method, circuit
+
+    def get_stabilizer_circuit(self, circuit: QuantumCircuit) -> Union[QuantumCircuit, None]:
+        """
+        get circuit that can be run by the stabilizer simulator
+        Args:
+            circuit: circuit to convert
+
+        Returns: equivalent circuit made of gates supported by the stabilizer simulator (up to global phase), none if
+        circuit contains non clifford operations or initializes qubits to non stabilizer states
+
+        """
+        stabilizer_circuit = QuantumCircuit(*circuit.qregs, *circuit.cregs, name=circuit.name)
+        if len(stabilizer_circuit.qubits) != circuit.num_qubits or len(stabilizer_circuit.clbits) != circuit.num_clbits:
+            return None
+        if not self._append_stabilizer(stabilizer_circuit, circuit, circuit.qubits, circuit.clbits):
+            return None
+        return stabilizer_circuit
+
+    def _append_stabilizer(
+            self, stabilizer_circuit: QuantumCircuit, circuit: QuantumCircuit, qubits: List, clbits: List) -> bool:
+        """
+        append instructions of a circuit to the stabilizer circuit, instructions that are not recognized as clifford
+        are expanded by their definition
+        Args:
+            stabilizer_circuit: circuit to append to
+            circuit: circuit (or definition of an instruction) whose instructions are appended
+            qubits: qubits of stabilizer circuit on which circuit acts
+            clbits: clbits of stabilizer circuit on which circuit acts
+
+        Returns: true if all instructions could be appended, false otherwise
+
+        """
+        qubit_map = dict(zip(circuit.qubits, qubits))
+        clbit_map = dict(zip(circuit.clbits, clbits))
+        for instruction, qargs, cargs in circuit.data:
+            mapped_qubits = [qubit_map[qubit] for qubit in qargs]
+            mapped_clbits = [clbit_map[clbit] for clbit in cargs]
+            if isinstance(instruction, (Measure, Reset, Barrier, Delay)) or instruction.name in self.stabilizer_gates:
+                stabilizer_circuit.append(instruction, mapped_qubits, mapped_clbits)
+                continue
+            if instruction.condition is not None:
+                return False
+
+            clifford_circuit = self._get_clifford_circuit(instruction)
+            if clifford_circuit is not None:
+                stabilizer_circuit.compose(clifford_circuit, mapped_qubits, inplace=True)
+            elif instruction.definition is None or not self._append_stabilizer(
+                    stabilizer_circuit, instruction.definition, mapped_qubits, mapped_clbits):
+                return False
+        return True
+
+    def _get_clifford_circuit(self, instruction: Instruction) -> Union[QuantumCircuit, None]:
+        """
+        get circuit of gates supported by the stabilizer simulator implementing an instruction
+        Args:
+            instruction: instruction to implement
+
+        Returns: circuit implementing the instruction (up to global phase), none if instruction isn't recognized as
+        clifford operation
+
+        """
+        if instruction.name == "initialize" and instruction.num_qubits == 1:
+            state = self._get_numeric_params(instruction)
+            if state is None or len(state) != 2:
+                return None
+            for clifford_circuit, matrix in self._single_qubit_cliffords:
+                if abs(abs(vdot(matrix[:, 0], state)) - 1) < 1e-8:
+                    preparation = QuantumCircuit(1)
+                    preparation.reset(0)
+                    return preparation.compose(clifford_circuit)
+            return None
+        if not isinstance(instruction, Gate) or self._get_numeric_params(instruction) is None:
+            return None
+        if instruction.num_qubits == 1:
+            try:
+                matrix = instruction.to_matrix()
+            except CircuitError:
+                return None
+            for clifford_circuit, clifford_matrix in self._single_qubit_cliffords:
+                if abs(abs(vdot(clifford_matrix, matrix)) / 2 - 1) < 1e-8:
+                    return clifford_circuit
+            return None
+        try:
+            return Clifford(instruction).to_circuit()
+        except (QiskitError, TypeError):
+            return None
+
+    @staticmethod
+    def _get_numeric_params(instruction: Instruction) -> Union[ndarray, None]:
+        try:
+            return array([complex(param) for param in instruction.params])
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_single_qubit_cliffords() -> List[Tuple[QuantumCircuit, ndarray]]:
+        """
+        get all 24 single qubit clifford operations (up to global phase) as circuits of h and s gates
+        Returns: list of circuits and their unitary matrices
+
+        """
+        cliffords = [(QuantumCircuit(1), eye(2))]
+        for clifford_circuit, matrix in cliffords:
+            for gate in (HGate(), SGate()):
+                next_matrix = gate.to_matrix() @ matrix
+                if all(abs(abs(vdot(other, next_matrix)) / 2 - 1) >= 1e-8 for _, other in cliffords):
+                    next_circuit = clifford_circuit.copy()
+                    next_circuit.append(gate, [0])
+                    cliffords.append((next_circuit, next_matrix))
+        return cliffords
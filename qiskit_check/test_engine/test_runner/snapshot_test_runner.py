@@ -0,0 +1,206 @@
+from functools import reduce
+from typing import Dict, List, Sequence, Tuple, Union
+
+from numpy import asarray, eye, kron, ndarray
+from qiskit import ClassicalRegister, QuantumCircuit, assemble
+from qiskit.circuit import Barrier, Gate, Instruction
+from qiskit.providers.aer.library import SaveDensityMatrix
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResult, ExperimentResultData
+
+from qiskit_check.property_test.classical_shadows import ShadowMeasurement
+from qiskit_check.property_test.resources.test_resource import ConcreteQubit, Qubit
+from qiskit_check.test_engine.circuit_creator import MeasurementPlan, MeasurementRequest, get_num_shots
+from qiskit_check.test_engine.concrete_property_test.concrete_property_test import TestCase
+from qiskit_check.test_engine.measurement_location import get_measurement_rotation
+from qiskit_check.test_engine.test_runner.analytic_test_runner import AnalyticSimulatorTestRunner
+from qiskit_check.test_engine.test_runner.test_runner import TestCaseRun
+from qiskit_check.test_engine.test_runner.utils import sample_results
+
+
+class SnapshotSimulatorTestRunner(AnalyticSimulatorTestRunner):
+    """
+    class responsible for running tests on an ideal (noiseless) aer statevector simulator from snapshots of the state,
+    instead of simulating a measurement circuit per measured location and basis the test case circuit is simulated once
+    with density matrices of measured qubits saved at every measured location, exact distribution of each measurement
+    is derived from them and counts of all experiments are sampled from it, test cases whose circuit isn't unitary
+    (measurements, resets, classically controlled operations, ...) are run as by AnalyticSimulatorTestRunner
+    """
+    snapshot_label = "snapshot"
+
+    def get_experiment_results(
+            self, test_case: TestCase, num_experiments: Union[int, None] = None,
+            measurement_plan: Union[MeasurementPlan, None] = None) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        simulate snapshot circuit of a test case once and sample counts of experiments from exact distributions of
+        the measurements, each measurement is described by its own circuit holding only that measurement
+        Args:
+            test_case: test case to run
+            num_experiments: number of experiments to run, none for all experiments of the test case
+            measurement_plan: measurement circuits of the test case, only used if test case can't be run from
+            snapshots
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        requests = self.circuit_creator.get_measurement_requests(test_case)
+        resource_matcher = test_case.assessor.resource_matcher
+        snapshot_circuit = self.get_snapshot_circuit(test_case.circuit, requests, resource_matcher)
+        if snapshot_circuit is None:
+            return super().get_experiment_results(test_case, num_experiments, measurement_plan)
+        num_experiments = num_experiments if num_experiments is not None else test_case.num_experiments
+
+        snapshot_result = self._run_circuits([snapshot_circuit], 1)[0]
+        snapshots = snapshot_result.data(0)
+        test_results = [{} for _ in range(num_experiments)]
+        for request in requests:
+            qubit_indices = tuple(resource_matcher[qubit].qubit_index for qubit in request.qubits)
+            density_matrix = asarray(snapshots[self._get_label(request.location, qubit_indices)])
+            probabilities = self.get_outcome_probabilities(
+                density_matrix, [get_measurement_rotation(instruction) for instruction in
+                                 self._get_qubit_instructions(request, resource_matcher)])
+            circuit = self.get_request_circuit(request, test_case.circuit.num_qubits, resource_matcher)
+            experiment_results = sample_results(
+                self._get_result_template(snapshot_result, circuit), probabilities,
+                get_num_shots(test_case.num_measurements, request.shot_divisor), num_experiments,
+                self._get_random_generator())
+            for test_result, experiment_result in zip(test_results, experiment_results):
+                for encoding in request.encodings:
+                    test_result[encoding] = (experiment_result, circuit)
+        return test_results
+
+    def _prepare_test_case_run(self, test_case: TestCase) -> TestCaseRun:
+        """
+        preparation stage of pipelined test, transpile snapshot circuit of a test case (or its measurement circuits if
+        it can't be run from snapshots)
+        Args:
+            test_case: test case to prepare
+
+        Returns: run of the test case holding its measurement circuits (or error raised while creating them)
+
+        """
+        test_case_run = TestCaseRun(test_case)
+        try:
+            test_case_run.measurement_plan = self.circuit_creator.get_measurement_plan(test_case)
+            snapshot_circuit = self.get_snapshot_circuit(
+                test_case.circuit, self.circuit_creator.get_measurement_requests(test_case),
+                test_case.assessor.resource_matcher)
+            if snapshot_circuit is None:
+                self._prepare_circuits(test_case_run.measurement_plan.circuits)
+            elif self.transpilation_cache.max_size > 0:
+                self.transpilation_cache.transpile([snapshot_circuit], self.backend)
+        except Exception as error:
+            test_case_run.error = error
+        return test_case_run
+
+    @staticmethod
+    def get_snapshot_circuit(
+            circuit: QuantumCircuit, requests: Sequence[MeasurementRequest],
+            resource_matcher: Dict[Qubit, ConcreteQubit]) -> Union[QuantumCircuit, None]:
+        """
+        get test case circuit with density matrix of measured qubits saved at location of each measurement
+        Args:
+            circuit: test case circuit (with initialization of qubits)
+            requests: measurements requested by assertions of the test case
+            resource_matcher: mapping between qubits and their indices in the circuit
+
+        Returns: snapshot circuit, none if the circuit isn't unitary or measurements aren't done by a rotation
+        followed by z measurement
+
+        """
+        for request in requests:
+            if any(get_measurement_rotation(instruction) is None
+                   for instruction in SnapshotSimulatorTestRunner._get_qubit_instructions(request, resource_matcher)):
+                return None
+
+        snapshots = {}
+        for request in requests:
+            # we need to account for initialization of qubits (1 per qubit)
+            location = len(circuit.qubits) + request.location if request.location is not None else len(circuit.data)
+            qubit_indices = tuple(resource_matcher[qubit].qubit_index for qubit in request.qubits)
+            label = SnapshotSimulatorTestRunner._get_label(request.location, qubit_indices)
+            snapshots.setdefault(min(location, len(circuit.data)), {})[label] = qubit_indices
+
+        snapshot_circuit = QuantumCircuit(
+            *circuit.qregs, *circuit.cregs, name=circuit.name, global_phase=circuit.global_phase)
+        touched_qubits = set()
+        for location in range(len(circuit.data) + 1):
+            for label, qubit_indices in snapshots.get(location, {}).items():
+                snapshot_circuit.append(
+                    SaveDensityMatrix(len(qubit_indices), label=label),
+                    [snapshot_circuit.qubits[qubit_index] for qubit_index in qubit_indices])
+            if location == len(circuit.data):
+                break
+            instruction, qargs, cargs = circuit.data[location]
+            if instruction.condition is not None or len(cargs) > 0:
+                return None
+            if not isinstance(instruction, (Gate, Barrier)) and not (
+                    instruction.name == "initialize" and touched_qubits.isdisjoint(qargs)):
+                return None
+            touched_qubits.update(qargs)
+            snapshot_circuit.append(instruction, qargs, cargs)
+        return snapshot_circuit
+
+    @staticmethod
+    def get_outcome_probabilities(density_matrix: ndarray, rotations: Sequence[ndarray]) -> Dict[int, float]:
+        """
+        get exact distribution of outcomes of measuring qubits after rotating each of them
+        Args:
+            density_matrix: density matrix of the measured qubits (qubit k is k-th bit of basis states)
+            rotations: unitary applied to each qubit before measuring it in z basis
+
+        Returns: probabilities of outcomes, k-th bit of outcome is the measured state of k-th qubit
+
+        """
+        rotation = reduce(lambda total, qubit_rotation: kron(qubit_rotation, total), rotations, eye(1))
+        probabilities = (rotation @ density_matrix @ rotation.conj().T).diagonal().real
+        return {outcome: float(probability) for outcome, probability in enumerate(probabilities) if probability > 0}
+
+    @staticmethod
+    def get_request_circuit(
+            request: MeasurementRequest, num_qubits: int,
+            resource_matcher: Dict[Qubit, ConcreteQubit]) -> QuantumCircuit:
+        """
+        get circuit holding only a measurement, it describes sampled results of the measurement the same way as
+        measurement circuits do (clbit k holds state of k-th measured qubit)
+        Args:
+            request: measurement
+            num_qubits: number of qubits of the test case circuit
+            resource_matcher: mapping between qubits and their indices in the circuit
+
+        Returns: measurement circuit
+
+        """
+        circuit = QuantumCircuit(num_qubits)
+        for qubit, instruction in zip(
+                request.qubits, SnapshotSimulatorTestRunner._get_qubit_instructions(request, resource_matcher)):
+            cl_reg = ClassicalRegister(1)
+            circuit.add_register(cl_reg)
+            circuit.append(instruction, [resource_matcher[qubit].qubit_index], cl_reg)
+        return circuit
+
+    @staticmethod
+    def _get_qubit_instructions(
+            request: MeasurementRequest, resource_matcher: Dict[Qubit, ConcreteQubit]) -> List[Instruction]:
+        # basis of a classical shadow setting depends on the measured qubit
+        if isinstance(request.instruction, ShadowMeasurement):
+            return [
+                request.instruction.get_qubit_measurement(resource_matcher[qubit].qubit_index)
+                for qubit in request.qubits]
+        return [request.instruction] * len(request.qubits)
+
+    @staticmethod
+    def _get_label(location: Union[int, None], qubit_indices: Tuple[int, ...]) -> str:
+        return f"{SnapshotSimulatorTestRunner.snapshot_label}-{location}-{qubit_indices}"
+
+    @staticmethod
+    def _get_result_template(snapshot_result: Result, circuit: QuantumCircuit) -> Result:
+        # sampled results take header describing classical registers of the measurement circuit from the template
+        experiment_result = ExperimentResult(
+            shots=1, success=True, data=ExperimentResultData(), header=assemble(circuit).experiments[0].header)
+        return Result(
+            backend_name=snapshot_result.backend_name, backend_version=snapshot_result.backend_version,
+            qobj_id=snapshot_result.qobj_id, job_id=snapshot_result.job_id, success=snapshot_result.success,
+            results=[experiment_result], date=snapshot_result.date, status=snapshot_result.status,
+            header=snapshot_result.header)
@@ -1,20 +1,113 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from hashlib import sha256
+from threading import Lock, local
+from time import sleep
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
 
-from qiskit import Aer, transpile, IBMQ, QuantumCircuit
+from numpy.random import SeedSequence
+from qiskit import Aer, IBMQ, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.providers.jobstatus import JOB_FINAL_STATES
 from qiskit.result import Result
 from qiskit.tools.monitor import job_monitor
 
+from qiskit_check.test_engine.assessor import ParsedResults
+from qiskit_check.test_engine.circuit_creator import CircuitCreator, MeasurementPlan
 from qiskit_check.test_engine.concrete_property_test.concrete_property_test import ConcretePropertyTest, TestCase
 from qiskit_check.test_engine.p_value_correction import NoCorrectionFactory, AbstractCorrectionFactory
 from qiskit_check.test_engine.printers import AbstractPrinter
 from qiskit_check.test_engine.test_runner.abstract_test_runner import AbstractTestRunner
+from qiskit_check.test_engine.test_runner.pipeline import Pipeline
+from qiskit_check.test_engine.test_runner.result_cache import ResultCache
+from qiskit_check.test_engine.test_runner.simulation_method_selector import SimulationMethodSelector
+from qiskit_check.test_engine.test_runner.transpilation_cache import TranspilationCache
+from qiskit_check.test_engine.test_runner.utils import bind_parameters_by_name, run_by_num_shots, split_result, \
+    split_memory
+
+
+class TestCaseRun:
+    """
+    state of a test case passing through stages of a pipelined test
+    """
+    def __init__(self, test_case: TestCase) -> None:
+        """
+        initialize
+        Args:
+            test_case: test case being run
+        """
+        self.test_case = test_case
+        self.measurement_plan: Union[MeasurementPlan, None] = None
+        self.test_results: Union[ParsedResults, None] = None
+        self.error: Union[Exception, None] = None
+        self.num_shots: Union[int, None] = None
 
 
 class TestRunner(AbstractTestRunner, ABC):
     """
-    class responsible for running tests
+    class responsible for running tests, ValueError is raised on construction if modes that can't be combined are set
     """
+    def __init__(
+            self, printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory(),
+            circuit_creator: CircuitCreator = CircuitCreator(), batch_experiments: bool = False,
+            split_memory: bool = False, transpilation_cache_size: int = 256, parameterized: bool = False,
+            test_case_workers: int = 1, sequential_looks: int = 1, futility_p_value: float = 0.5,
+            alpha_spending_exponent: float = 3, screening_fraction: Union[float, None] = None,
+            pipeline_depth: int = 0, num_workers: int = 1, futility_fraction: float = 0.5) -> None:
+        """
+        initialize
+        Args:
+            printer: object of subtype AbstractPrinter to print test information
+            corrector_factory: factory to build corrector objects to correct confidence level to maintain specified
+            family wise confidence level
+            circuit_creator: object responsible for creating measurement circuits for test cases
+            batch_experiments: if true all circuits of all experiments of a test case are submitted to the backend
+            as a single job, otherwise each circuit is run as a separate job
+            split_memory: if true each measurement circuit is run once with num_experiments * num_measurements shots
+            and per shot memory is split into num_experiments experiments
+            transpilation_cache_size: maximum number of transpiled circuits kept for reuse, 0 disables the cache
+            parameterized: if true measurement circuits are compiled once per property test from a template with
+            parametrized qubit initialization and all test cases are run as a single job binding their parameters
+            (experiments are always split from per shot memory in this mode), can't be combined with
+            test_case_workers, sequential_looks, screening_fraction or pipeline_depth
+            test_case_workers: number of threads running test cases of a property test concurrently (simulators
+            release GIL while simulating), 1 runs test cases sequentially, can't be combined with pipeline_depth
+            sequential_looks: number of groups of experiments after each of which test case is assessed, remaining
+            experiments are skipped once all assertions are decided, 1 assesses test case once after all experiments
+            futility_p_value: p-value above which an assertion is considered to hold at an interim look
+            alpha_spending_exponent: exponent of the alpha spending function spreading significance level over looks
+            screening_fraction: if set each test case is first screened with this fraction of its experiments and
+            only test cases whose p-values are ambiguous (between significance level spent on screening and
+            futility_p_value) are escalated to all experiments (overrides sequential_looks), shots spent by each test
+            case are printed in this mode and when sequential_looks is greater than 1
+            pipeline_depth: if greater than 0 generation and preparation (measurement circuits creation and
+            transpilation), simulation and assessment of consecutive test cases overlap, each stage is run by its own
+            thread and at most pipeline_depth test cases wait between consecutive stages, 0 runs stages in lock-step
+            num_workers: number of processes running property tests concurrently, 1 runs them in this process
+            futility_fraction: fraction of experiments before which test case isn't stopped early for all assertions
+            holding, earlier looks can only reject (screening look of screening_fraction is not restricted)
+        """
+        if parameterized and (
+                test_case_workers > 1 or sequential_looks > 1 or screening_fraction is not None or pipeline_depth > 0):
+            raise ValueError(
+                "parameterized mode can't be combined with test_case_workers, sequential_looks, screening_fraction "
+                "or pipeline_depth")
+        if test_case_workers > 1 and pipeline_depth > 0:
+            raise ValueError("test_case_workers can't be combined with pipeline_depth")
+        super().__init__(printer, corrector_factory, circuit_creator, num_workers)
+        self.batch_experiments = batch_experiments
+        self.split_memory = split_memory
+        self.transpilation_cache = TranspilationCache(transpilation_cache_size)
+        self.parameterized = parameterized
+        self.test_case_workers = test_case_workers
+        self.sequential_looks = sequential_looks
+        self.futility_p_value = futility_p_value
+        self.futility_fraction = futility_fraction
+        self.alpha_spending_exponent = alpha_spending_exponent
+        self.screening_fraction = screening_fraction
+        self.pipeline_depth = pipeline_depth
+
     def _run_test(self, property_test: ConcretePropertyTest) -> None:
         """
         run singular test
@@ -24,75 +117,926 @@ class TestRunner(AbstractTestRunner, ABC):
         Returns: none
 
         """
-        for test_case in property_test:
+        self._seed_property_test(property_test)
+        if self.parameterized:
+            self._run_parameterized_test(property_test)
+            return
+        if self.test_case_workers > 1:
+            self._run_concurrent_test(property_test)
+            return
+        if self.pipeline_depth > 0:
+            self._run_pipelined_test(property_test)
+            return
+
+        for test_case in self._get_test_cases(property_test):
             self.printer.print_test_case_header(test_case)
-            
-            test_results = []
-            for _ in range(test_case.num_experiments):
-                test_results.append(self.get_test_results(test_case))
-            num_assertions = len(test_case.assessor.assertions)
-            corrector = self.corrector_factory.build(test_case.assessor.confidence_level, num_assertions)
+
+            with self._seed_test_case(self._spawn_test_case_seed()):
+                if self._is_adaptive():
+                    self._print_test_case_outcome(test_case, *self._run_adaptive_test_case(test_case))
+                else:
+                    test_results = test_case.assessor.parse_results(self.iter_experiment_results(test_case))
+                    self._assess_test_case(test_case, test_results)
+
+    def _get_test_cases(self, property_test: ConcretePropertyTest) -> Iterator[TestCase]:
+        """
+        get test cases of a property test, initial states of seeded runners are generated from their seed
+        Args:
+            property_test: property test to get test cases of
+
+        Returns: iterator over test cases
+
+        """
+        return property_test.get_test_cases(self._get_seed())
+
+    def _get_seed(self) -> Union[int, None]:
+        """
+        get seed of the runner from which initial states of test cases are generated
+        Returns: seed, none if the runner is not seeded
+
+        """
+        return None
+
+    def _get_max_shots(self) -> Union[int, None]:
+        """
+        get maximum number of shots of a single circuit run by the runner
+        Returns: maximum number of shots, none if the number of shots is not limited
+
+        """
+        return None
+
+    def _split_experiments(self, num_experiments: int, experiment_shots: List[int]) -> List[int]:
+        """
+        split experiments run with split memory into groups run as separate jobs so that no circuit is run with more
+        shots than the runner allows, an experiment is never split across groups
+        Args:
+            num_experiments: number of experiments to run
+            experiment_shots: number of shots of each measurement circuit in a single experiment
+
+        Returns: number of experiments in each group
+
+        """
+        max_shots = self._get_max_shots()
+        group_size = max(1, num_experiments)
+        if max_shots is not None and len(experiment_shots) > 0:
+            group_size = max(1, min(group_size, max_shots // max(experiment_shots)))
+        return [min(group_size, num_experiments - start) for start in range(0, num_experiments, group_size)]
+
+    def _seed_property_test(self, property_test: ConcretePropertyTest) -> None:
+        """
+        reseed random state of the runner before running a property test with a child seed derived from seed of the
+        runner and key of the property test, so that copies of the runner running property tests in worker processes
+        don't share random state and property tests get the same seeds whichever worker runs them
+        Args:
+            property_test: property test about to be run
+
+        Returns: None
+
+        """
+        pass
+
+    def _spawn_test_case_seed(self) -> Union[SeedSequence, None]:
+        """
+        get child seed of the property test seed for the next test case, seeds are spawned by the single thread
+        iterating over test cases so that test cases get the same seeds however they are scheduled
+        Returns: seed of the test case, none if the runner is not seeded
+
+        """
+        return None
+
+    @contextmanager
+    def _seed_test_case(self, seed: Union[SeedSequence, None]) -> Iterator[None]:
+        """
+        derive random state of the runner from seed of a test case while the test case is run in this thread
+        Args:
+            seed: seed of the test case, none if the runner is not seeded
+
+        Returns: context in which the test case is run
+
+        """
+        yield
+
+    def _run_concurrent_test(self, property_test: ConcretePropertyTest) -> None:
+        """
+        run singular test with test cases executed concurrently by a pool of test_case_workers threads, test cases
+        (and initial states of their qubits) and their seeds are generated sequentially up front so that stateful
+        input generators and seeds stay deterministic, outcomes are printed in order of the test cases and the first
+        failing test case fails the property test (test cases that haven't started yet are cancelled)
+        Args:
+            property_test: test to run
+
+        Returns: none
+
+        """
+        test_cases = list(self._get_test_cases(property_test))
+        seeds = [self._spawn_test_case_seed() for _ in test_cases]
+        with ThreadPoolExecutor(max_workers=self.test_case_workers) as executor:
+            futures = [
+                executor.submit(self._get_test_case_outcome, test_case, seed)
+                for test_case, seed in zip(test_cases, seeds)]
+            for test_case, future in zip(test_cases, futures):
+                self.printer.print_test_case_header(test_case)
+                error, num_shots = future.result()
+                if error is not None:
+                    for pending_future in futures:
+                        pending_future.cancel()
+                self._print_test_case_outcome(test_case, error, num_shots)
+
+    def _run_pipelined_test(self, property_test: ConcretePropertyTest) -> None:
+        """
+        run singular test with stages of consecutive test cases overlapping, test case n + 1 is generated and its
+        measurement circuits are created and transpiled while test case n is being simulated and test case n - 1
+        assessed, outcomes are printed in order of the test cases and the first failing test case fails the property
+        test (test cases in flight are finished and dropped)
+        Args:
+            property_test: test to run
+
+        Returns: none
+
+        """
+        pipeline = Pipeline(
+            self._get_test_cases(property_test), [self._prepare_test_case_run, self._simulate_test_case_run], self.pipeline_depth)
+        for test_case_run in pipeline:
+            self.printer.print_test_case_header(test_case_run.test_case)
+            if test_case_run.error is None and test_case_run.test_results is not None:
+                try:
+                    self._assess(test_case_run.test_case, test_case_run.test_results)
+                except Exception as error:
+                    test_case_run.error = error
+            self._print_test_case_outcome(test_case_run.test_case, test_case_run.error, test_case_run.num_shots)
+
+    def _prepare_test_case_run(self, test_case: TestCase) -> TestCaseRun:
+        """
+        preparation stage of pipelined test, create measurement circuits of a test case and transpile them
+        Args:
+            test_case: test case to prepare
+
+        Returns: run of the test case holding its measurement circuits (or error raised while creating them)
+
+        """
+        test_case_run = TestCaseRun(test_case)
+        try:
+            test_case_run.measurement_plan = self.circuit_creator.get_measurement_plan(test_case)
+            self._prepare_circuits(test_case_run.measurement_plan.circuits)
+        except Exception as error:
+            test_case_run.error = error
+        return test_case_run
+
+    def _simulate_test_case_run(self, test_case_run: TestCaseRun) -> TestCaseRun:
+        """
+        simulation stage of pipelined test, run experiments of a prepared test case, in adaptive mode test case is
+        also assessed in this stage since assessment decides which experiments to run
+        Args:
+            test_case_run: run of the test case prepared by preparation stage
+
+        Returns: the same run holding results of the experiments (or error raised while running them)
+
+        """
+        seed = self._spawn_test_case_seed()
+        if test_case_run.error is not None:
+            return test_case_run
+        with self._seed_test_case(seed):
+            if self._is_adaptive():
+                test_case_run.error, test_case_run.num_shots = self._run_adaptive_test_case(
+                    test_case_run.test_case, test_case_run.measurement_plan)
+                return test_case_run
             try:
-                test_case.assessor.assess(test_results, corrector, test_case.num_measurements, test_case.num_experiments)
-                self.printer.print_test_case_success(test_case)
+                experiment_results = self.iter_experiment_results(
+                    test_case_run.test_case, measurement_plan=test_case_run.measurement_plan)
+                test_case_run.test_results = test_case_run.test_case.assessor.parse_results(experiment_results)
             except Exception as error:
-                self.printer.print_test_case_failure(test_case, error)
-                raise error
+                test_case_run.error = error
+        return test_case_run
+
+    def _prepare_circuits(self, circuits: Sequence[QuantumCircuit]) -> None:
+        """
+        transpile circuits ahead of running them, transpiled circuits are kept in the transpilation cache and reused
+        when the circuits are run
+        Args:
+            circuits: circuits to be run
+
+        Returns: None
+
+        """
+        if self.transpilation_cache.max_size > 0 and len(circuits) > 0:
+            self.transpilation_cache.transpile(list(circuits), self.backend)
+
+    def _get_test_case_outcome(
+            self, test_case: TestCase,
+            seed: Union[SeedSequence, None] = None) -> Tuple[Union[Exception, None], Union[int, None]]:
+        """
+        run and assess a test case without printing its outcome
+        Args:
+            test_case: test case to run
+            seed: seed of the test case spawned before the test case was submitted, none if the runner is not seeded
+
+        Returns: error raised while running or assessing the test case (none if test case passed) and number of
+        shots spent on the test case (none if shots are not reported)
+
+        """
+        with self._seed_test_case(seed):
+            if self._is_adaptive():
+                return self._run_adaptive_test_case(test_case)
+            try:
+                self._assess(test_case, test_case.assessor.parse_results(self.iter_experiment_results(test_case)))
+            except Exception as error:
+                return error, None
+        return None, None
+
+    def _print_test_case_outcome(
+            self, test_case: TestCase, error: Union[Exception, None], num_shots: Union[int, None]) -> None:
+        """
+        print outcome of a test case
+        Args:
+            test_case: test case that was run
+            error: error raised while running or assessing the test case, none if test case passed
+            num_shots: number of shots spent on the test case, none if shots are not reported
+
+        Returns: none, error raised if the test case failed
+
+        """
+        if num_shots is not None:
+            self.printer.print_test_case_shots(test_case, num_shots)
+        if error is not None:
+            self.printer.print_test_case_failure(test_case, error)
+            raise error
+        self.printer.print_test_case_success(test_case)
+
+    def _run_parameterized_test(self, property_test: ConcretePropertyTest) -> None:
+        """
+        run singular test with all test cases executed as a single job
+        Args:
+            property_test: test to run
+
+        Returns: none
+
+        """
+        test_cases = list(self._get_test_cases(property_test))
+        for test_case, test_results in zip(test_cases, self.get_parameterized_experiment_results(test_cases)):
+            self.printer.print_test_case_header(test_case)
+            self._assess_test_case(test_case, test_results)
+
+    def _assess_test_case(
+            self, test_case: TestCase,
+            test_results: Union[List[Dict[str, Tuple[Result, QuantumCircuit]]], ParsedResults]) -> None:
+        """
+        assess results of a test case and print the outcome
+        Args:
+            test_case: test case to assess
+            test_results: results of all experiments of the test case (or counts parsed from them)
+
+        Returns: none, error raised if the test case fails
+
+        """
+        try:
+            self._assess(test_case, test_results)
+            self.printer.print_test_case_success(test_case)
+        except Exception as error:
+            self.printer.print_test_case_failure(test_case, error)
+            raise error
+
+    def _is_adaptive(self) -> bool:
+        """
+        check if test cases are assessed in looks that can skip part of their experiments
+        Returns: true if sequential looks or screening are enabled
+
+        """
+        return self.sequential_looks > 1 or self.screening_fraction is not None
+
+    def _get_looks(self, num_experiments: int) -> List[int]:
+        """
+        get numbers of experiments done by each look at the results of a test case, each look adds at least 2
+        experiments (unless the test case has fewer experiments)
+        Args:
+            num_experiments: number of experiments of the test case
+
+        Returns: increasing list of cumulative numbers of experiments, the last one being num_experiments
+
+        """
+        if self.screening_fraction is not None:
+            num_screening_experiments = min(num_experiments, max(2, round(self.screening_fraction * num_experiments)))
+            return sorted({num_screening_experiments, num_experiments})
+        num_looks = max(1, min(self.sequential_looks, num_experiments // 2))
+        return [look * num_experiments // num_looks for look in range(1, num_looks + 1)]
+
+    def _run_adaptive_test_case(
+            self, test_case: TestCase,
+            measurement_plan: Union[MeasurementPlan, None] = None) -> Tuple[Union[Exception, None], int]:
+        """
+        run and assess a test case in looks without printing its outcome
+        Args:
+            test_case: test case to run
+            measurement_plan: measurement circuits of the test case, none to create them
+
+        Returns: error raised while running or assessing the test case (none if test case passed) and number of
+        shots spent on the test case
+
+        """
+        test_results = ParsedResults(test_case.assessor)
+        experiment_shots = 0
+        error = None
+        try:
+            if measurement_plan is None:
+                measurement_plan = self.circuit_creator.get_measurement_plan(test_case)
+            experiment_shots = sum(measurement_plan.get_num_shots(test_case.num_measurements))
+            self._assess_sequentially(test_case, measurement_plan, test_results)
+        except Exception as raised_error:
+            error = raised_error
+        return error, len(test_results) * experiment_shots
+
+    def _assess_sequentially(
+            self, test_case: TestCase, measurement_plan: MeasurementPlan,
+            test_results: ParsedResults) -> None:
+        """
+        run experiments of a test case in groups and assess the test case after each group, remaining experiments
+        are skipped as soon as the assessor decides all assertions
+        Args:
+            test_case: test case to run
+            measurement_plan: measurement circuits of the test case
+            test_results: counts parsed from results of experiments as they are run (updated in place)
+
+        Returns: none, error raised if the test case fails
+
+        """
+        num_assertions = len(test_case.assessor.assertions)
+        corrector = self.corrector_factory.build(test_case.assessor.confidence_level, num_assertions)
+
+        # screening stops test cases with unambiguous p-values at the screening look by design
+        futility_fraction = 0 if self.screening_fraction is not None else self.futility_fraction
+        spent_fraction = 0
+        for num_experiments in self._get_looks(test_case.num_experiments):
+            test_results.extend(self.iter_experiment_results(
+                test_case, num_experiments - len(test_results), measurement_plan))
+            fraction = len(test_results) / test_case.num_experiments
+            if test_case.assessor.assess_sequentially(
+                    test_results, corrector, test_case.num_measurements, spent_fraction, fraction,
+                    self.futility_p_value, self.alpha_spending_exponent, futility_fraction):
+                return
+            spent_fraction = fraction
+
+    def _assess(
+            self, test_case: TestCase,
+            test_results: Union[List[Dict[str, Tuple[Result, QuantumCircuit]]], ParsedResults]) -> None:
+        """
+        assess results of a test case
+        Args:
+            test_case: test case to assess
+            test_results: results of all experiments of the test case (or counts parsed from them)
+
+        Returns: none, error raised if the test case fails
+
+        """
+        num_assertions = len(test_case.assessor.assertions)
+        corrector = self.corrector_factory.build(test_case.assessor.confidence_level, num_assertions)
+        test_case.assessor.assess(test_results, corrector, test_case.num_measurements, test_case.num_experiments)
+
+    def get_parameterized_experiment_results(
+            self, test_cases: List[TestCase]) -> List[List[Dict[str, Tuple[Result, QuantumCircuit]]]]:
+        """
+        run all experiments of all test cases of a property test as a single job, measurement circuits are created
+        once from template shared by the test cases and each test case only binds its parameters, each test case is
+        run once with shots for all experiments which are then split into experiments using per shot memory
+        Args:
+            test_cases: test cases of a single property test
+
+        Returns: list (one element per test case) of lists (one element per experiment) of mappings between
+        measurement encoding and the result and circuit in which that measurement was done
+
+        """
+        if len(test_cases) == 0:
+            return []
+
+        num_experiments = test_cases[0].num_experiments
+        measurement_plan = self.circuit_creator.get_measurement_plan(test_cases[0], parameterized=True)
+        if len(measurement_plan) == 0:
+            return [[{} for _ in range(num_experiments)] for _ in test_cases]
+
+        parameter_binds = [test_case.parameter_binds for test_case in test_cases]
+        experiment_shots = measurement_plan.get_num_shots(test_cases[0].num_measurements)
+        test_results = [[] for _ in test_cases]
+        for group_experiments in self._split_experiments(num_experiments, experiment_shots):
+            num_shots = [group_experiments * circuit_shots for circuit_shots in experiment_shots]
+            results_per_circuit = run_by_num_shots(
+                list(measurement_plan.circuits), num_shots,
+                lambda circuits, circuit_shots: self._run_parameterized_circuits(
+                    circuits, parameter_binds, circuit_shots, memory=True))
+
+            group_results = [[{} for _ in range(group_experiments)] for _ in test_cases]
+            for (circuit, encodings), circuit_results in zip(measurement_plan, results_per_circuit):
+                for test_case_results, result in zip(group_results, circuit_results):
+                    for experiment_results, experiment_result in zip(
+                            test_case_results, split_memory(result, group_experiments)):
+                        for encoding in encodings:
+                            experiment_results[encoding] = (experiment_result, circuit)
+            for test_case_results, test_case_group_results in zip(test_results, group_results):
+                test_case_results.extend(test_case_group_results)
+        return test_results
     
-    def get_test_results(self, test_case: TestCase) -> Dict[str, Tuple[Result, QuantumCircuit]]:
-        measurement_circuits, circuit_names = self.circuit_creator.get_circuits(test_case)
+    def iter_experiment_results(
+            self, test_case: TestCase, num_experiments: Union[int, None] = None,
+            measurement_plan: Union[MeasurementPlan, None] = None) -> Iterator[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        run experiments of a test case yielding results of each experiment as soon as they are available, if
+        experiments are run separately each of them is run only once the previous one was consumed, otherwise results
+        of experiments run together are released one by one as they are consumed
+        Args:
+            test_case: test case to run
+            num_experiments: number of experiments to run, none for all experiments of the test case
+            measurement_plan: measurement circuits of the test case, none to create them
+
+        Returns: iterator (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        num_experiments, measurement_plan = self._get_experiment_setup(test_case, num_experiments, measurement_plan)
+        if self._runs_experiments_separately():
+            for _ in range(num_experiments):
+                yield self.get_test_results(test_case, measurement_plan)
+            return
+
+        test_results = self.get_experiment_results(test_case, num_experiments, measurement_plan)
+        test_results.reverse()
+        while len(test_results) > 0:
+            yield test_results.pop()
+
+    def _runs_experiments_separately(self) -> bool:
+        """
+        check if get_experiment_results runs each experiment separately with get_test_results
+        Returns: true if experiments are run separately
+
+        """
+        return not self.split_memory and not self.batch_experiments
+
+    def get_experiment_results(
+            self, test_case: TestCase, num_experiments: Union[int, None] = None,
+            measurement_plan: Union[MeasurementPlan, None] = None) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        run experiments of a test case, measurement circuits are created once and reused by all experiments
+        Args:
+            test_case: test case to run
+            num_experiments: number of experiments to run, none for all experiments of the test case
+            measurement_plan: measurement circuits of the test case, none to create them
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        num_experiments, measurement_plan = self._get_experiment_setup(test_case, num_experiments, measurement_plan)
+        if self.split_memory:
+            return self.get_split_memory_test_results(test_case, measurement_plan, num_experiments)
+        if self.batch_experiments:
+            return self.get_batched_test_results(test_case, measurement_plan, num_experiments)
+
+        test_results = []
+        for _ in range(num_experiments):
+            test_results.append(self.get_test_results(test_case, measurement_plan))
+        return test_results
+
+    def _get_experiment_setup(
+            self, test_case: TestCase, num_experiments: Union[int, None],
+            measurement_plan: Union[MeasurementPlan, None]) -> Tuple[int, MeasurementPlan]:
+        """
+        fill in defaults of optional arguments of get_experiment_results
+        Args:
+            test_case: test case to run
+            num_experiments: number of experiments to run, none for all experiments of the test case
+            measurement_plan: measurement circuits of the test case, none to create them
+
+        Returns: number of experiments to run and measurement circuits of the test case
+
+        """
+        if num_experiments is None:
+            num_experiments = test_case.num_experiments
+        if measurement_plan is None:
+            measurement_plan = self.circuit_creator.get_measurement_plan(test_case)
+        return num_experiments, measurement_plan
+
+    def get_batched_test_results(
+            self, test_case: TestCase, measurement_plan: MeasurementPlan,
+            num_experiments: int) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        run experiments of a test case as a single job and demultiplex the results back into experiments
+        Args:
+            test_case: test case to run
+            measurement_plan: measurement circuits of the test case
+            num_experiments: number of experiments to run
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        if len(measurement_plan) == 0:
+            return [{} for _ in range(num_experiments)]
+
+        circuits = list(measurement_plan.circuits) * num_experiments
+        num_shots = measurement_plan.get_num_shots(test_case.num_measurements) * num_experiments
+        circuit_results = run_by_num_shots(circuits, num_shots, self._run_circuits)
+        return self._demultiplex_results(measurement_plan, circuit_results, num_experiments)
+
+    @staticmethod
+    def _demultiplex_results(
+            measurement_plan: MeasurementPlan, circuit_results: List[Result],
+            num_experiments: int) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        assign results of measurement circuits run for all experiments back to experiments
+        Args:
+            measurement_plan: measurement circuits of the test case
+            circuit_results: results of measurement circuits repeated for each experiment (experiment major order)
+            num_experiments: number of experiments
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        circuit_results = iter(circuit_results)
+        test_results = []
+        for _ in range(num_experiments):
+            results = {}
+            for circuit, encodings in measurement_plan:
+                result = next(circuit_results)
+                for encoding in encodings:
+                    results[encoding] = (result, circuit)
+            test_results.append(results)
+        return test_results
+
+    def get_split_memory_test_results(
+            self, test_case: TestCase, measurement_plan: MeasurementPlan,
+            num_experiments: int) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        run each measurement circuit of a test case once with shots for all experiments and split per shot memory
+        into experiments, this is the same sampling procedure as running each experiment separately, if the shots
+        exceed the limit of the runner experiments are split into groups each run as a separate job
+        Args:
+            test_case: test case to run
+            measurement_plan: measurement circuits of the test case
+            num_experiments: number of experiments to run
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        circuits = list(measurement_plan.circuits)
+        experiment_shots = measurement_plan.get_num_shots(test_case.num_measurements)
+        test_results = []
+        for group_experiments in self._split_experiments(num_experiments, experiment_shots):
+            num_shots = [group_experiments * circuit_shots for circuit_shots in experiment_shots]
+            if self.batch_experiments and len(circuits) > 0:
+                circuit_results = run_by_num_shots(
+                    circuits, num_shots,
+                    lambda shot_circuits, circuit_shots: self._run_circuits(shot_circuits, circuit_shots, memory=True))
+            else:
+                circuit_results = [
+                    self._run_circuit(circuit, circuit_shots, memory=True)
+                    for circuit, circuit_shots in zip(circuits, num_shots)]
+
+            group_results = [{} for _ in range(group_experiments)]
+            for (circuit, encodings), result in zip(measurement_plan, circuit_results):
+                for experiment_results, experiment_result in zip(group_results, split_memory(result, group_experiments)):
+                    for encoding in encodings:
+                        experiment_results[encoding] = (experiment_result, circuit)
+            test_results.extend(group_results)
+        return test_results
+
+    def get_test_results(
+            self, test_case: TestCase, measurement_plan: MeasurementPlan) -> Dict[str, Tuple[Result, QuantumCircuit]]:
+        """
+        run a single experiment of a test case
+        Args:
+            test_case: test case to run
+            measurement_plan: measurement circuits of the test case
+
+        Returns: mapping between measurement encoding and the result and circuit in which that measurement was done
+
+        """
         results = {}
-        for circuit_name, encodings in measurement_circuits.items():
-            circuit = circuit_names[circuit_name]
-            result = self._run_circuit(circuit, test_case.num_measurements)
+        for (circuit, encodings), num_shots in zip(
+                measurement_plan, measurement_plan.get_num_shots(test_case.num_measurements)):
+            result = self._run_circuit(circuit, num_shots)
             for encoding in encodings:
                 results[encoding] = (result, circuit)
         return results
-    
+
     @abstractmethod
-    def _run_circuit(self, circuit: QuantumCircuit, num_shots: int) -> Result:
+    def _run_circuit(self, circuit: QuantumCircuit, num_shots: int, memory: bool = False) -> Result:
         """
         execute a given circuit
         Args:
             circuit: QuantumCircuit to execute
             num_shots: number of shots to run the circuit with
+            memory: if true per shot measurement results are stored in the result
 
         Returns: qiskit result
 
         """
         pass
 
+    @abstractmethod
+    def _run_circuits(self, circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        execute given circuits as a single job
+        Args:
+            circuits: list of QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        pass
+
+    def _run_transpiled_circuits(
+            self, transpiled_circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        execute circuits already transpiled for the backend as a single job
+        Args:
+            transpiled_circuits: list of transpiled QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        return self._run_circuits(transpiled_circuits, num_shots, memory)
+
+    def _run_parameterized_circuits(
+            self, circuits: List[QuantumCircuit], parameter_binds: List[Dict[Parameter, float]], num_shots: int,
+            memory: bool = False) -> List[List[Result]]:
+        """
+        execute parametrized circuits for each of the parameter bindings as a single job, circuits are transpiled once
+        and parameters are bound to the transpiled circuits
+        Args:
+            circuits: list of parametrized QuantumCircuits to execute
+            parameter_binds: list of parameter values to bind to each of the circuits
+            num_shots: number of shots to run each bound circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list (one element per circuit) of lists of qiskit results (one element per parameter binding)
+
+        """
+        transpiled_circuits = self.transpilation_cache.transpile(circuits, self.backend)
+        bound_circuits = [
+            bind_parameters_by_name(circuit, binds) for circuit in transpiled_circuits for binds in parameter_binds]
+        results = iter(self._run_transpiled_circuits(bound_circuits, num_shots, memory))
+        return [[next(results) for _ in parameter_binds] for _ in circuits]
+
 
 class SimulatorTestRunner(TestRunner):
     """
     class responsible for running tests on aer simulators
     """
-    def __init__(self, simulator_name: str, printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory()) -> None:
+    def __init__(
+            self, simulator_name: str, printer: AbstractPrinter,
+            corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory(), batch_experiments: bool = False,
+            split_memory: bool = False, transpilation_cache_size: int = 256, parameterized: bool = False,
+            test_case_workers: int = 1, seed_simulator: Union[int, None] = None,
+            result_cache_location: Union[str, None] = None, result_cache_size: int = 256 * 2**20,
+            sequential_looks: int = 1, futility_p_value: float = 0.5,
+            screening_fraction: Union[float, None] = None, run_options: Union[Dict[str, Any], None] = None,
+            select_simulation_method: bool = False, matrix_product_state_width: int = 24,
+            pipeline_depth: int = 0, num_workers: int = 1, futility_fraction: float = 0.5) -> None:
         """
-        initialize
+        initialize, arguments shared by all runners are described in TestRunner
         Args:
             simulator_name: name of the aer simulator to be used
-            printer: object of subtype AbstractPrinter to print test information
-            tomography: object of subtype AbstractPrinter to be used for state tomography, default none
-            corrector_factory: factory to build corrector objects to correct confidence level to maintain specified
-            family wise confidence level
+            seed_simulator: seed from which initial states of test cases and seeds of simulator jobs are derived (each
+            job gets a different seed so that experiments are independent), none for unseeded runs
+            result_cache_location: path to directory where results of seeded runs are cached between runs of the
+            tests, none disables the cache (results of unseeded runs are never cached)
+            result_cache_size: maximum size of the result cache in bytes
+            run_options: aer options passed to every run of the simulator (e.g. max_parallel_threads,
+            max_parallel_experiments, max_parallel_shots, method, precision, fusion_enable, blocking_enable),
+            seed_simulator given here is used as seed_simulator argument (seed from which seeds of jobs are derived)
+            select_simulation_method: if true simulation method of each circuit is chosen by inspecting the circuit
+            (stabilizer for clifford circuits with stabilizer inputs, matrix product state for wide circuits,
+            statevector otherwise) overriding method in run_options, chosen method is recorded in result metadata
+            matrix_product_state_width: number of qubits from which non clifford circuits are simulated as matrix
+            product states when select_simulation_method is set
         """
-        super().__init__(printer, corrector_factory)
+        super().__init__(
+            printer, corrector_factory, batch_experiments=batch_experiments, split_memory=split_memory,
+            transpilation_cache_size=transpilation_cache_size, parameterized=parameterized,
+            test_case_workers=test_case_workers, sequential_looks=sequential_looks,
+            futility_p_value=futility_p_value, screening_fraction=screening_fraction, pipeline_depth=pipeline_depth,
+            num_workers=num_workers, futility_fraction=futility_fraction)
         self.backend = Aer.get_backend(simulator_name)
+        self.run_options = dict(run_options) if run_options is not None else {}
+        self.seed_simulator = self.run_options.pop("seed_simulator", seed_simulator)
+        self.result_cache = ResultCache(result_cache_location, result_cache_size) \
+            if result_cache_location is not None else None
+        self.simulation_method_selector = SimulationMethodSelector(matrix_product_state_width) \
+            if select_simulation_method else None
+        self._seed_sequence = SeedSequence(self.seed_simulator) if self.seed_simulator is not None else None
+        self._job_occurrences: Dict[int, int] = {}
+        self._job_seed_lock = Lock()
+        self._local = local()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_job_seed_lock"]
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._job_seed_lock = Lock()
+        self._local = local()
+
+    def _get_seed(self) -> Union[int, None]:
+        """
+        get seed of the runner from which initial states of test cases are generated
+        Returns: seed_simulator, none if the runner is not seeded
+
+        """
+        return self.seed_simulator
+
+    def _seed_property_test(self, property_test: ConcretePropertyTest) -> None:
+        """
+        derive seeds of test cases and simulator jobs of a property test from a child seed of the runner seed for the
+        property test
+        Args:
+            property_test: property test about to be run
+
+        Returns: None
+
+        """
+        seed = self._get_seed()
+        if seed is not None:
+            self._seed_sequence = SeedSequence(seed, spawn_key=(property_test.get_key(), ))
+            self._job_occurrences = {}
+
+    def _spawn_test_case_seed(self) -> Union[SeedSequence, None]:
+        """
+        get child seed of the property test seed for the next test case, seeds are spawned by the single thread
+        iterating over test cases so that test cases get the same seeds however they are scheduled
+        Returns: seed of the test case, none if the runner is not seeded
+
+        """
+        return self._seed_sequence.spawn(1)[0] if self._seed_sequence is not None else None
 
-    def _run_circuit(self, circuit: QuantumCircuit, num_shots: int) -> Result:
+    @contextmanager
+    def _seed_test_case(self, seed: Union[SeedSequence, None]) -> Iterator[None]:
+        """
+        derive seeds of simulator jobs run in this thread from seed of a test case while the test case is run, so that
+        seeds do not depend on jobs of test cases run concurrently by other threads
+        Args:
+            seed: seed of the test case, none if the runner is not seeded
+
+        Returns: context in which the test case is run
+
+        """
+        self._local.seed_sequence = seed
+        self._local.job_occurrences = {}
+        try:
+            yield
+        finally:
+            self._local.__dict__.clear()
+
+    def _run_circuit(self, circuit: QuantumCircuit, num_shots: int, memory: bool = False) -> Result:
         """
         execute a given  on a Aer simulator backend (which is exactly specified in simulator_name)
         Args:
             circuit: QuantumCircuit to execute
             num_shots: number of shots to run the circuit with
+            memory: if true per shot measurement results are stored in the result
 
         Returns: qiskit result
 
         """
-        transpiled_circuit = transpile(circuit, self.backend)
-        return self.backend.run(transpiled_circuit, shots=num_shots).result()
+        transpiled_circuit = self.transpilation_cache.transpile([circuit], self.backend)[0]
+        return self._run_job([transpiled_circuit], num_shots, memory)[0]
+
+    def _run_circuits(self, circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        execute given circuits as a single job on a Aer simulator backend, Aer is free to parallelize the experiments
+        Args:
+            circuits: list of QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        transpiled_circuits = self.transpilation_cache.transpile(circuits, self.backend)
+        return self._run_job(transpiled_circuits, num_shots, memory)
+
+    def _run_transpiled_circuits(
+            self, transpiled_circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        execute circuits already transpiled for the simulator as a single job, parameterized circuits are bound before
+        they are passed here (Aer parameter_binds are not used since Aer simulates all bindings of a circuit with the
+        same seed which would make test cases statistically dependent)
+        Args:
+            transpiled_circuits: list of transpiled QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        return self._run_job(transpiled_circuits, num_shots, memory)
+
+    def _run_job(self, transpiled_circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        run transpiled circuits as a single job, if simulation method is selected per circuit circuits are grouped
+        into one job per simulation method
+        Args:
+            transpiled_circuits: list of transpiled QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        if self.simulation_method_selector is None:
+            return self._run_job_with_options(transpiled_circuits, num_shots, memory, self.run_options)
+
+        selected_circuits = {}
+        methods_circuits = {}
+        for index, transpiled_circuit in enumerate(transpiled_circuits):
+            # experiments repeat the same transpiled circuits
+            if id(transpiled_circuit) not in selected_circuits:
+                selected_circuits[id(transpiled_circuit)] = self.simulation_method_selector.select(transpiled_circuit)
+            method, method_circuit = selected_circuits[id(transpiled_circuit)]
+            methods_circuits.setdefault(method, []).append((index, method_circuit))
+
+        results = [None] * len(transpiled_circuits)
+        for method, indexed_circuits in methods_circuits.items():
+            indices, method_circuits = zip(*indexed_circuits)
+            method_results = self._run_job_with_options(
+                list(method_circuits), num_shots, memory, dict(self.run_options, method=method))
+            for index, result in zip(indices, method_results):
+                results[index] = result
+        return results
+
+    def _run_job_with_options(
+            self, transpiled_circuits: List[QuantumCircuit], num_shots: int, memory: bool,
+            run_options: Dict[str, Any]) -> List[Result]:
+        """
+        run transpiled circuits as a single job, results of seeded jobs are looked up in the result cache first and
+        the job is only run if any of its results is missing
+        Args:
+            transpiled_circuits: list of transpiled QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+            run_options: aer options of the job
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        if self.seed_simulator is None:
+            return split_result(self.backend.run(
+                transpiled_circuits, shots=num_shots, memory=memory, **run_options).result())
+
+        seed = self._get_job_seed(transpiled_circuits, num_shots, memory, run_options)
+        if self.result_cache is None:
+            return split_result(self.backend.run(
+                transpiled_circuits, shots=num_shots, memory=memory, seed_simulator=seed, **run_options).result())
+
+        keys = [
+            self.result_cache.get_key(transpiled_circuit, self.backend, num_shots, seed, index, memory, run_options)
+            for index, transpiled_circuit in enumerate(transpiled_circuits)]
+        results = [self.result_cache.get(key) for key in keys]
+        if any(result is None for result in results):
+            results = split_result(self.backend.run(
+                transpiled_circuits, shots=num_shots, memory=memory, seed_simulator=seed, **run_options).result())
+            for key, result in zip(keys, results):
+                self.result_cache.put(key, result)
+        return results
+
+
+    def _get_job_seed(
+            self, transpiled_circuits: List[QuantumCircuit], num_shots: int, memory: bool,
+            run_options: Dict[str, Any]) -> int:
+        """
+        get simulator seed of a job derived from seed of the test case (or property test) being run and key of the job
+        (circuits, shots and options) rather than drawn from a sequence shared by all jobs, so seeds of a property test
+        do not change when other property tests are added or reordered, jobs with the same key (repeated experiments)
+        are told apart by number of times the key occurred before
+        Args:
+            transpiled_circuits: list of transpiled QuantumCircuits of the job
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+            run_options: aer options of the job
+
+        Returns: seed of the job
 
+        """
+        digest = sha256(repr((num_shots, memory, sorted(run_options.items()))).encode())
+        for transpiled_circuit in transpiled_circuits:
+            digest.update(TranspilationCache.get_fingerprint(transpiled_circuit).encode())
+        job_key = int.from_bytes(digest.digest()[:8], "big")
+        seed_sequence = getattr(self._local, "seed_sequence", None)
+        if seed_sequence is not None:
+            occurrence = self._local.job_occurrences.get(job_key, 0)
+            self._local.job_occurrences[job_key] = occurrence + 1
+        else:
+            seed_sequence = self._seed_sequence
+            with self._job_seed_lock:
+                occurrence = self._job_occurrences.get(job_key, 0)
+                self._job_occurrences[job_key] = occurrence + 1
+        job_seed_sequence = SeedSequence(
+            seed_sequence.entropy, spawn_key=seed_sequence.spawn_key + (job_key, occurrence))
+        return int(job_seed_sequence.generate_state(1)[0] % 2**31)
 
 class IBMQDeviceRunner(TestRunner):
     """
@@ -100,35 +1044,161 @@ class IBMQDeviceRunner(TestRunner):
     """
     def __init__(
             self, backend_name: str, provider_hub: str, provider_group: str, provider_project: str,
-            printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory()) -> None:
+            printer: AbstractPrinter, corrector_factory: AbstractCorrectionFactory = NoCorrectionFactory(),
+            batch_experiments: bool = False, split_memory: bool = False, transpilation_cache_size: int = 256,
+            parameterized: bool = False, test_case_workers: int = 1, max_concurrent_jobs: int = 1,
+            poll_interval: float = 2, sequential_looks: int = 1, futility_p_value: float = 0.5,
+            screening_fraction: Union[float, None] = None, pipeline_depth: int = 0, num_workers: int = 1,
+            futility_fraction: float = 0.5) -> None:
         """
-        initialize
+        initialize, arguments shared by all runners are described in TestRunner, jobs of batch_experiments and
+        split_memory modes are split into multiple jobs if they exceed limits of the device
         Args:
             backend_name: IBMQ device name
             provider_hub: IBMQ provider hub name
             provider_group: IBMQ provider group name
             provider_project: IBMQ provider project name
-            printer: object of subtype AbstractPrinter to print test information
-            tomography: object of subtype AbstractPrinter to be used for state tomography, default none
-            corrector_factory: factory to build corrector objects to correct confidence level to maintain specified
-            family wise confidence level
+            max_concurrent_jobs: maximum number of jobs kept in flight on the device, if greater than 1 jobs are
+            submitted without waiting for previous ones and each experiment of a test case is submitted as separate
+            job (unless batch_experiments or split_memory are set), 1 waits for each job before submitting the next
+            poll_interval: number of seconds between polls of status of jobs in flight
         """
-        super().__init__(printer, corrector_factory)
+        super().__init__(
+            printer, corrector_factory, batch_experiments=batch_experiments, split_memory=split_memory,
+            transpilation_cache_size=transpilation_cache_size, parameterized=parameterized,
+            test_case_workers=test_case_workers, sequential_looks=sequential_looks,
+            futility_p_value=futility_p_value, screening_fraction=screening_fraction, pipeline_depth=pipeline_depth,
+            num_workers=num_workers, futility_fraction=futility_fraction)
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.poll_interval = poll_interval
         IBMQ.load_account()
         provider = IBMQ.get_provider(hub=provider_hub, group=provider_group, project=provider_project)
         self.backend = provider.get_backend(backend_name)
 
-    def _run_circuit(self, circuit: QuantumCircuit, num_shots: int) -> Result:
+    def _get_max_shots(self) -> Union[int, None]:
+        """
+        get maximum number of shots of a single circuit allowed by the device
+        Returns: maximum number of shots, none if the device does not report it
+
+        """
+        return getattr(self.backend.configuration(), "max_shots", None)
+
+    def _run_circuit(self, circuit: QuantumCircuit, num_shots: int, memory: bool = False) -> Result:
         """
         execute a given on a IBMQ device (which one is specified in constructor)
         Args:
             circuit: QuantumCircuit to execute
             num_shots: number of shots to run the circuit with
+            memory: if true per shot measurement results are stored in the result
 
         Returns: qiskit result
 
         """
-        transpiled_circuit = transpile(circuit, self.backend)
-        job = self.backend.run(transpiled_circuit, shots=num_shots)
-        job_monitor(job, interval=2)
+        transpiled_circuit = self.transpilation_cache.transpile([circuit], self.backend)[0]
+        job = self.backend.run(transpiled_circuit, shots=num_shots, memory=memory)
+        job_monitor(job, interval=self.poll_interval)
         return job.result()
+
+    def get_experiment_results(
+            self, test_case: TestCase, num_experiments: Union[int, None] = None,
+            measurement_plan: Union[MeasurementPlan, None] = None) -> List[Dict[str, Tuple[Result, QuantumCircuit]]]:
+        """
+        run experiments of a test case, if more than one job can be in flight each measurement circuit of each
+        experiment is submitted as a separate job without waiting for the previous ones
+        Args:
+            test_case: test case to run
+            num_experiments: number of experiments to run, none for all experiments of the test case
+            measurement_plan: measurement circuits of the test case, none to create them
+
+        Returns: list (one element per experiment) of mappings between measurement encoding and the result and
+        circuit in which that measurement was done
+
+        """
+        if self.max_concurrent_jobs <= 1 or self.batch_experiments or self.split_memory:
+            return super().get_experiment_results(test_case, num_experiments, measurement_plan)
+
+        num_experiments, measurement_plan = self._get_experiment_setup(test_case, num_experiments, measurement_plan)
+        circuits = list(measurement_plan.circuits) * num_experiments
+        transpiled_circuits = self.transpilation_cache.transpile(circuits, self.backend)
+        circuit_results = run_by_num_shots(
+            [[transpiled_circuit] for transpiled_circuit in transpiled_circuits],
+            measurement_plan.get_num_shots(test_case.num_measurements) * num_experiments, self._run_jobs)
+        return self._demultiplex_results(measurement_plan, circuit_results, num_experiments)
+
+    def _run_circuits(self, circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        execute given circuits on a IBMQ device (which one is specified in constructor), circuits are submitted in
+        as few jobs as the device allows
+        Args:
+            circuits: list of QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        transpiled_circuits = self.transpilation_cache.transpile(circuits, self.backend)
+        return self._run_transpiled_circuits(transpiled_circuits, num_shots, memory)
+
+    def _run_transpiled_circuits(
+            self, transpiled_circuits: List[QuantumCircuit], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        execute circuits already transpiled for the IBMQ device, circuits are submitted in as few jobs as the device
+        allows
+        Args:
+            transpiled_circuits: list of transpiled QuantumCircuits to execute
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in the same order as circuits)
+
+        """
+        max_experiments = getattr(self.backend.configuration(), "max_experiments", None) or len(transpiled_circuits)
+        jobs_circuits = [
+            transpiled_circuits[i:i + max_experiments] for i in range(0, len(transpiled_circuits), max_experiments)]
+        if self.max_concurrent_jobs > 1:
+            return self._run_jobs(jobs_circuits, num_shots, memory)
+
+        results = []
+        for job_circuits in jobs_circuits:
+            job = self.backend.run(job_circuits, shots=num_shots, memory=memory)
+            job_monitor(job, interval=self.poll_interval)
+            results.extend(split_result(job.result()))
+        return results
+
+    def _runs_experiments_separately(self) -> bool:
+        """
+        check if get_experiment_results runs each experiment separately with get_test_results
+        Returns: true if experiments are run separately (not submitted as concurrent jobs)
+
+        """
+        return super()._runs_experiments_separately() and self.max_concurrent_jobs <= 1
+
+    def _run_jobs(
+            self, jobs_circuits: List[List[QuantumCircuit]], num_shots: int, memory: bool = False) -> List[Result]:
+        """
+        run jobs keeping at most max_concurrent_jobs of them in flight, statuses of jobs in flight are polled together
+        and results are gathered as jobs complete (next job is submitted as soon as one completes)
+        Args:
+            jobs_circuits: list of transpiled circuits to run in each job
+            num_shots: number of shots to run each circuit with
+            memory: if true per shot measurement results are stored in the results
+
+        Returns: list of qiskit results, one for each circuit (in order of jobs and circuits in them)
+
+        """
+        jobs_to_submit = list(enumerate(jobs_circuits))[::-1]
+        jobs_in_flight = {}
+        jobs_results = [[] for _ in jobs_circuits]
+        while len(jobs_to_submit) > 0 or len(jobs_in_flight) > 0:
+            while len(jobs_to_submit) > 0 and len(jobs_in_flight) < self.max_concurrent_jobs:
+                job_index, job_circuits = jobs_to_submit.pop()
+                jobs_in_flight[job_index] = self.backend.run(job_circuits, shots=num_shots, memory=memory)
+
+            completed_jobs = [
+                job_index for job_index, job in jobs_in_flight.items() if job.status() in JOB_FINAL_STATES]
+            if len(completed_jobs) == 0:
+                sleep(self.poll_interval)
+            for job_index in completed_jobs:
+                jobs_results[job_index] = split_result(jobs_in_flight.pop(job_index).result())
+        return [result for job_results in jobs_results for result in job_results]
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from hashlib import sha256
+from inspect import isclass
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from numpy import ndarray
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Barrier, Instruction, Measure, Reset
+from qiskit.circuit.library import standard_gates
+from qiskit.extensions import Initialize
+from qiskit.providers import Backend
+
+# definitions of these instructions are built from their name and parameters, so they are not fingerprinted (building
+# them is far more expensive than the rest of the fingerprint, e.g. state preparation of initialize)
+_parameter_defined_instructions = frozenset(
+    [value for value in vars(standard_gates).values() if isclass(value) and issubclass(value, Instruction)] +
+    [Barrier, Initialize, Measure, Reset])
+
+
+class TranspilationCache:
+    """
+    least recently used cache of transpiled circuits, circuits are keyed by their structural fingerprint (gates, their
+    parameters and the bits they act on, ignoring circuit and register names) and the backend they are transpiled for,
+    the cache can be shared by threads running test cases concurrently
+    """
+    def __init__(self, max_size: int = 256) -> None:
+        """
+        initialize
+        Args:
+            max_size: maximum number of transpiled circuits stored, least recently used circuits are evicted first,
+            0 disables caching
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._transpiled_circuits = OrderedDict()
+        self._lock = Lock()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def transpile(self, circuits: List[QuantumCircuit], backend: Backend) -> List[QuantumCircuit]:
+        """
+        transpile circuits for a backend, circuits structurally identical to already transpiled ones are not transpiled
+        again
+        Args:
+            circuits: circuits to transpile
+            backend: backend for which to transpile the circuits
+
+        Returns: list of transpiled circuits (in the same order as circuits)
+
+        """
+        backend_key = self._get_backend_key(backend)
+        keys = [self.get_fingerprint(circuit) + backend_key for circuit in circuits]
+        with self._lock:
+            transpiled_circuits, circuits_to_transpile = self._look_up(keys, circuits)
+
+        # transpilation is done without the lock so that test cases run concurrently don't wait for each other
+        if len(circuits_to_transpile) > 0:
+            newly_transpiled = transpile(list(circuits_to_transpile.values()), backend)
+            transpiled_circuits.update(zip(circuits_to_transpile.keys(), newly_transpiled))
+            with self._lock:
+                for key in circuits_to_transpile.keys():
+                    self._store(key, transpiled_circuits[key])
+
+        return [transpiled_circuits[key] for key in keys]
+
+    def _look_up(
+            self, keys: List[str],
+            circuits: List[QuantumCircuit]) -> Tuple[Dict[str, QuantumCircuit], Dict[str, QuantumCircuit]]:
+        """
+        look up circuits in the cache, must be called holding the lock
+        Args:
+            keys: cache keys of the circuits
+            circuits: circuits to look up
+
+        Returns: tuple of mappings between keys and cached transpiled circuits and between keys and circuits that need
+        to be transpiled (each key once)
+
+        """
+        transpiled_circuits = {}
+        circuits_to_transpile = {}
+        for key, circuit in zip(keys, circuits):
+            if key in transpiled_circuits or key in circuits_to_transpile:
+                self.hits += 1
+            elif key in self._transpiled_circuits:
+                self.hits += 1
+                self._transpiled_circuits.move_to_end(key)
+                transpiled_circuits[key] = self._transpiled_circuits[key]
+            else:
+                self.misses += 1
+                circuits_to_transpile[key] = circuit
+        return transpiled_circuits, circuits_to_transpile
+
+    def _store(self, key: str, transpiled_circuit: QuantumCircuit) -> None:
+        """
+        store transpiled circuit evicting least recently used circuits if cache is full, must be called holding the lock
+        Args:
+            key: key of the circuit
+            transpiled_circuit: transpiled circuit to store
+
+        Returns: None
+
+        """
+        if self.max_size <= 0:
+            return
+        self._transpiled_circuits[key] = transpiled_circuit
+        while len(self._transpiled_circuits) > self.max_size:
+            self._transpiled_circuits.popitem(last=False)
+
+    @staticmethod
+    def get_fingerprint(circuit: QuantumCircuit) -> str:
+        """
+        get structural fingerprint of a circuit, circuits that differ only by circuit or register names have the same
+        fingerprint
+        Args:
+            circuit: circuit to fingerprint
+
+        Returns: hex digest identifying the circuit structure
+
+        """
+        digest = sha256()
+        TranspilationCache._update_digest(digest, circuit)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _update_digest(digest, circuit: QuantumCircuit) -> None:
+        """
+        feed circuit structure into the digest, custom instructions are fingerprinted by their definition since their
+        names are not unique, standard gates are identified by their name and parameters
+        Args:
+            digest: hashlib object to update
+            circuit: circuit to feed into the digest
+
+        Returns: None
+
+        """
+        bit_indices = TranspilationCache._get_bit_indices(circuit)
+        registers = [register.size for register in circuit.qregs + circuit.cregs]
+        digest.update(repr((circuit.num_qubits, circuit.num_clbits, registers, circuit.global_phase)).encode())
+        for instruction, qargs, cargs in circuit.data:
+            params = [param.tobytes().hex() if isinstance(param, ndarray) else repr(param) for param in instruction.params]
+            bits = [bit_indices[bit] for bit in qargs + cargs]
+            digest.update(repr((instruction.name, params, bits)).encode())
+            if type(instruction) not in _parameter_defined_instructions and instruction.definition is not None:
+                TranspilationCache._update_digest(digest, instruction.definition)
+
+    @staticmethod
+    def _get_bit_indices(circuit: QuantumCircuit) -> Dict[object, int]:
+        bit_indices = {}
+        for index, qubit in enumerate(circuit.qubits):
+            bit_indices[qubit] = index
+        for index, clbit in enumerate(circuit.clbits):
+            bit_indices[clbit] = index
+        return bit_indices
+
+    @staticmethod
+    def _get_backend_key(backend: Backend) -> str:
+        configuration = backend.configuration()
+        return f"-{backend.name()}-{configuration.backend_version}"
@@ -0,0 +1,142 @@
+from collections import Counter
+from typing import Callable, Dict, List, Sequence, TypeVar
+
+from numpy import array
+from numpy.random import Generator
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResult, ExperimentResultData
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def split_result(result: Result) -> List[Result]:
+    """
+    split result of a job that executed multiple circuits into results of single circuits, so that each of them can
+    be parsed as if the circuit was run on its own
+    Args:
+        result: qiskit result of a job with one or more experiments
+
+    Returns: list of qiskit results holding one experiment each (in order in which circuits were submitted)
+
+    """
+    split_results = []
+    for experiment_result in result.results:
+        split_results.append(Result(
+            backend_name=result.backend_name, backend_version=result.backend_version, qobj_id=result.qobj_id,
+            job_id=result.job_id, success=experiment_result.success, results=[experiment_result], date=result.date,
+            status=result.status, header=result.header))
+    return split_results
+
+
+def split_memory(result: Result, num_experiments: int) -> List[Result]:
+    """
+    split per shot memory of a single circuit result into equally sized consecutive slices, each slice is turned into
+    result holding counts as if it was a separate run of the circuit
+    Args:
+        result: qiskit result of a single circuit run with memory=True
+        num_experiments: number of experiments to split the shots into
+
+    Returns: list of qiskit results holding counts of one experiment each
+
+    """
+    experiment_result = result.results[0]
+    memory = experiment_result.data.memory
+    num_shots = len(memory) // num_experiments
+    split_results = []
+    for i in range(num_experiments):
+        counts = Counter(memory[i * num_shots:(i + 1) * num_shots])
+        split_experiment_result = ExperimentResult(
+            shots=num_shots, success=experiment_result.success, data=ExperimentResultData(counts=dict(counts)),
+            header=experiment_result.header, **_get_metadata(experiment_result))
+        split_results.append(Result(
+            backend_name=result.backend_name, backend_version=result.backend_version, qobj_id=result.qobj_id,
+            job_id=result.job_id, success=result.success, results=[split_experiment_result], date=result.date,
+            status=result.status, header=result.header))
+    return split_results
+
+
+def _get_metadata(experiment_result: ExperimentResult) -> Dict[str, Dict]:
+    """
+    get metadata of an experiment result (e.g. simulation method used) to carry over to results derived from it
+    Args:
+        experiment_result: qiskit experiment result
+
+    Returns: keyword arguments of ExperimentResult holding the metadata, empty if result has no metadata
+
+    """
+    metadata = getattr(experiment_result, "metadata", None)
+    return {"metadata": metadata} if metadata is not None else {}
+
+
+def bind_parameters_by_name(circuit: QuantumCircuit, parameter_binds: Dict[Parameter, float]) -> QuantumCircuit:
+    """
+    bind parameters to a circuit matching them by name instead of identity, transpiled circuits taken from the
+    transpilation cache may hold parameters of a structurally identical template created earlier
+    Args:
+        circuit: parametrized circuit
+        parameter_binds: parameter values to bind
+
+    Returns: circuit with bound parameters
+
+    """
+    parameters = {parameter.name: parameter for parameter in circuit.parameters}
+    return circuit.bind_parameters({parameters[parameter.name]: value for parameter, value in parameter_binds.items()})
+
+
+def sample_results(
+        result: Result, probabilities: Dict[int, float], num_shots: int, num_experiments: int,
+        random_generator: Generator) -> List[Result]:
+    """
+    sample counts of experiments from exact probabilities of outcomes of a circuit, each experiment is turned into
+    result holding counts as if the circuit was run with num_shots shots
+    Args:
+        result: qiskit result of a single circuit whose header describes classical registers of the circuit
+        probabilities: probabilities of outcomes, outcome integer encodes values of classical bits (bit i is clbit i)
+        num_shots: number of shots of each experiment
+        num_experiments: number of experiments to sample
+        random_generator: numpy random generator used for sampling
+
+    Returns: list of qiskit results holding counts of one experiment each
+
+    """
+    experiment_result = result.results[0]
+    outcomes = list(probabilities.keys())
+    outcome_probabilities = array([probabilities[outcome] for outcome in outcomes])
+    outcome_probabilities /= outcome_probabilities.sum()
+    sampled_counts = random_generator.multinomial(num_shots, outcome_probabilities, size=num_experiments)
+    sampled_results = []
+    for experiment_counts in sampled_counts:
+        counts = {hex(outcome): int(count) for outcome, count in zip(outcomes, experiment_counts) if count > 0}
+        sampled_experiment_result = ExperimentResult(
+            shots=num_shots, success=experiment_result.success, data=ExperimentResultData(counts=counts),
+            header=experiment_result.header)
+        sampled_results.append(Result(
+            backend_name=result.backend_name, backend_version=result.backend_version, qobj_id=result.qobj_id,
+            job_id=result.job_id, success=result.success, results=[sampled_experiment_result], date=result.date,
+            status=result.status, header=result.header))
+    return sampled_results
+
+
+def run_by_num_shots(items: Sequence[T], num_shots: Sequence[int], run: Callable[[List[T], int], List[R]]) -> List[R]:
+    """
+    run items (circuits or jobs) that need different number of shots, items with the same number of shots are run
+    together by a single call so circuits which all share the number of shots are run exactly as before
+    Args:
+        items: items to run
+        num_shots: number of shots of each item (respectively to items)
+        run: function running a list of items with given number of shots, returning one result per item
+
+    Returns: list of results (in the same order as items)
+
+    """
+    groups: Dict[int, List[int]] = {}
+    for index, item_shots in enumerate(num_shots):
+        groups.setdefault(item_shots, []).append(index)
+    results = [None] * len(items)
+    for group_shots, indices in groups.items():
+        for index, result in zip(indices, run([items[index] for index in indices], group_shots)):
+            results[index] = result
+    return results
@@ -1,8 +1,10 @@
 import pytest
+from numpy import array
 from qiskit.quantum_info import Statevector
 
 from qiskit_check.property_test.assertions import AssertProbability
 from qiskit_check.property_test.resources import Qubit, AnyRange, ConcreteQubit
+from qiskit_check.property_test.test_results import ArrayTestResult
 from qiskit_check.property_test.test_results.test_result import TestResult
 
 
@@ -14,6 +16,27 @@ class TestAssertProbability:
         
         assert assert_entangled.combiner([[{"0": 90, "1": 10}]*20]) == [[0.9]*20]
 
+    def test_vectorized_combiner_returns_probabilities_of_each_instruction_and_experiment(self):
+        qubit = Qubit(AnyRange())
+        assert_probability = AssertProbability(qubit, "1", None)
+
+        probabilities = assert_probability.vectorized_combiner(array([[[90, 10], [50, 50]], [[0, 20], [15, 5]]]))
+
+        assert probabilities.tolist() == [[0.1, 0.5], [1, 0.25]]
+
+    def test_get_p_value_equal_when_combined_from_arrays(self):
+        q0 = Qubit(AnyRange())
+        resource_matcher = {q0: ConcreteQubit(0, Statevector([1, 0]))}
+        assert_probability = AssertProbability(q0, "0", 0.9)
+        counts = [{"0": 90 + i % 3, "1": 10 - i % 3} for i in range(20)]
+        outcome_counts = array([[[experiment["0"], experiment["1"]] for experiment in counts]])
+        test_results = TestResult({q0: assert_probability.combiner([counts])}, [])
+        array_test_results = ArrayTestResult(
+            outcome_counts, (q0, ), (0, ), 1, assert_probability.combiner, assert_probability.vectorized_combiner)
+
+        assert assert_probability.get_p_value(array_test_results, resource_matcher, 100, 20) == \
+               pytest.approx(assert_probability.get_p_value(test_results, resource_matcher, 100, 20))
+
 
     def test_get_p_value_returns_0_when_wrong_probability(self):
         q0 = Qubit(AnyRange())
@@ -4,6 +4,8 @@ import pytest
 from qiskit.quantum_info import Statevector
 
 from qiskit_check.property_test.assertions import AssertStateEqualConcreteValue
+from qiskit_check.property_test.classical_shadows import get_shadow_bases
+from qiskit_check.property_test.property_test_errors import IncorrectPropertyTestError
 from qiskit_check.property_test.resources import Qubit, AnyRange, ConcreteQubit
 from qiskit_check.property_test.test_results.test_result import TestResult
 
@@ -39,6 +41,23 @@ class TestStateEqual:
 
         assert 0 == assert_equal.get_p_value(test_results, resource_matcher, num_measurements, num_experiments)
 
+    def test_get_p_value_returns_1_if_state_equal_in_shadow_mode(self):
+        q0 = Qubit(AnyRange())
+        num_experiments = 64
+        # state -z, every setting measures -1 in z basis and 0 in x and y basis on average
+        z_settings = get_shadow_bases(6, 0) == 2
+        expectations = [[-1 if is_z else 0] * num_experiments for is_z in z_settings]
+        test_results = TestResult({q0: expectations}, [[{}]])
+        resource_matcher = {q0: ConcreteQubit(0, Statevector([1, 0]))}
+        assert_equal = AssertStateEqualConcreteValue(q0, (pi, 0), num_shadow_settings=6)
+
+        assert len(assert_equal.measurements) == 6
+        assert 1 == assert_equal.get_p_value(test_results, resource_matcher, 100, num_experiments)
+
+    def test_init_raises_error_when_shadow_settings_not_multiple_of_3(self):
+        with pytest.raises(IncorrectPropertyTestError):
+            AssertStateEqualConcreteValue(Qubit(AnyRange()), (pi, 0), num_shadow_settings=4)
+
     def test_verify_throws_assertion_error_when_not_equal(self):
         q0 = Qubit(AnyRange())
 
@@ -0,0 +1,46 @@
+import pytest
+from numpy import array
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from qiskit_check.property_test.classical_shadows import ShadowMeasurement, get_shadow_bases, \
+    get_shadow_bloch_vectors, get_shadow_expectations, get_shadow_measurements, shadow_bases
+
+
+class TestClassicalShadows:
+    def test_get_shadow_bases_uses_each_basis_equally_when_ok_input(self):
+        bases = get_shadow_bases(9, 4)
+
+        assert sorted(bases.tolist()) == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+        assert (get_shadow_bases(9, 4) == bases).all()
+
+    def test_get_qubit_measurement_measures_eigenstate_of_basis_as_0(self):
+        eigenstates = {"x": [2 ** -0.5, 2 ** -0.5], "y": [2 ** -0.5, 1j * 2 ** -0.5], "z": [1, 0]}
+        for qubit_index in range(3):
+            for measurement in get_shadow_measurements(6):
+                basis = shadow_bases[get_shadow_bases(6, qubit_index)[measurement.setting]]
+                instruction = measurement.get_qubit_measurement(qubit_index)
+                circuit = QuantumCircuit(1)
+                circuit.compose(instruction.definition.remove_final_measurements(inplace=False), inplace=True)
+
+                state = Statevector(eigenstates[basis])
+                assert instruction.name == measurement.name
+                assert state.evolve(circuit).probabilities()[0] == pytest.approx(1)
+
+    def test_shadow_measurement_named_by_setting(self):
+        measurement = ShadowMeasurement(2, 6)
+
+        assert measurement.basis == measurement.name == "shadow_2_6"
+        assert measurement.definition.data[0][0].name == "measure"
+
+    def test_get_shadow_expectations_returns_expectation_of_each_setting(self):
+        counts = array([[[10, 0], [5, 5]], [[2, 8], [0, 10]], [[7, 3], [3, 7]]])
+
+        assert get_shadow_expectations(counts) == pytest.approx(array([[1, 0], [-0.6, -1], [0.4, -0.4]]))
+
+    def test_get_shadow_bloch_vectors_averages_settings_of_each_basis(self):
+        bases = get_shadow_bases(6, 1)
+        expectations = array([[[0.2], [-0.4], [1.0]][basis] for basis in bases])
+        expectations[bases == 0] = [[0.1], [0.3]]
+
+        assert get_shadow_bloch_vectors(expectations, 1) == pytest.approx(array([[0.2], [-0.4], [1.0]]))
@@ -0,0 +1,89 @@
+from numpy import array
+
+from qiskit_check.property_test.resources import Qubit, AnyRange
+from qiskit_check.property_test.test_results import ArrayTestResult
+from qiskit_check.property_test.test_results.array_test_result import SparseOutcomeCounts, get_count_array, \
+    get_outcome
+
+
+class TestArrayTestResult:
+    def test_get_marginal_counts_sums_over_other_qubits(self):
+        q0 = Qubit(AnyRange())
+        q1 = Qubit(AnyRange())
+        # outcomes 00, 01 (q0 = 1), 10 (q1 = 1), 11
+        outcome_counts = array([[[1, 2, 3, 4], [5, 0, 0, 5]]])
+        test_result = ArrayTestResult(outcome_counts, (q0, q1), (2, 0), 3, lambda x: x)
+
+        assert test_result.get_marginal_counts(q0).tolist() == [[[4, 6], [5, 5]]]
+        assert test_result.get_marginal_counts(q1).tolist() == [[[3, 7], [5, 5]]]
+
+    def test_sparse_outcome_counts_give_the_same_marginal_counts_and_counts_as_dense_array(self):
+        q0 = Qubit(AnyRange())
+        q1 = Qubit(AnyRange())
+        outcome_counts = array([[[1, 2, 0, 4], [5, 0, 0, 5]], [[0, 0, 7, 0], [0, 3, 3, 0]]])
+        sparse_outcome_counts = SparseOutcomeCounts(4, [
+            [array([3, 0, 1]), array([0, 3])], [array([2]), array([2, 1])]], [
+            [array([4, 1, 2]), array([5, 5])], [array([7]), array([3, 3])]])
+        test_result = ArrayTestResult(outcome_counts, (q0, q1), (2, 0), 3, lambda x: x)
+        sparse_test_result = ArrayTestResult(sparse_outcome_counts, (q0, q1), (2, 0), 3, lambda x: x)
+
+        assert sparse_test_result.num_instructions == 2
+        assert sparse_test_result.num_experiments == 2
+        for qubit in (q0, q1):
+            assert sparse_test_result.get_marginal_counts(qubit).tolist() == \
+                test_result.get_marginal_counts(qubit).tolist()
+        assert sparse_test_result.counts == test_result.counts
+        assert sparse_outcome_counts.head(1).get_marginal_counts(0).tolist() == [[[1, 6]], [[7, 0]]]
+
+    def test_counts_keyed_by_qubit_index_when_accessed(self):
+        q0 = Qubit(AnyRange())
+        q1 = Qubit(AnyRange())
+        outcome_counts = array([[[1, 2, 0, 4]], [[0, 0, 7, 0]]])
+        test_result = ArrayTestResult(outcome_counts, (q0, q1), (2, 0), 3, lambda x: x)
+
+        assert test_result.counts == [[{"0-0": 1, "0-1": 2, "1-1": 4}], [{"1-0": 7}]]
+
+    def test_individual_measurements_combine_counts_dicts_of_each_qubit(self):
+        q0 = Qubit(AnyRange())
+        q1 = Qubit(AnyRange())
+        outcome_counts = array([[[1, 2, 3, 4]]])
+
+        def combiner(experiments):
+            return [[experiment["1"] / sum(experiment.values()) for experiment in instruction] for instruction in experiments]
+
+        test_result = ArrayTestResult(outcome_counts, (q0, q1), (0, 1), 2, combiner)
+
+        assert test_result.get_qubit_counts(q0) == [[{"0": 4, "1": 6}]]
+        assert test_result.individual_measurements == {q0: [[0.6]], q1: [[0.7]]}
+
+    def test_individual_measurements_use_vectorized_combiner_when_given(self):
+        q0 = Qubit(AnyRange())
+        q1 = Qubit(AnyRange())
+        outcome_counts = array([[[1, 2, 3, 4]]])
+
+        def combiner(_):
+            raise AssertionError("vectorized combiner should be used")
+
+        test_result = ArrayTestResult(outcome_counts, (q0, q1), (0, 1), 2, combiner, lambda counts: counts[..., 1])
+
+        assert test_result.individual_measurements[q0].tolist() == [[6]]
+        assert test_result.individual_measurements[q1].tolist() == [[7]]
+
+    def test_get_count_array_returns_counts_of_each_state(self):
+        assert get_count_array([[{"0": 1, "1": 2}, {"1": 3}], [{"0": 4}, {}]]).tolist() == [
+            [[1, 2], [0, 3]], [[4, 0], [0, 0]]]
+
+    def test_get_outcome_returns_bits_of_measured_qubits(self):
+        assert get_outcome("1-0", (0, 2)) == 1
+        assert get_outcome("1-0", (2, 0)) == 2
+        assert get_outcome("011", (0, 1, 2)) == 6
+
+    def test_counts_and_individual_measurements_can_be_assigned(self):
+        q0 = Qubit(AnyRange())
+        test_result = ArrayTestResult(array([[[1, 2]]]), (q0,), (0,), 1, lambda x: x)
+
+        test_result.counts = [[{"0": 3}]]
+        test_result.individual_measurements = {q0: [[0.0]]}
+
+        assert test_result.counts == [[{"0": 3}]]
+        assert test_result.individual_measurements == {q0: [[0.0]]}
@@ -0,0 +1,42 @@
+import pytest
+from numpy import array, nan
+from scipy.stats import combine_pvalues, ttest_1samp
+
+from qiskit_check.property_test.statistics import OneSampleTTests, combine_p_values, get_combined_p_values, \
+    get_t_test_p_values
+
+
+class TestStatistics:
+    def test_get_t_test_p_values_equal_to_scipy_when_ok_input(self):
+        samples = array([[0.1, 0.3, 0.2, 0.25], [0.9, 0.8, 0.85, 0.95]])
+
+        p_values = get_t_test_p_values(samples, array([0.2, 0.8]))
+
+        assert p_values == pytest.approx([ttest_1samp(samples[0], 0.2).pvalue, ttest_1samp(samples[1], 0.8).pvalue])
+
+    def test_get_t_test_p_values_omits_nan_samples(self):
+        p_values = get_t_test_p_values(array([[0.1, nan, 0.3, 0.2]]), array([0.5]))
+
+        assert p_values == pytest.approx([ttest_1samp([0.1, 0.3, 0.2], 0.5).pvalue])
+
+    def test_get_t_test_p_values_returns_1_when_samples_equal_expected_mean(self):
+        assert get_t_test_p_values(array([[0.9] * 20, [0.5] + [nan] * 19]), array([0.9, 0.1])).tolist() == [1, 1]
+
+    def test_get_t_test_p_values_returns_0_when_samples_constant_and_not_expected(self):
+        assert get_t_test_p_values(array([[0.0] * 20]), array([0.5])).tolist() == [0]
+
+    def test_combine_p_values_equal_to_scipy_fisher_method(self):
+        combined = combine_p_values(array([0.1, 0.5, 0.01, 0.3, 0.7]), [2, 3])
+
+        assert combined == pytest.approx([combine_pvalues([0.1, 0.5])[1], combine_pvalues([0.01, 0.3, 0.7])[1]])
+
+    def test_get_combined_p_values_equal_to_separate_computation_when_tests_stacked(self):
+        t_tests = [
+            OneSampleTTests([[0.1, 0.3, 0.2, 0.25], [0.9, 0.8, 0.85, 0.95]], [0.2, 0.8]),
+            OneSampleTTests([[0.4, 0.6, 0.55]], 0.3),
+        ]
+
+        combined = get_combined_p_values(t_tests)
+
+        assert combined == pytest.approx([get_combined_p_values([t_tests[0]])[0], get_combined_p_values([t_tests[1]])[0]])
+        assert combined[1] == pytest.approx(ttest_1samp([0.4, 0.6, 0.55], 0.3).pvalue)
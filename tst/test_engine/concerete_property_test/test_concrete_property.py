@@ -47,6 +47,12 @@ class ZeroExamplePropertyTest(ExamplePropertyTest):
         return 0
 
 
+class ThreeExamplePropertyTest(ExamplePropertyTest):
+    @staticmethod
+    def num_test_cases() -> int:
+        return 3
+
+
 class TestConcretePropertyTest:
     def test_iterator_doesnt_iterate_when_negative_test_count(self, mocker: MockFixture):
         property_test = ConcretePropertyTest(NegativeExamplePropertyTest, mocker.MagicMock(), mocker.MagicMock())
@@ -65,3 +71,22 @@ class TestConcretePropertyTest:
     def test_iter_returns_proper_iterator(self, mocker: MockFixture):
         property_test = ConcretePropertyTest(ZeroExamplePropertyTest, mocker.MagicMock(), mocker.MagicMock())
         assert isinstance(property_test.__iter__(), ConcretePropertyTestIterator)
+
+    def test_get_test_cases_seeds_input_generator_with_key_when_seeded(self, mocker: MockFixture):
+        generator_factory = mocker.MagicMock()
+        property_test = ConcretePropertyTest(ThreeExamplePropertyTest, mocker.MagicMock(), generator_factory)
+        property_test.get_test_cases(3)
+        seed = generator_factory.build.return_value.seed.call_args[0][0]
+        assert seed.entropy == 3
+        assert seed.spawn_key == (property_test.get_key(), )
+
+    def test_get_test_cases_doesnt_seed_input_generator_when_not_seeded(self, mocker: MockFixture):
+        generator_factory = mocker.MagicMock()
+        property_test = ConcretePropertyTest(ThreeExamplePropertyTest, mocker.MagicMock(), generator_factory)
+        property_test.get_test_cases()
+        generator_factory.build.return_value.seed.assert_not_called()
+
+    def test_get_key_differs_between_property_tests(self, mocker: MockFixture):
+        key = ConcretePropertyTest(ThreeExamplePropertyTest, mocker.MagicMock(), mocker.MagicMock()).get_key()
+        assert key == ConcretePropertyTest(ThreeExamplePropertyTest, mocker.MagicMock(), mocker.MagicMock()).get_key()
+        assert key != ConcretePropertyTest(ZeroExamplePropertyTest, mocker.MagicMock(), mocker.MagicMock()).get_key()
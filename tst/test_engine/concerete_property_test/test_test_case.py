@@ -78,3 +78,15 @@ class TestTestCase:
 
         assessor_factor.build.assert_called_once()
         qubit_input_generator.generate.assert_called_once()
+
+    def test_generate_returns_template_bound_to_initial_state_when_correct_input(self, mocker: MockFixture):
+        assessor_factor = mocker.patch.object(AssessorFactory, "build")
+        qubit_input_generator = mocker.patch.object(QubitInputGenerator, "generate")
+        qubit_input_generator.generate.return_value = [Statevector([0, 1j])]
+        test_case_generator = TestCaseGenerator(PropertyTestExample, assessor_factor, qubit_input_generator)
+        first_test_case = test_case_generator.generate()
+        second_test_case = test_case_generator.generate()
+
+        assert first_test_case.template is second_test_case.template
+        bound_circuit = first_test_case.template.bind_parameters(first_test_case.parameter_binds)
+        assert Statevector(bound_circuit).equiv(Statevector([0, 1j]))
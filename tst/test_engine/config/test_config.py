@@ -0,0 +1,27 @@
+from qiskit_check.test_engine.config import Config
+from qiskit_check.test_engine.main import get_argument_parser
+
+
+def write_config(path, num_workers: int) -> str:
+    config_path = path / "config.yaml"
+    config_path.write_text(
+        "test_runner:\n"
+        "  class: \"qiskit_check.test_engine.test_runner.SimulatorTestRunner\"\n"
+        "  args:\n"
+        "    simulator_name: \"aer_simulator\"\n"
+        "    printer:\n"
+        "      class: \"qiskit_check.test_engine.printers.TerminalPrinter\"\n"
+        f"    num_workers: {num_workers}\n")
+    return str(config_path)
+
+
+class TestConfig:
+    def test_get_test_runner_keeps_configured_num_workers_when_workers_not_given(self, tmp_path):
+        args = get_argument_parser().parse_args(["-t", "tests", "-c", write_config(tmp_path, 3)])
+        test_runner = Config(args.config).get_test_runner(args.workers)
+        assert test_runner.num_workers == 3
+
+    def test_get_test_runner_overrides_configured_num_workers_when_workers_given(self, tmp_path):
+        args = get_argument_parser().parse_args(["-t", "tests", "-c", write_config(tmp_path, 3), "-j", "2"])
+        test_runner = Config(args.config).get_test_runner(args.workers)
+        assert test_runner.num_workers == 2
@@ -92,6 +92,15 @@ class TestInputGenerator:
         for state in generated:
             assert state != bad_state
 
+    @pytest.mark.parametrize("generator_factory", generator_factories)
+    def test_generate_same_states_when_seeded_with_same_seed(self, generator_factory):
+        qubits = [Qubit(AnyRange()), Qubit(QubitRange(0, pi/3, pi/4, pi/2))]
+        generated = []
+        for _ in range(2):
+            generator = generator_factory.build()
+            generator.seed(5)
+            generated.append([generator.generate(qubits) for _ in range(3)])
+        assert generated[0] == generated[1]
 
     @staticmethod
     def assert_in_range(qubit_range: QubitRange, generated_value: Statevector):
@@ -3,17 +3,20 @@ from unittest.mock import ANY
 
 import pytest
 from pytest_mock import MockFixture
-from qiskit import QuantumCircuit
+from qiskit import Aer, QuantumCircuit
 from qiskit.circuit import Measure
+from qiskit.quantum_info import Statevector
 
+from qiskit_check.test_engine import assessor as assessor_module
 from qiskit_check.test_engine.assessor import Assessor, AssessorFactory
 from qiskit_check.test_engine.p_value_correction import AbstractCorrection
 from qiskit_check.property_test import PropertyTest
-from qiskit_check.property_test.assertions import AbstractAssertion
+from qiskit_check.property_test.assertions import AbstractAssertion, AssertProbability, AssertTrue
 from qiskit_check.property_test.property_test_errors import IncorrectAssertionError
 from qiskit_check.property_test.resources import Qubit, ConcreteQubit
 from qiskit_check.property_test.resources.qubit_range import AnyRange
 from qiskit_check.property_test.test_results import TestResult
+from qiskit_check.property_test.test_results.array_test_result import SparseOutcomeCounts
 
 
 class NotAssertion:
@@ -67,6 +70,8 @@ class TestAssessor:
         assertion1_mock.verify.side_effect = AssertionError()
         assertion1_mock.get_p_value.return_value = 0.001
         assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
 
         conf_level = 0.99
         experiment_results = mocker.MagicMock()
@@ -87,6 +92,8 @@ class TestAssessor:
         assertion1_mock = mocker.patch("qiskit_check.property_test.assertions.AbstractAssertion", spec=True)
         assertion1_mock.get_p_value.return_value = 0.001
         assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
 
         conf_level = 0.99
         experiment_results = mocker.MagicMock()
@@ -102,6 +109,194 @@ class TestAssessor:
             corrector.get_corrected_confidence_level.return_value, assertion1_mock.get_p_value.return_value)
         corrector.get_corrected_confidence_level.assert_called_once()
 
+    def test_assess_sequentially_stops_when_all_assertions_hold(self, mocker: MockFixture):
+        assertion1_mock = mocker.patch("qiskit_check.property_test.assertions.AbstractAssertion", spec=True)
+        assertion1_mock.get_p_value.return_value = 0.8
+        assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
+        corrector = mocker.MagicMock()
+        corrector.get_corrected_confidence_level.return_value = 0.99
+
+        assessor = Assessor([assertion1_mock], 0.99, mocker.MagicMock(), mocker.MagicMock)
+        assert assessor.assess_sequentially([{}] * 10, corrector, 5, 0, 0.1, futility_fraction=0.1)
+
+        assertion1_mock.get_p_value.assert_called_once_with(ANY, assessor.resource_matcher, 5, 10)
+        assertion1_mock.verify.assert_called_once_with(1 - 0.01 * 0.1 ** 3, 0.8)
+
+    def test_assess_sequentially_continues_when_all_assertions_hold_before_futility_fraction(
+            self, mocker: MockFixture):
+        assertion1_mock = mocker.patch("qiskit_check.property_test.assertions.AbstractAssertion", spec=True)
+        assertion1_mock.get_p_value.return_value = 0.8
+        assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
+        corrector = mocker.MagicMock()
+        corrector.get_corrected_confidence_level.return_value = 0.99
+
+        assessor = Assessor([assertion1_mock], 0.99, mocker.MagicMock(), mocker.MagicMock)
+        assert not assessor.assess_sequentially([{}] * 10, corrector, 5, 0.3, 0.4)
+        assert assessor.assess_sequentially([{}] * 10, corrector, 5, 0.4, 0.5)
+
+    def test_assess_sequentially_continues_when_assertion_undecided(self, mocker: MockFixture):
+        assertion1_mock = mocker.patch("qiskit_check.property_test.assertions.AbstractAssertion", spec=True)
+        assertion1_mock.get_p_value.return_value = 0.2
+        assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
+        corrector = mocker.MagicMock()
+        corrector.get_corrected_confidence_level.return_value = 0.99
+
+        assessor = Assessor([assertion1_mock], 0.99, mocker.MagicMock(), mocker.MagicMock)
+        assert not assessor.assess_sequentially([{}] * 10, corrector, 5, 0.1, 0.2)
+        assert assessor.assess_sequentially([{}] * 10, corrector, 5, 0.9, 1)
+
+    def test_assess_sequentially_spends_whole_significance_level_over_looks(self, mocker: MockFixture):
+        assertion1_mock = mocker.patch("qiskit_check.property_test.assertions.AbstractAssertion", spec=True)
+        assertion1_mock.get_p_value.return_value = 0.2
+        assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
+        corrector = mocker.MagicMock()
+        corrector.get_corrected_confidence_level.return_value = 0.95
+
+        assessor = Assessor([assertion1_mock], 0.95, mocker.MagicMock(), mocker.MagicMock)
+        fractions = [0, 0.25, 0.5, 0.75, 1]
+        for spent_fraction, fraction in zip(fractions, fractions[1:]):
+            assessor.assess_sequentially([{}] * 10, corrector, 5, spent_fraction, fraction)
+
+        spent = sum(1 - call.args[0] for call in assertion1_mock.verify.call_args_list)
+        assert spent == pytest.approx(0.05)
+
+    def test_assess_sequentially_assertion_error_when_assertion_fails(self, mocker: MockFixture):
+        assertion1_mock = mocker.patch("qiskit_check.property_test.assertions.AbstractAssertion", spec=True)
+        assertion1_mock.verify.side_effect = AssertionError()
+        assertion1_mock.get_p_value.return_value = 0
+        assertion1_mock.measurements = []
+        assertion1_mock.combiner = lambda counts: counts
+        assertion1_mock.get_one_sample_t_tests.return_value = None
+        corrector = mocker.MagicMock()
+        corrector.get_corrected_confidence_level.return_value = 0.99
+
+        assessor = Assessor([assertion1_mock], 0.99, mocker.MagicMock(), mocker.MagicMock)
+        with pytest.raises(AssertionError):
+            assessor.assess_sequentially([{}] * 10, corrector, 5, 0, 0.1)
+
+    def test_get_p_values_equal_when_results_parsed_ahead(self):
+        qubit = Qubit(AnyRange())
+        assessor = Assessor(
+            [AssertProbability(qubit, "0", 0.5)], 0.99, {qubit: ConcreteQubit(0, Statevector([1, 0]))}, {})
+        circuit = QuantumCircuit(1, 1)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        backend = Aer.get_backend("aer_simulator")
+        encoding = assessor.encode_measurement((qubit, ), None, Measure(), assessor.resource_matcher)
+        results = [{encoding: (backend.run(circuit, shots=100).result(), circuit)} for _ in range(5)]
+
+        parsed_results = assessor.parse_results(iter(results))
+
+        assert len(parsed_results) == 5
+        counts = results[0][encoding][0].get_counts()
+        assert parsed_results.get_outcome_counts(0).shape == (1, 5, 2)
+        assert list(parsed_results.get_outcome_counts(0)[0, 0]) == [counts.get("0", 0), counts.get("1", 0)]
+        assert assessor.get_p_values(parsed_results, 100, 5) == assessor.get_p_values(results, 100, 5)
+
+    def test_parse_results_parses_each_result_once_when_assertions_share_encoding(self, mocker: MockFixture):
+        qubit = Qubit(AnyRange())
+        assessor = Assessor(
+            [AssertProbability(qubit, "0", 0.5), AssertProbability(qubit, "1", 0.5)], 0.99,
+            {qubit: ConcreteQubit(0, Statevector([1, 0]))}, {})
+        circuit = QuantumCircuit(1, 1)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        backend = Aer.get_backend("aer_simulator")
+        encoding = assessor.encode_measurement((qubit, ), None, Measure(), assessor.resource_matcher)
+        results = [{encoding: (backend.run(circuit, shots=100).result(), circuit)} for _ in range(5)]
+        parse_counts_spy = mocker.spy(assessor_module, "parse_counts")
+
+        parsed_results = assessor.parse_results(results)
+
+        assert parse_counts_spy.call_count == 5
+        assert (parsed_results.get_outcome_counts(0) == parsed_results.get_outcome_counts(1)).all()
+
+    def test_parse_results_shares_measurement_of_the_same_basis_by_different_instructions(self):
+        qubit = Qubit(AnyRange())
+        z_measurement = QuantumCircuit(1, 1, name="measure_z")
+        z_measurement.x(0)
+        z_measurement.x(0)
+        z_measurement.measure(0, 0)
+        assessor = Assessor(
+            [AssertProbability(qubit, "0", 0.5), AssertProbability(qubit, "0", 0.5, (z_measurement.to_instruction(), ))],
+            0.99, {qubit: ConcreteQubit(0, Statevector([1, 0]))}, {})
+        circuit = QuantumCircuit(1, 1)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        backend = Aer.get_backend("aer_simulator")
+        encoding = assessor.encode_measurement((qubit, ), None, Measure(), assessor.resource_matcher)
+        results = [{encoding: (backend.run(circuit, shots=100).result(), circuit)} for _ in range(5)]
+
+        parsed_results = assessor.parse_results(results)
+
+        z_encoding = assessor.encode_measurement(
+            (qubit, ), None, z_measurement.to_instruction(), assessor.resource_matcher)
+        assert z_encoding == encoding
+        assert parsed_results.get_outcome_counts(1).sum() == 500
+        assert (parsed_results.get_outcome_counts(0) == parsed_results.get_outcome_counts(1)).all()
+
+    def test_parse_results_stores_counts_sparsely_when_qubits_have_more_outcomes_than_shots(self):
+        qubits = [Qubit(AnyRange()) for _ in range(3)]
+        assessor = Assessor(
+            [AssertTrue(qubits, lambda experiment, resource_matcher: 0, 0), AssertProbability(qubits[0], "0", 0.5)],
+            0.99, {qubit: ConcreteQubit(index, Statevector([1, 0])) for index, qubit in enumerate(qubits)}, {})
+        circuit = QuantumCircuit(3, 3)
+        circuit.h([0, 1, 2])
+        circuit.measure([0, 1, 2], [0, 1, 2])
+        backend = Aer.get_backend("aer_simulator")
+        measured_qubits = tuple(assessor.assertions[0].get_qubits())
+        encoding = assessor.encode_measurement(measured_qubits, None, Measure(), assessor.resource_matcher)
+        qubit_encoding = assessor.encode_measurement((qubits[0], ), None, Measure(), assessor.resource_matcher)
+        results = []
+        for _ in range(5):
+            result = backend.run(circuit, shots=4).result()
+            results.append({encoding: (result, circuit), qubit_encoding: (result, circuit)})
+
+        parsed_results = assessor.parse_results(results)
+
+        assert isinstance(parsed_results.get_outcome_counts(0), SparseOutcomeCounts)
+        assert parsed_results.get_outcome_counts(0).shape == (1, 5, 8)
+        assert not isinstance(parsed_results.get_outcome_counts(1), SparseOutcomeCounts)
+        assert assessor.get_test_result(parsed_results, 0).counts == [[
+            {state[::-1]: count for state, count in result[encoding][0].get_counts().items()} for result in results]]
+        assert (assessor.get_test_result(parsed_results, 0).get_marginal_counts(qubits[0]) ==
+                parsed_results.get_outcome_counts(1)).all()
+
+    def test_get_p_values_computes_t_tests_of_assertions_together(self, mocker: MockFixture):
+        q0 = Qubit(AnyRange())
+        q1 = Qubit(AnyRange())
+        assertions = [AssertProbability(q0, "0", 0.5), AssertProbability(q1, "1", 0.5)]
+        assessor = Assessor(
+            assertions, 0.99, {q0: ConcreteQubit(0, Statevector([1, 0])), q1: ConcreteQubit(1, Statevector([1, 0]))},
+            {})
+        circuit = QuantumCircuit(2, 2)
+        circuit.h([0, 1])
+        circuit.measure([0, 1], [0, 1])
+        backend = Aer.get_backend("aer_simulator")
+        results = []
+        for _ in range(5):
+            result = backend.run(circuit, shots=100).result()
+            results.append({
+                assessor.encode_measurement((qubit, ), None, Measure(), assessor.resource_matcher): (result, circuit)
+                for qubit in (q0, q1)})
+        combined_p_values_spy = mocker.spy(assessor_module, "get_combined_p_values")
+
+        p_values = assessor.get_p_values(results, 100, 5)
+
+        combined_p_values_spy.assert_called_once()
+        parsed_results = assessor.parse_results(results)
+        assert p_values == pytest.approx([
+            assertion.get_p_value(assessor.get_test_result(parsed_results, index), assessor.resource_matcher, 100, 5)
+            for index, assertion in enumerate(assertions)])
+
     def test_build_correct_result_when_list_of_assertions_provided(self, mocker: MockFixture):
         property_test = ExamplePropertyTest([ExampleAssertion(), ExampleAssertion()])
         resource_matcher = mocker.MagicMock()
@@ -127,3 +322,23 @@ class TestAssessor:
         assessor_factory = AssessorFactory()
         with pytest.raises(IncorrectAssertionError):
             assessor_factory.build(property_test, resource_matcher)
+
+    def test_encode_measurement_callable_on_class(self):
+        qubit = Qubit(AnyRange())
+        resource_matcher = {qubit: ConcreteQubit(1, Statevector([1, 0]))}
+        assessor = Assessor([AssertProbability(qubit, "0", 0.5)], 0.99, resource_matcher, {})
+
+        encoding = Assessor.encode_measurement((qubit, ), None, Measure(), resource_matcher)
+
+        assert encoding == assessor.encode_measurement((qubit, ), None, Measure(), assessor.resource_matcher)
+        assert Assessor.encode_measurement((qubit, ), None, Measure()) != encoding
+
+    def test_get_measurement_names_callable_on_class(self):
+        qubit = Qubit(AnyRange())
+        z_measurement = QuantumCircuit(1, 1, name="measure_z")
+        z_measurement.measure(0, 0)
+        assertions = [AssertProbability(qubit, "0", 0.5), AssertProbability(qubit, "0", 0.5)]
+        assertions[1].measurements = [z_measurement.to_instruction()]
+
+        assert Assessor.get_measurement_names(assertions[0]) == {"measure"}
+        assert Assessor.get_measurement_names(assertions[0], assertions) == {"measure", "measure_z"}
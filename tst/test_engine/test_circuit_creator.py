@@ -0,0 +1,229 @@
+from typing import Sequence, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+from qiskit.quantum_info import Statevector
+
+from qiskit_check.test_engine.assessor import Assessor, AssessorFactory
+from qiskit_check.test_engine.circuit_creator import CircuitCreator, MeasurementRequest
+from qiskit_check.test_engine.concrete_property_test.test_case import TestCase
+from qiskit_check.property_test import PropertyTest
+from qiskit_check.property_test.assertions import AbstractAssertion, AssertProbability, AssertEntangled, \
+    AssertStateEqualConcreteValue
+from qiskit_check.property_test.assertions.assert_phase import AssertPhase
+from qiskit_check.property_test.resources import Qubit, ConcreteQubit, AnyRange
+
+
+class ExamplePropertyTest(PropertyTest):
+    @property
+    def circuit(self) -> QuantumCircuit:
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        return qc
+
+    def get_qubits(self) -> Sequence[Qubit]:
+        return [Qubit(AnyRange()), Qubit(AnyRange())]
+
+    def assertions(self, qubits: Sequence[Qubit]) -> Union[AbstractAssertion, Sequence[AbstractAssertion]]:
+        return [AssertProbability(qubits[0], "0", 0.5), AssertProbability(qubits[1], "0", 0.5),
+                AssertEntangled(qubits[0], qubits[1])]
+
+    @staticmethod
+    def confidence_level() -> float:
+        return 0.99
+
+    @staticmethod
+    def num_test_cases() -> int:
+        return 1
+
+    @staticmethod
+    def num_measurements() -> int:
+        return 10
+
+    @staticmethod
+    def num_experiments() -> int:
+        return 10
+
+
+def get_test_case() -> TestCase:
+    property_test = ExamplePropertyTest()
+    resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(property_test.qubits)}
+    assessor = AssessorFactory.build(property_test, resource_matcher)
+    circuit = QuantumCircuit(2)
+    circuit.initialize([1, 0], 0)
+    circuit.initialize([1, 0], 1)
+    return TestCase(circuit.compose(property_test.circuit), assessor, 10, 10)
+
+
+class TestCircuitCreator:
+    def test_get_measurement_plan_covers_every_measurement_once(self):
+        test_case = get_test_case()
+
+        measurement_plan = CircuitCreator().get_measurement_plan(test_case)
+
+        encodings = [encoding for circuit_encodings in measurement_plan.encodings for encoding in circuit_encodings]
+        assert len(encodings) == 3
+        assert len(set(encodings)) == 3
+        # measurements of single qubits are covered by measurement of both of them
+        assert len(measurement_plan) == 1
+
+    def test_get_circuits_returns_circuits_of_measurement_plan(self):
+        test_case = get_test_case()
+
+        circuits = CircuitCreator().get_circuits(test_case)
+
+        # measurement registers get unique names so circuits are compared by their operations
+        expected_circuits = CircuitCreator().get_measurement_plan(test_case).circuits
+        assert [circuit.count_ops() for circuit in circuits] == [circuit.count_ops() for circuit in expected_circuits]
+
+    def test_get_measurement_plan_does_not_modify_measurement_locations(self):
+        test_case = get_test_case()
+        num_locations = {qubits: len(locations) for qubits, locations in test_case.assessor.measurement_locations.items()}
+
+        CircuitCreator().get_measurement_plan(test_case)
+
+        assert num_locations == {
+            qubits: len(locations) for qubits, locations in test_case.assessor.measurement_locations.items()}
+
+    def test_get_measurement_plan_merges_identical_measurements_of_different_assertions(self):
+        property_test = ExamplePropertyTest()
+        qubits = property_test.qubits
+        assertions = [AssertProbability(qubits[0], "0", 0.5), AssertProbability(qubits[0], "1", 0.5)]
+        resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(qubits)}
+        assessor = Assessor(
+            assertions, 0.99, resource_matcher, AssessorFactory._create_measurement_locations(assertions))
+        circuit_creator = CircuitCreator()
+
+        measurement_plan = circuit_creator.get_measurement_plan(TestCase(property_test.circuit, assessor, 10, 10))
+
+        assert len(measurement_plan) == 1
+        assert measurement_plan.num_measurements == 2
+
+    def test_get_measurement_plan_merges_measurements_of_the_same_basis_by_different_instructions(self):
+        property_test = ExamplePropertyTest()
+        qubits = property_test.qubits
+        z_measurement = QuantumCircuit(1, 1, name="measure_z")
+        z_measurement.x(0)
+        z_measurement.x(0)
+        z_measurement.measure(0, 0)
+        assertions = [
+            AssertProbability(qubits[0], "0", 0.5), AssertProbability(qubits[0], "0", 0.5, (z_measurement.to_instruction(), )),
+            AssertStateEqualConcreteValue(qubits[1], (0, 0)), AssertStateEqualConcreteValue(qubits[1], (0, 0))]
+        resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(qubits)}
+        assessor = Assessor(
+            assertions, 0.99, resource_matcher, AssessorFactory._create_measurement_locations(assertions))
+
+        measurement_plan = CircuitCreator().get_measurement_plan(TestCase(property_test.circuit, assessor, 10, 10))
+
+        # z measurement of qubit 0 is packed with each of x, y and z measurement of qubit 1
+        assert len(measurement_plan) == 3
+        assert measurement_plan.num_measurements == 8
+        assert sum(len(circuit_encodings) for circuit_encodings in measurement_plan.encodings) == 4
+
+    def test_get_measurement_requests_distinguishes_bases_of_instructions_with_the_same_name(self):
+        property_test = ExamplePropertyTest()
+        qubits = property_test.qubits
+        assertions = [AssertPhase(qubits[0], 0), AssertStateEqualConcreteValue(qubits[0], (0, 0))]
+        resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(qubits)}
+        assessor = Assessor(
+            assertions, 0.99, resource_matcher, AssessorFactory._create_measurement_locations(assertions))
+
+        requests = CircuitCreator.get_measurement_requests(TestCase(property_test.circuit, assessor, 10, 10))
+
+        # both measure x the same way but their measure_y instructions measure opposite states of y basis as 0
+        assert sorted(request.basis for request in requests) == ["-y", "x", "y", "z"]
+
+    def test_get_measurement_plan_measures_classical_shadows_of_all_qubits_in_the_same_circuits(self):
+        qubits = [Qubit(AnyRange()) for _ in range(4)]
+        assertions = [AssertStateEqualConcreteValue(qubit, (0, 0), num_shadow_settings=6) for qubit in qubits]
+        resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(qubits)}
+        assessor = Assessor(
+            assertions, 0.99, resource_matcher, AssessorFactory._create_measurement_locations(assertions))
+
+        measurement_plan = CircuitCreator().get_measurement_plan(TestCase(QuantumCircuit(4), assessor, 10, 10))
+
+        assert len(measurement_plan) == 6
+        for circuit in measurement_plan.circuits:
+            names = {instruction.name for instruction, _, _ in circuit.data}
+            assert len(names) == 1 and names.pop().startswith("shadow_")
+            assert len(circuit.data) == 4
+        # settings share measurements of the test case
+        assert measurement_plan.get_num_shots(10) == [2] * 6
+
+    def test_get_measurement_plan_keeps_classical_shadows_apart_from_other_measurements(self):
+        qubits = [Qubit(AnyRange()) for _ in range(2)]
+        assertions = [
+            AssertStateEqualConcreteValue(qubits[0], (0, 0), num_shadow_settings=3),
+            AssertProbability(qubits[1], "0", 0.5)]
+        resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(qubits)}
+        assessor = Assessor(
+            assertions, 0.99, resource_matcher, AssessorFactory._create_measurement_locations(assertions))
+
+        measurement_plan = CircuitCreator().get_measurement_plan(TestCase(QuantumCircuit(2), assessor, 10, 10))
+
+        assert len(measurement_plan) == 4
+        for circuit, num_shots in zip(measurement_plan.circuits, measurement_plan.get_num_shots(10)):
+            names = {instruction.name for instruction, _, _ in circuit.data}
+            assert names == {"measure"} and num_shots == 10 or all(name.startswith("shadow_") for name in names) \
+                and num_shots == 4
+
+    def test_pack_uses_fewest_circuits_when_measurements_conflict(self):
+        qubits = [Qubit(AnyRange()) for _ in range(5)]
+        requests = [
+            MeasurementRequest((qubits[0], qubits[1]), None, Measure(), "a", "z"),
+            MeasurementRequest((qubits[2], qubits[3]), None, Measure(), "b", "z"),
+            MeasurementRequest((qubits[1], qubits[2]), None, Measure(), "c", "z"),
+            MeasurementRequest((qubits[3], qubits[4]), None, Measure(), "d", "z"),
+            MeasurementRequest((qubits[4], ), None, Measure(), "e", "z"),
+        ]
+
+        circuits = CircuitCreator.pack(requests)
+
+        assert len(circuits) == 2
+        assert sorted(request.encoding for circuit in circuits for request in circuit) == ["a", "b", "c", "d", "e"]
+        for circuit in circuits:
+            for index, request in enumerate(circuit):
+                assert not any(request.conflicts_with(other) for other in circuit[index + 1:])
+
+    def test_pack_measures_all_qubits_along_the_same_axis_in_the_same_circuit(self):
+        qubits = [Qubit(AnyRange()) for _ in range(4)]
+        requests = [MeasurementRequest((qubits[3], ), None, Measure(), "3z", "z")]
+        for index, qubit in enumerate(qubits):
+            for basis in ("x", "-y" if index % 2 == 0 else "y", "z"):
+                if index != 3 or basis != "z":
+                    requests.append(MeasurementRequest((qubit, ), None, Measure(), f"{index}{basis}", basis))
+
+        circuits = CircuitCreator.pack(requests)
+
+        assert len(circuits) == 3
+        assert sorted(sorted({request.basis.lstrip("-") for request in circuit}) for circuit in circuits) == [
+            ["x"], ["y"], ["z"]]
+
+    def test_get_measurement_plan_inserts_measurements_at_their_locations(self):
+        test_case = get_test_case()
+        qubits = list(test_case.assessor.resource_matcher.keys())
+        assertions = [AssertProbability(qubits[0], "0", 0.5, location=1), AssertProbability(qubits[1], "0", 0.5, location=0)]
+        assessor = Assessor(
+            assertions, 0.99, test_case.assessor.resource_matcher,
+            AssessorFactory._create_measurement_locations(assertions))
+
+        measurement_plan = CircuitCreator().get_measurement_plan(TestCase(test_case.circuit, assessor, 10, 10))
+
+        assert len(measurement_plan) == 1
+        names = [instruction.name for instruction, _, _ in measurement_plan.circuits[0].data]
+        # 2 initializations, measurement of qubit 1 before h, h, measurement of qubit 0 before cx, cx
+        assert names == ["initialize", "initialize", "measure", "h", "measure", "cx"]
+
+    def test_get_measurement_plan_separates_measurements_disturbing_later_ones(self):
+        test_case = get_test_case()
+        qubits = list(test_case.assessor.resource_matcher.keys())
+        assertions = [AssertProbability(qubits[0], "0", 0.5, location=0), AssertProbability(qubits[1], "0", 0.5)]
+        assessor = Assessor(
+            assertions, 0.99, test_case.assessor.resource_matcher,
+            AssessorFactory._create_measurement_locations(assertions))
+
+        measurement_plan = CircuitCreator().get_measurement_plan(TestCase(test_case.circuit, assessor, 10, 10))
+
+        # qubit 0 measured before h is entangled with qubit 1 by cx before qubit 1 is measured
+        assert len(measurement_plan) == 2
@@ -0,0 +1,138 @@
+from math import acos, sqrt
+from typing import Sequence, Union
+
+from pytest_mock import MockFixture
+from qiskit import Aer, ClassicalRegister, QuantumCircuit, transpile
+
+from qiskit_check.property_test.assertions import AbstractAssertion, AssertProbability
+from qiskit_check.property_test.resources import Qubit
+from qiskit_check.test_engine.assessor import AssessorFactory
+from qiskit_check.test_engine.concrete_property_test import ConcretePropertyTest
+from qiskit_check.test_engine.generator import NaiveInputGeneratorFactory
+from qiskit_check.test_engine.test_runner import AnalyticSimulatorTestRunner
+from tst.test_engine.test_runner.test_simulator_test_runner import DeterministicPropertyTest, \
+    DeterministicFailPropertyTest, ShadowPropertyTest, assert_shadow_settings_split_measurements
+
+
+class SlightlyBiasedPropertyTest(DeterministicPropertyTest):
+    @property
+    def circuit(self) -> QuantumCircuit:
+        # probability of 0 is 0.55 while the assertion expects 0.5
+        qc = QuantumCircuit(1)
+        qc.ry(2 * acos(sqrt(0.55)), 0)
+        return qc
+
+    def assertions(self, qubits: Sequence[Qubit]) -> Union[AbstractAssertion, Sequence[AbstractAssertion]]:
+        return [AssertProbability(qubits[0], "0", 0.5)]
+
+    @staticmethod
+    def num_experiments() -> int:
+        return 20
+
+
+def get_rejection_rate(test_runner: AnalyticSimulatorTestRunner, num_runs: int) -> float:
+    test = ConcretePropertyTest(SlightlyBiasedPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+    test_case = next(iter(test))
+    errors = [test_runner._run_adaptive_test_case(test_case)[0] for _ in range(num_runs)]
+    return sum(error is not None for error in errors) / num_runs
+
+
+class TestAnalyticSimulatorTestRunner:
+    def test_run_tests_runs_all_tests_when_everything_correct(self, mocker: MockFixture):
+        test_runner = AnalyticSimulatorTestRunner(mocker.MagicMock())
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory)
+        ]
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+
+    def test_run_tests_submits_one_job_per_test_case(self, mocker: MockFixture):
+        test_runner = AnalyticSimulatorTestRunner(mocker.MagicMock())
+        run_circuits = mocker.spy(test_runner, "_run_circuits")
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert run_circuits.call_count == DeterministicPropertyTest.num_test_cases()
+
+    def test_get_deferred_measurement_circuit_keeps_distribution_when_measured_mid_circuit(self):
+        circuit = QuantumCircuit(1, 2)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        circuit.h(0)
+        circuit.measure(0, 1)
+        backend = Aer.get_backend("aer_simulator_statevector")
+
+        deferred_circuit = AnalyticSimulatorTestRunner.get_deferred_measurement_circuit(circuit)
+        result = backend.run(transpile(deferred_circuit, backend), shots=1).result()
+
+        probabilities = result.data(0)[AnalyticSimulatorTestRunner.probabilities_label]
+        # only the measurement followed by h needs an ancilla
+        assert deferred_circuit.num_qubits == 2
+        assert deferred_circuit.cregs == circuit.cregs
+        assert sorted(probabilities.keys()) == [0, 1, 2, 3]
+        for probability in probabilities.values():
+            assert abs(probability - 0.25) < 1e-9
+
+    def test_get_deferred_measurement_circuit_adds_no_qubits_when_measured_at_the_end(self):
+        circuit = QuantumCircuit(3, 2)
+        circuit.h(0)
+        circuit.x(1)
+        circuit.measure(0, 1)
+        circuit.barrier()
+        circuit.measure(1, 0)
+        circuit.h(2)
+        backend = Aer.get_backend("aer_simulator_statevector")
+
+        deferred_circuit = AnalyticSimulatorTestRunner.get_deferred_measurement_circuit(circuit)
+        result = backend.run(transpile(deferred_circuit, backend), shots=1).result()
+
+        probabilities = result.data(0)[AnalyticSimulatorTestRunner.probabilities_label]
+        assert deferred_circuit.num_qubits == circuit.num_qubits
+        assert deferred_circuit.cregs == circuit.cregs
+        # clbit 0 holds qubit 1 (always 1) and clbit 1 holds qubit 0
+        assert sorted(probabilities.keys()) == [1, 3]
+        for probability in probabilities.values():
+            assert abs(probability - 0.5) < 1e-9
+
+    def test_get_deferred_measurement_circuit_returns_none_when_classically_controlled(self):
+        circuit = QuantumCircuit(1)
+        cl_reg = ClassicalRegister(1)
+        circuit.add_register(cl_reg)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        circuit.x(0).c_if(cl_reg, 1)
+
+        assert AnalyticSimulatorTestRunner.get_deferred_measurement_circuit(circuit) is None
+
+    def test_get_experiment_results_splits_measurements_among_shadow_settings(self, mocker: MockFixture):
+        test = ConcretePropertyTest(ShadowPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        test_runner = AnalyticSimulatorTestRunner(mocker.MagicMock(), seed=7)
+
+        assert_shadow_settings_split_measurements(test_runner.get_experiment_results(next(iter(test)), 3))
+
+    def test_get_experiment_results_reproducible_when_seeded(self, mocker: MockFixture):
+        test = ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        test_case = next(iter(test))
+
+        results = []
+        for _ in range(2):
+            test_runner = AnalyticSimulatorTestRunner(mocker.MagicMock(), seed=7)
+            experiment_results = test_runner.get_experiment_results(test_case)
+            results.append([
+                result.get_counts() for experiment in experiment_results for result, _ in experiment.values()])
+
+        assert len(results[0]) == DeterministicPropertyTest.num_experiments()
+        assert results[0] == results[1]
+
+    def test_run_adaptive_test_case_keeps_power_when_sequential_looks_and_deviation_small(self, mocker: MockFixture):
+        single_look_runner = AnalyticSimulatorTestRunner(mocker.MagicMock(), seed=3)
+        sequential_runner = AnalyticSimulatorTestRunner(mocker.MagicMock(), seed=3, sequential_looks=10)
+
+        single_look_rate = get_rejection_rate(single_look_runner, 200)
+        sequential_rate = get_rejection_rate(sequential_runner, 200)
+
+        # looks of 2 experiments stopping for futility at every look rejected only about 70% of the test cases
+        assert single_look_rate > 0.9
+        assert sequential_rate > single_look_rate - 0.1
@@ -0,0 +1,107 @@
+from pytest_mock import MockFixture
+from qiskit import IBMQ
+from qiskit.providers import JobStatus
+from qiskit.test.mock import FakeProvider
+
+from qiskit_check.test_engine.assessor import AssessorFactory
+from qiskit_check.test_engine.concrete_property_test import ConcretePropertyTest
+from qiskit_check.test_engine.generator import NaiveInputGeneratorFactory
+from qiskit_check.test_engine.test_runner import IBMQDeviceRunner
+from tst.test_engine.test_runner.test_simulator_test_runner import DeterministicPropertyTest
+
+
+class SmallPropertyTest(DeterministicPropertyTest):
+    @staticmethod
+    def num_experiments() -> int:
+        return 6
+
+
+class DelayedJob:
+    """
+    job wrapper reporting the job as running on the first poll so that jobs stay in flight
+    """
+    def __init__(self, job, jobs_in_flight):
+        self.job = job
+        self.jobs_in_flight = jobs_in_flight
+        self.polled = False
+
+    def status(self):
+        if not self.polled:
+            self.polled = True
+            return JobStatus.RUNNING
+        return self.job.status()
+
+    def result(self):
+        self.jobs_in_flight.remove(self)
+        return self.job.result()
+
+
+def get_ibmq_device_runner(mocker: MockFixture, **kwargs) -> IBMQDeviceRunner:
+    mocker.patch.object(IBMQ, "load_account")
+    mocker.patch.object(IBMQ, "get_provider", return_value=FakeProvider())
+    return IBMQDeviceRunner("fake_manila", "hub", "group", "project", mocker.MagicMock(), poll_interval=0, **kwargs)
+
+
+class TestIBMQDeviceRunner:
+    def test_get_experiment_results_submits_job_per_experiment_when_concurrent_jobs(self, mocker: MockFixture):
+        test_runner = get_ibmq_device_runner(mocker, max_concurrent_jobs=3)
+        run = mocker.spy(test_runner.backend, "run")
+        test = ConcretePropertyTest(SmallPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        test_case = next(iter(test))
+
+        test_results = test_runner.get_experiment_results(test_case)
+
+        assert len(test_results) == SmallPropertyTest.num_experiments()
+        assert run.call_count == SmallPropertyTest.num_experiments()
+        for experiment_results in test_results:
+            for result, _ in experiment_results.values():
+                assert sum(result.get_counts().values()) == SmallPropertyTest.num_measurements()
+
+    def test_get_experiment_results_keeps_at_most_max_jobs_in_flight_when_concurrent_jobs(self, mocker: MockFixture):
+        test_runner = get_ibmq_device_runner(mocker, max_concurrent_jobs=3)
+        jobs_in_flight = []
+        max_jobs_in_flight = []
+        backend_run = test_runner.backend.run
+
+        def run(*args, **kwargs):
+            jobs_in_flight.append(DelayedJob(backend_run(*args, **kwargs), jobs_in_flight))
+            max_jobs_in_flight.append(len(jobs_in_flight))
+            return jobs_in_flight[-1]
+
+        mocker.patch.object(test_runner.backend, "run", side_effect=run)
+        test = ConcretePropertyTest(SmallPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+
+        test_runner.get_experiment_results(next(iter(test)))
+
+        assert max(max_jobs_in_flight) == 3
+        assert len(jobs_in_flight) == 0
+
+    def test_run_tests_transpiles_template_once_when_parameterized(self, mocker: MockFixture):
+        test_runner = get_ibmq_device_runner(mocker, parameterized=True)
+        transpile = mocker.spy(test_runner.transpilation_cache, "transpile")
+        run = mocker.spy(test_runner.backend, "run")
+        tests = [ConcretePropertyTest(SmallPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+
+        test_runner.run_tests(tests)
+
+        transpile.assert_called_once()
+        # template is transpiled with its parameters unbound
+        assert all(len(circuit.parameters) > 0 for circuit in transpile.call_args.args[0])
+        run.assert_called_once()
+        assert len(run.call_args.args[0]) == SmallPropertyTest.num_test_cases()
+
+    def test_get_experiment_results_splits_jobs_at_max_shots_when_split_memory(self, mocker: MockFixture):
+        test_runner = get_ibmq_device_runner(mocker, split_memory=True)
+        max_shots = 2 * SmallPropertyTest.num_measurements() + 1
+        mocker.patch.object(test_runner.backend.configuration(), "max_shots", max_shots)
+        run = mocker.spy(test_runner.backend, "run")
+        test = ConcretePropertyTest(SmallPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+
+        test_results = test_runner.get_experiment_results(next(iter(test)))
+
+        assert run.call_count == SmallPropertyTest.num_experiments() // 2
+        assert all(call.kwargs["shots"] <= max_shots for call in run.call_args_list)
+        assert len(test_results) == SmallPropertyTest.num_experiments()
+        for experiment_results in test_results:
+            for result, _ in experiment_results.values():
+                assert sum(result.get_counts().values()) == SmallPropertyTest.num_measurements()
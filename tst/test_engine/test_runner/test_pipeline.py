@@ -0,0 +1,65 @@
+from threading import Lock
+from time import sleep, time
+
+import pytest
+
+from qiskit_check.test_engine.test_runner.pipeline import Pipeline
+
+
+class TestPipeline:
+    def test_iter_yields_outputs_in_order_when_stages_chained(self):
+        pipeline = Pipeline(range(10), [lambda x: x + 1, lambda x: 2 * x], 2)
+
+        assert list(pipeline) == [2 * (x + 1) for x in range(10)]
+
+    def test_iter_raises_error_when_item_reached(self):
+        def stage(x):
+            if x == 3:
+                raise ValueError()
+            return x
+
+        outputs = []
+        with pytest.raises(ValueError):
+            for output in Pipeline(range(10), [stage], 1):
+                outputs.append(output)
+        assert outputs == [0, 1, 2]
+
+    def test_iter_raises_error_when_source_fails(self):
+        def source():
+            yield 0
+            raise KeyError()
+
+        with pytest.raises(KeyError):
+            list(Pipeline(source(), [lambda x: x], 1))
+
+    def test_iter_keeps_items_in_flight_bounded_when_consumer_slow(self):
+        lock = Lock()
+        produced = []
+        consumed = []
+        max_in_flight = 0
+
+        def source():
+            nonlocal max_in_flight
+            for i in range(20):
+                with lock:
+                    produced.append(i)
+                    max_in_flight = max(max_in_flight, len(produced) - len(consumed))
+                yield i
+
+        for output in Pipeline(source(), [lambda x: x, lambda x: x], 1):
+            sleep(0.01)
+            with lock:
+                consumed.append(output)
+
+        assert consumed == list(range(20))
+        # one item waits in each of the 3 queues and one is held by each of the 2 stages and producer
+        assert max_in_flight <= 7
+
+    def test_iter_overlaps_stages_when_stages_are_slow(self):
+        def slow_stage(x):
+            sleep(0.05)
+            return x
+
+        start = time()
+        assert list(Pipeline(range(8), [slow_stage, slow_stage, slow_stage], 1)) == list(range(8))
+        assert time() - start < 3 * 8 * 0.05
@@ -0,0 +1,56 @@
+from qiskit import Aer, QuantumCircuit, transpile
+
+from qiskit_check.test_engine.test_runner.result_cache import ResultCache
+
+
+def get_circuit_and_result():
+    circuit = QuantumCircuit(1, 1)
+    circuit.h(0)
+    circuit.measure(0, 0)
+    backend = Aer.get_backend("aer_simulator")
+    transpiled_circuit = transpile(circuit, backend)
+    return transpiled_circuit, backend, backend.run(transpiled_circuit, shots=100, seed_simulator=1).result()
+
+
+class TestResultCache:
+    def test_get_returns_stored_result_when_put(self, tmp_path):
+        circuit, backend, result = get_circuit_and_result()
+        result_cache = ResultCache(str(tmp_path))
+        key = result_cache.get_key(circuit, backend, 100, 1, 0, False)
+
+        result_cache.put(key, result)
+
+        assert result_cache.get(key).get_counts() == result.get_counts()
+        assert ResultCache(str(tmp_path)).get(key).get_counts() == result.get_counts()
+
+    def test_get_returns_none_when_not_stored(self, tmp_path):
+        circuit, backend, _ = get_circuit_and_result()
+        result_cache = ResultCache(str(tmp_path))
+
+        assert result_cache.get(result_cache.get_key(circuit, backend, 100, 1, 0, False)) is None
+        assert result_cache.misses == 1
+
+    def test_get_key_differs_when_seed_or_shots_differ(self):
+        circuit, backend, _ = get_circuit_and_result()
+        key = ResultCache.get_key(circuit, backend, 100, 1, 0, False)
+
+        assert key == ResultCache.get_key(circuit.copy(), backend, 100, 1, 0, False)
+        assert key != ResultCache.get_key(circuit, backend, 100, 2, 0, False)
+        assert key != ResultCache.get_key(circuit, backend, 100, 1, 1, False)
+        assert key != ResultCache.get_key(circuit, backend, 200, 1, 0, False)
+        assert key != ResultCache.get_key(circuit, backend, 100, 1, 0, False, {"precision": "single"})
+        assert key != ResultCache.get_key(circuit, backend, 100, 1, 0, True)
+
+    def test_put_evicts_least_recently_used_when_cache_full(self, tmp_path):
+        circuit, backend, result = get_circuit_and_result()
+        keys = [ResultCache.get_key(circuit, backend, 100, seed, 0, False) for seed in range(3)]
+        result_cache = ResultCache(str(tmp_path), max_size=10**9)
+        result_cache.put(keys[0], result)
+        result_cache.max_size = 2 * result_cache._size
+
+        for key in keys[1:]:
+            result_cache.put(key, result)
+
+        assert result_cache.get(keys[0]) is None
+        assert result_cache.get(keys[1]) is not None
+        assert result_cache.get(keys[2]) is not None
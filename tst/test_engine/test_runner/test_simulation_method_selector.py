@@ -0,0 +1,50 @@
+from math import pi
+
+from qiskit import Aer, QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from qiskit_check.test_engine.test_runner.simulation_method_selector import SimulationMethodSelector
+
+
+def get_clifford_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2, 2)
+    circuit.initialize(Statevector([1, 1j]) / 2**0.5, 0)
+    circuit.initialize([0, 1], 1)
+    circuit.u(pi / 2, 0, pi, 0)
+    circuit.rz(pi / 2, 1)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    return circuit
+
+
+class TestSimulationMethodSelector:
+    def test_select_stabilizer_when_clifford_circuit_with_stabilizer_inputs(self):
+        circuit = get_clifford_circuit()
+        method, stabilizer_circuit = SimulationMethodSelector().select(circuit)
+
+        assert method == "stabilizer"
+        assert stabilizer_circuit.cregs == circuit.cregs
+        backend = Aer.get_backend("aer_simulator")
+        counts = backend.run(stabilizer_circuit, method=method, shots=1000, seed_simulator=1).result().get_counts()
+        assert set(counts.keys()) == set(backend.run(circuit, shots=1000).result().get_counts().keys())
+
+    def test_select_statevector_when_non_clifford_gate(self):
+        circuit = get_clifford_circuit()
+        circuit.t(0)
+
+        assert SimulationMethodSelector().select(circuit) == ("statevector", circuit)
+
+    def test_select_statevector_when_non_stabilizer_input(self):
+        circuit = QuantumCircuit(1, 1)
+        circuit.initialize(Statevector([0.6, 0.8]), 0)
+        circuit.measure(0, 0)
+
+        assert SimulationMethodSelector().select(circuit)[0] == "statevector"
+
+    def test_select_matrix_product_state_when_wide_non_clifford_circuit(self):
+        circuit = QuantumCircuit(4, 4)
+        circuit.ry(0.1, range(4))
+        circuit.measure(range(4), range(4))
+
+        assert SimulationMethodSelector(matrix_product_state_width=4).select(circuit)[0] == "matrix_product_state"
+        assert SimulationMethodSelector(matrix_product_state_width=5).select(circuit)[0] == "statevector"
@@ -1,5 +1,8 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence, Union
 
+import pytest
 from pytest_mock import MockFixture
 from qiskit import QuantumCircuit
 from scipy.spatial.transform import Rotation
@@ -10,8 +13,9 @@ from qiskit_check.test_engine.generator import HaarInputGeneratorFactory, NaiveI
     QubitInputGeneratorFactory
 from qiskit_check.test_engine.test_runner import SimulatorTestRunner
 from qiskit_check.property_test import PropertyTest
-from qiskit_check.property_test.assertions import AbstractAssertion, AssertTransformedByProbability, AssertTransformedByState
-from qiskit_check.property_test.resources import Qubit, AnyRange
+from qiskit_check.property_test.assertions import AbstractAssertion, AssertTransformedByProbability, AssertTransformedByState, \
+    AssertStateEqualConcreteValue
+from qiskit_check.property_test.resources import Qubit, AnyRange, QubitRange
 
 
 class ExamplePropertyTest(PropertyTest):
@@ -66,6 +70,37 @@ class ExampleFailPropertyTest(ExamplePropertyTest):
         return qc
 
 
+class DeterministicPropertyTest(ExamplePropertyTest):
+    def get_qubits(self) -> Sequence[Qubit]:
+        return [Qubit(QubitRange(0, 0, 0, 0))]
+
+
+class DeterministicFailPropertyTest(DeterministicPropertyTest):
+    @property
+    def circuit(self) -> QuantumCircuit:
+        qc = QuantumCircuit(1)
+        qc.x(0)
+        return qc
+
+
+class DeterministicCopyPropertyTest(DeterministicPropertyTest):
+    pass
+
+
+class ShadowPropertyTest(DeterministicPropertyTest):
+    def assertions(self, qubits: Sequence[Qubit]) -> Union[AbstractAssertion, Sequence[AbstractAssertion]]:
+        return [
+            AssertTransformedByProbability(self.qubits[0], Rotation.identity()),
+            AssertStateEqualConcreteValue(self.qubits[0], (0, 0), num_shadow_settings=6)]
+
+
+def assert_shadow_settings_split_measurements(experiment_results) -> None:
+    # 6 settings share 100 measurements, other measurements keep all of them
+    for experiment in experiment_results:
+        for encoding, (result, _) in experiment.items():
+            assert sum(result.get_counts().values()) == (17 if "shadow" in encoding else 100)
+
+
 class TestSimulatorTestRunner:
     def test_run_tests_runs_all_tests_when_everything_correct(self, mocker: MockFixture):
         test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock())
@@ -91,3 +126,356 @@ class TestSimulatorTestRunner:
         ]
         # example 1 property test should fail due to no tomography specified,o other tests should run correctly
         assert ["ExampleFailPropertyTest", "Example1PropertyTest"], ["Example2PropertyTest"] == test_runner.run_tests(tests)
+
+    def test_run_tests_runs_all_tests_when_batch_experiments(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), batch_experiments=True)
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory)
+        ]
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+
+    def test_run_tests_submits_one_job_per_test_case_when_batch_experiments(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), batch_experiments=True)
+        run_circuits = mocker.spy(test_runner, "_run_circuits")
+        run_circuit = mocker.spy(test_runner, "_run_circuit")
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner.run_tests(tests)
+
+        assert run_circuits.call_count == ExamplePropertyTest.num_test_cases()
+        assert len(run_circuits.call_args.args[0]) == ExamplePropertyTest.num_experiments()
+        run_circuit.assert_not_called()
+
+    def test_run_tests_runs_all_tests_when_split_memory(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), split_memory=True)
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory)
+        ]
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+
+    def test_run_tests_runs_each_circuit_once_when_split_memory(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), split_memory=True)
+        run_circuit = mocker.spy(test_runner, "_run_circuit")
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner.run_tests(tests)
+
+        assert run_circuit.call_count == ExamplePropertyTest.num_test_cases()
+        num_shots = ExamplePropertyTest.num_experiments() * ExamplePropertyTest.num_measurements()
+        assert run_circuit.call_args.args[1] == num_shots
+        assert run_circuit.call_args.kwargs["memory"]
+
+    def test_run_tests_transpiles_once_per_test_case_when_experiments_repeated(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock())
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner.run_tests(tests)
+
+        num_circuits = ExamplePropertyTest.num_test_cases() * ExamplePropertyTest.num_experiments()
+        assert test_runner.transpilation_cache.misses <= ExamplePropertyTest.num_test_cases()
+        assert test_runner.transpilation_cache.hits + test_runner.transpilation_cache.misses == num_circuits
+
+    def test_run_tests_creates_measurement_circuits_once_per_test_case(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock())
+        get_measurement_plan = mocker.spy(test_runner.circuit_creator, "get_measurement_plan")
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner.run_tests(tests)
+
+        assert get_measurement_plan.call_count == DeterministicPropertyTest.num_test_cases()
+
+    def test_run_tests_runs_all_tests_when_parameterized(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), parameterized=True)
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory)
+        ]
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+
+    def test_run_tests_submits_one_job_per_property_test_when_parameterized(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), parameterized=True)
+        run_parameterized_circuits = mocker.spy(test_runner, "_run_parameterized_circuits")
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        run_parameterized_circuits.assert_called_once()
+        assert len(run_parameterized_circuits.call_args.args[1]) == DeterministicPropertyTest.num_test_cases()
+        assert test_runner.transpilation_cache.misses == 1
+
+    @pytest.mark.parametrize("mode", [
+        {"test_case_workers": 2}, {"sequential_looks": 2}, {"screening_fraction": 0.25}, {"pipeline_depth": 1}])
+    def test_init_raises_value_error_when_parameterized_combined_with_mode(self, mocker: MockFixture, mode):
+        with pytest.raises(ValueError):
+            SimulatorTestRunner("aer_simulator", mocker.MagicMock(), parameterized=True, **mode)
+
+    def test_init_raises_value_error_when_test_cases_concurrent_and_pipelined(self, mocker: MockFixture):
+        with pytest.raises(ValueError):
+            SimulatorTestRunner("aer_simulator", mocker.MagicMock(), test_case_workers=2, pipeline_depth=1)
+
+    def test_run_tests_reuses_transpiled_template_when_property_test_rerun_parameterized(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), parameterized=True)
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert test_runner.transpilation_cache.misses == 1
+
+    def test_run_tests_runs_all_tests_in_order_when_multiple_workers(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        test_runner = SimulatorTestRunner("aer_simulator", printer, num_workers=2)
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory)
+        ]
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        headers = [call.args[0].property_test_class for call in printer.print_property_test_header.call_args_list]
+        assert headers == [DeterministicFailPropertyTest, DeterministicPropertyTest]
+        assert printer.print_test_case_success.call_count == DeterministicPropertyTest.num_test_cases()
+        printer.print_property_test_failure.assert_called_once()
+
+    def test_run_tests_runs_jobs_with_same_seeds_when_multiple_workers(self, mocker: MockFixture, tmp_path):
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory()),
+            ConcretePropertyTest(DeterministicCopyPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, seed_simulator=3,
+            result_cache_location=str(tmp_path / "single"))
+        assert ([], ["DeterministicPropertyTest", "DeterministicCopyPropertyTest"]) == test_runner.run_tests(tests)
+
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, seed_simulator=3,
+            result_cache_location=str(tmp_path / "workers"), num_workers=2)
+        assert ([], ["DeterministicPropertyTest", "DeterministicCopyPropertyTest"]) == test_runner.run_tests(tests)
+
+        # identical property tests get their own seeds in worker copies of the runner
+        keys = sorted(os.listdir(tmp_path / "single"))
+        assert len(keys) == 2 * DeterministicPropertyTest.num_test_cases() * DeterministicPropertyTest.num_experiments()
+        assert keys == sorted(os.listdir(tmp_path / "workers"))
+
+    def test_run_tests_runs_all_tests_when_test_cases_concurrent(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        test_runner = SimulatorTestRunner("aer_simulator", printer, test_case_workers=3)
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory)
+        ]
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert printer.print_test_case_success.call_count == DeterministicPropertyTest.num_test_cases()
+        printer.print_test_case_failure.assert_called_once()
+
+    def test_run_tests_prints_test_cases_in_order_when_test_cases_concurrent(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        test_runner = SimulatorTestRunner("aer_simulator", printer, test_case_workers=3)
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner.run_tests(tests)
+
+        headers = [call.args[0] for call in printer.print_test_case_header.call_args_list]
+        successes = [call.args[0] for call in printer.print_test_case_success.call_args_list]
+        assert len(headers) == DeterministicPropertyTest.num_test_cases()
+        assert headers == successes
+
+    def test_seed_test_case_derives_job_seeds_independent_of_other_threads(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), seed_simulator=3)
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        seeds = [test_runner._spawn_test_case_seed() for _ in range(3)]
+
+        def get_job_seed(seed):
+            with test_runner._seed_test_case(seed):
+                return test_runner._get_job_seed([circuit], 100, False, {})
+
+        expected_job_seeds = [get_job_seed(seed) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            job_seeds = list(executor.map(get_job_seed, reversed(seeds)))
+        assert job_seeds[::-1] == expected_job_seeds
+        assert len(set(expected_job_seeds)) == 3
+
+    def test_run_tests_reads_results_from_cache_when_seeded_rerun(self, mocker: MockFixture, tmp_path):
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        first_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, seed_simulator=3,
+            result_cache_location=str(tmp_path))
+        assert ([], ["DeterministicPropertyTest"]) == first_runner.run_tests(tests)
+
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, seed_simulator=3,
+            result_cache_location=str(tmp_path))
+        run = mocker.spy(test_runner.backend, "run")
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        run.assert_not_called()
+        assert test_runner.result_cache.misses == 0
+
+    def test_run_tests_reads_results_from_cache_when_seeded_rerun_without_other_tests(
+            self, mocker: MockFixture, tmp_path):
+        tests = [
+            ConcretePropertyTest(Example2PropertyTest, AssessorFactory(), HaarInputGeneratorFactory()),
+            ConcretePropertyTest(ExamplePropertyTest, AssessorFactory(), HaarInputGeneratorFactory())]
+        first_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, seed_simulator=3,
+            result_cache_location=str(tmp_path))
+        assert ([], ["Example2PropertyTest", "ExamplePropertyTest"]) == first_runner.run_tests(tests)
+
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, seed_simulator=3,
+            result_cache_location=str(tmp_path))
+        run = mocker.spy(test_runner.backend, "run")
+
+        assert ([], ["ExamplePropertyTest"]) == test_runner.run_tests(tests[1:])
+        run.assert_not_called()
+        assert test_runner.result_cache.misses == 0
+
+    def test_run_tests_stops_test_case_early_when_sequential_looks(self, mocker: MockFixture):
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory()),
+            ConcretePropertyTest(DeterministicFailPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        ]
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), batch_experiments=True, sequential_looks=10)
+        run = mocker.spy(test_runner.backend, "run")
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        # passing test cases stop at the first look after half of the experiments, failing one at the first look
+        assert run.call_count == 5 * DeterministicPropertyTest.num_test_cases() + 1
+        num_experiments = DeterministicPropertyTest.num_experiments() // 10
+        for call in run.call_args_list:
+            assert len(call.args[0]) == num_experiments
+
+    def test_run_tests_runs_all_tests_when_sequential_looks_and_test_cases_concurrent(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        test_runner = SimulatorTestRunner("aer_simulator", printer, sequential_looks=5, test_case_workers=3)
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory()),
+            ConcretePropertyTest(DeterministicFailPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        ]
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert printer.print_test_case_success.call_count == DeterministicPropertyTest.num_test_cases()
+
+    def test_run_tests_screens_test_cases_when_screening_fraction(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory()),
+            ConcretePropertyTest(DeterministicFailPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        ]
+        test_runner = SimulatorTestRunner("aer_simulator", printer, split_memory=True, screening_fraction=0.05)
+        run = mocker.spy(test_runner.backend, "run")
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        num_screening_shots = 5 * DeterministicPropertyTest.num_measurements()
+        for call in run.call_args_list:
+            assert call.kwargs["shots"] == num_screening_shots
+        shots = [call.args[1] for call in printer.print_test_case_shots.call_args_list]
+        assert shots == [num_screening_shots] * (DeterministicPropertyTest.num_test_cases() + 1)
+
+    def test_run_tests_escalates_ambiguous_test_cases_when_screening_fraction(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", printer, split_memory=True, screening_fraction=0.05, futility_p_value=1.1)
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        num_shots = DeterministicPropertyTest.num_experiments() * DeterministicPropertyTest.num_measurements()
+        shots = [call.args[1] for call in printer.print_test_case_shots.call_args_list]
+        assert shots == [num_shots] * DeterministicPropertyTest.num_test_cases()
+
+    def test_run_tests_passes_run_options_to_every_run(self, mocker: MockFixture):
+        run_options = {"method": "statevector", "precision": "single", "max_parallel_threads": 1}
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), batch_experiments=True, run_options=run_options)
+        run = mocker.spy(test_runner.backend, "run")
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert run.call_count == DeterministicPropertyTest.num_test_cases()
+        for call in run.call_args_list:
+            assert run_options.items() <= call.kwargs.items()
+
+    def test_init_uses_seed_simulator_from_run_options(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), run_options={"seed_simulator": 7})
+
+        assert test_runner.seed_simulator == 7
+        assert "seed_simulator" not in test_runner.run_options
+
+    def test_run_tests_runs_clifford_circuits_on_stabilizer_when_select_simulation_method(self, mocker: MockFixture):
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory()),
+            ConcretePropertyTest(DeterministicFailPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        ]
+        test_runner = SimulatorTestRunner(
+            "aer_simulator", mocker.MagicMock(), split_memory=True, select_simulation_method=True)
+        run = mocker.spy(test_runner.backend, "run")
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        for call in run.call_args_list:
+            assert call.kwargs["method"] == "stabilizer"
+        assert run.spy_return.result().results[0].metadata["method"] == "stabilizer"
+
+    def test_run_tests_runs_all_tests_in_order_when_pipelined(self, mocker: MockFixture):
+        printer = mocker.MagicMock()
+        test_runner = SimulatorTestRunner("aer_simulator", printer, pipeline_depth=2)
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory()),
+            ConcretePropertyTest(DeterministicFailPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        ]
+
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        headers = [call.args[0] for call in printer.print_test_case_header.call_args_list]
+        successes = [call.args[0] for call in printer.print_test_case_success.call_args_list]
+        assert headers[:DeterministicPropertyTest.num_test_cases()] == successes
+        printer.print_test_case_failure.assert_called_once()
+
+    def test_run_tests_transpiles_in_preparation_stage_when_pipelined(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), pipeline_depth=1)
+        tests = [ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+        prepare_circuits = mocker.spy(test_runner, "_prepare_circuits")
+
+        assert ([], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+        assert prepare_circuits.call_count == DeterministicPropertyTest.num_test_cases()
+        assert test_runner.transpilation_cache.misses == 1
+
+    @pytest.mark.parametrize("runner_options", [{}, {"batch_experiments": True}, {"split_memory": True}])
+    def test_get_experiment_results_splits_measurements_among_shadow_settings(
+            self, mocker: MockFixture, runner_options):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), **runner_options)
+        test_case = next(iter(ConcretePropertyTest(ShadowPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())))
+
+        experiment_results = test_runner.get_experiment_results(test_case, 3)
+
+        assert len(experiment_results) == 3
+        assert_shadow_settings_split_measurements(experiment_results)
+
+    def test_run_tests_passes_when_shadow_settings_split_measurements(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), split_memory=True)
+        tests = [ConcretePropertyTest(ShadowPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())]
+
+        assert test_runner.run_tests(tests) == ([], ["ShadowPropertyTest"])
+
+    def test_iter_experiment_results_runs_experiment_when_previous_consumed(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock())
+        test_case = next(iter(
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())))
+        get_test_results = mocker.spy(test_runner, "get_test_results")
+
+        experiments_results = test_runner.iter_experiment_results(test_case, 3)
+        next(experiments_results)
+        assert get_test_results.call_count == 1
+        assert len(list(experiments_results)) == 2
+        assert get_test_results.call_count == 3
+
+    def test_iter_experiment_results_yields_all_experiments_when_batch_experiments(self, mocker: MockFixture):
+        test_runner = SimulatorTestRunner("aer_simulator", mocker.MagicMock(), batch_experiments=True)
+        test_case = next(iter(
+            ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())))
+
+        parsed_results = test_case.assessor.parse_results(test_runner.iter_experiment_results(test_case, 4))
+        assert len(parsed_results) == 4
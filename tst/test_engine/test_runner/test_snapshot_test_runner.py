@@ -0,0 +1,119 @@
+from math import pi
+
+import pytest
+from numpy import array
+from pytest_mock import MockFixture
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from qiskit_check.property_test.assertions import AssertProbability, AssertStateEqualConcreteValue
+from qiskit_check.property_test.resources import AnyRange, ConcreteQubit, Qubit
+from qiskit_check.test_engine.assessor import Assessor, AssessorFactory
+from qiskit_check.test_engine.circuit_creator import CircuitCreator
+from qiskit_check.test_engine.concrete_property_test import ConcretePropertyTest
+from qiskit_check.test_engine.concrete_property_test.test_case import TestCase
+from qiskit_check.test_engine.generator import NaiveInputGeneratorFactory
+from qiskit_check.test_engine.measurement_location import get_measurement_rotation
+from qiskit_check.test_engine.test_runner import SnapshotSimulatorTestRunner
+from tst.test_engine.test_runner.test_simulator_test_runner import DeterministicPropertyTest, \
+    DeterministicFailPropertyTest, ShadowPropertyTest, assert_shadow_settings_split_measurements
+
+
+def get_test_case(assertions, qubits, circuit: QuantumCircuit) -> TestCase:
+    resource_matcher = {qubit: ConcreteQubit(i, Statevector([1, 0])) for i, qubit in enumerate(qubits)}
+    assessor = Assessor(
+        assertions, 0.99, resource_matcher, AssessorFactory._create_measurement_locations(assertions))
+    initialized_circuit = QuantumCircuit(len(qubits), circuit.num_clbits)
+    for i in range(len(qubits)):
+        initialized_circuit.initialize([1, 0], i)
+    return TestCase(initialized_circuit.compose(circuit), assessor, 100, 10)
+
+
+class TestSnapshotSimulatorTestRunner:
+    def test_run_tests_runs_all_tests_when_everything_correct(self, mocker: MockFixture):
+        test_runner = SnapshotSimulatorTestRunner(mocker.MagicMock())
+        assessor_factory = AssessorFactory()
+        naive_factory = NaiveInputGeneratorFactory()
+        tests = [
+            ConcretePropertyTest(DeterministicPropertyTest, assessor_factory, naive_factory),
+            ConcretePropertyTest(DeterministicFailPropertyTest, assessor_factory, naive_factory)
+        ]
+        assert (["DeterministicFailPropertyTest"], ["DeterministicPropertyTest"]) == test_runner.run_tests(tests)
+
+    def test_get_experiment_results_simulates_one_circuit_for_all_locations_and_bases(self, mocker: MockFixture):
+        qubits = [Qubit(AnyRange()), Qubit(AnyRange())]
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        assertions = [
+            AssertStateEqualConcreteValue(qubits[0], (0, 0), location=0), AssertProbability(qubits[1], "0", 0.5),
+            AssertStateEqualConcreteValue(qubits[0], (pi / 2, 0), location=1)]
+        test_case = get_test_case(assertions, qubits, circuit)
+        test_runner = SnapshotSimulatorTestRunner(mocker.MagicMock(), seed=3)
+        run_circuits = mocker.spy(test_runner, "_run_circuits")
+
+        experiment_results = test_runner.get_experiment_results(test_case)
+
+        run_circuits.assert_called_once()
+        assert len(experiment_results) == 10
+        assert len(CircuitCreator().get_measurement_plan(test_case)) > 1
+        p_values = test_case.assessor.get_p_values(experiment_results, 100, 10)
+        assert all(p_value > 0.001 for p_value in p_values)
+
+    def test_get_experiment_results_splits_measurements_among_shadow_settings(self, mocker: MockFixture):
+        test = ConcretePropertyTest(ShadowPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        test_runner = SnapshotSimulatorTestRunner(mocker.MagicMock(), seed=3)
+        run_circuits = mocker.spy(test_runner, "_run_circuits")
+
+        assert_shadow_settings_split_measurements(test_runner.get_experiment_results(next(iter(test)), 3))
+        run_circuits.assert_called_once()
+
+    def test_get_experiment_results_reproducible_when_seeded(self, mocker: MockFixture):
+        test = ConcretePropertyTest(DeterministicPropertyTest, AssessorFactory(), NaiveInputGeneratorFactory())
+        test_case = next(iter(test))
+
+        results = []
+        for _ in range(2):
+            test_runner = SnapshotSimulatorTestRunner(mocker.MagicMock(), seed=7)
+            experiment_results = test_runner.get_experiment_results(test_case)
+            results.append([
+                result.get_counts() for experiment in experiment_results for result, _ in experiment.values()])
+
+        assert len(results[0]) == DeterministicPropertyTest.num_experiments()
+        assert results[0] == results[1]
+
+    def test_get_snapshot_circuit_returns_none_when_circuit_measures(self):
+        qubits = [Qubit(AnyRange())]
+        circuit = QuantumCircuit(1, 1)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        test_case = get_test_case([AssertProbability(qubits[0], "0", 0.5)], qubits, circuit)
+
+        assert SnapshotSimulatorTestRunner.get_snapshot_circuit(
+            test_case.circuit, CircuitCreator.get_measurement_requests(test_case),
+            test_case.assessor.resource_matcher) is None
+
+    def test_get_experiment_results_falls_back_to_measurement_circuits_when_circuit_measures(
+            self, mocker: MockFixture):
+        qubits = [Qubit(AnyRange())]
+        circuit = QuantumCircuit(1, 1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        test_case = get_test_case([AssertProbability(qubits[0], "1", 1)], qubits, circuit)
+        test_runner = SnapshotSimulatorTestRunner(mocker.MagicMock())
+
+        experiment_results = test_runner.get_experiment_results(test_case)
+
+        assert test_case.assessor.get_p_values(experiment_results, 100, 10) == [1]
+
+    def test_get_outcome_probabilities_rotates_each_qubit_when_ok_input(self):
+        # qubit 0 in state |+>, qubit 1 in state |1>
+        density_matrix = Statevector(array([0, 0, 1, 1]) / 2 ** 0.5).to_operator().data
+        x_measurement = AssertStateEqualConcreteValue.get_x_measurement()
+        z_measurement = AssertStateEqualConcreteValue.get_z_measurement()
+
+        probabilities = SnapshotSimulatorTestRunner.get_outcome_probabilities(
+            density_matrix, [get_measurement_rotation(x_measurement), get_measurement_rotation(z_measurement)])
+
+        assert probabilities.keys() == {2}
+        assert probabilities[2] == pytest.approx(1)
@@ -0,0 +1,76 @@
+from pytest_mock import MockFixture
+from qiskit import Aer, ClassicalRegister, QuantumCircuit
+
+from qiskit_check.test_engine.test_runner.transpilation_cache import TranspilationCache
+
+
+def get_circuit(angle: float = 0.5) -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.add_register(ClassicalRegister(1))
+    circuit.initialize([1, 0], 0)
+    circuit.rx(angle, 1)
+    circuit.cx(0, 1)
+    circuit.measure(1, 0)
+    return circuit
+
+
+class TestTranspilationCache:
+    def test_transpile_returns_cached_circuit_when_structurally_identical_circuit_transpiled(self):
+        backend = Aer.get_backend("aer_simulator")
+        cache = TranspilationCache()
+
+        first = cache.transpile([get_circuit()], backend)[0]
+        second = cache.transpile([get_circuit()], backend)[0]
+
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_transpile_transpiles_again_when_parameters_differ(self):
+        backend = Aer.get_backend("aer_simulator")
+        cache = TranspilationCache()
+
+        first, second = cache.transpile([get_circuit(0.5), get_circuit(0.25)], backend)
+
+        assert first is not second
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_transpile_evicts_least_recently_used_when_cache_full(self):
+        backend = Aer.get_backend("aer_simulator")
+        cache = TranspilationCache(max_size=2)
+
+        cache.transpile([get_circuit(0.1)], backend)
+        cache.transpile([get_circuit(0.2)], backend)
+        cache.transpile([get_circuit(0.1)], backend)
+        cache.transpile([get_circuit(0.3)], backend)
+        cache.transpile([get_circuit(0.1)], backend)
+        cache.transpile([get_circuit(0.2)], backend)
+
+        assert cache.hits == 2
+        assert cache.misses == 4
+
+    def test_transpile_does_not_hold_lock_while_transpiling(self, mocker: MockFixture):
+        backend = Aer.get_backend("aer_simulator")
+        cache = TranspilationCache()
+        lock_states = []
+        mocker.patch(
+            "qiskit_check.test_engine.test_runner.transpilation_cache.transpile",
+            side_effect=lambda circuits, _: lock_states.append(cache._lock.locked()) or circuits)
+
+        cache.transpile([get_circuit(0.1), get_circuit(0.2)], backend)
+
+        assert lock_states == [False]
+        assert cache.misses == 2
+
+    def test_get_fingerprint_differs_when_custom_instructions_share_name(self):
+        first_instruction = QuantumCircuit(1, name="measure_y")
+        first_instruction.sdg(0)
+        second_instruction = QuantumCircuit(1, name="measure_y")
+        second_instruction.h(0)
+        first = QuantumCircuit(1)
+        first.append(first_instruction.to_instruction(), [0])
+        second = QuantumCircuit(1)
+        second.append(second_instruction.to_instruction(), [0])
+
+        assert TranspilationCache.get_fingerprint(first) != TranspilationCache.get_fingerprint(second)
@@ -0,0 +1,74 @@
+from numpy.random import default_rng
+from qiskit import Aer, QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from pytest_mock import MockFixture
+
+from qiskit_check.test_engine.test_runner.utils import bind_parameters_by_name, run_by_num_shots, sample_results, \
+    split_result, split_memory
+
+
+class TestUtils:
+    def test_split_result_returns_result_per_circuit_when_multiple_circuits_run(self):
+        zero_circuit = QuantumCircuit(1, 1)
+        zero_circuit.measure(0, 0)
+        one_circuit = QuantumCircuit(2, 2)
+        one_circuit.x(0)
+        one_circuit.measure([0, 1], [0, 1])
+        backend = Aer.get_backend("aer_simulator")
+        result = backend.run(transpile([zero_circuit, one_circuit], backend), shots=10).result()
+
+        split_results = split_result(result)
+
+        assert len(split_results) == 2
+        assert split_results[0].get_counts() == {"0": 10}
+        assert split_results[1].get_counts() == {"01": 10}
+
+    def test_split_memory_returns_result_per_experiment_when_memory_stored(self):
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.x(1)
+        circuit.measure([0, 1], [0, 1])
+        backend = Aer.get_backend("aer_simulator")
+        result = backend.run(transpile(circuit, backend), shots=40, memory=True).result()
+
+        split_results = split_memory(result, 4)
+
+        assert len(split_results) == 4
+        memory = result.get_memory()
+        for i, experiment_result in enumerate(split_results):
+            counts = experiment_result.get_counts()
+            assert sum(counts.values()) == 10
+            for state, count in counts.items():
+                assert memory[i*10:(i + 1)*10].count(state) == count
+            assert experiment_result.results[0].metadata == result.results[0].metadata
+
+    def test_bind_parameters_by_name_binds_when_parameters_are_different_objects(self):
+        circuit = QuantumCircuit(1)
+        circuit.rx(Parameter("theta"), 0)
+
+        bound_circuit = bind_parameters_by_name(circuit, {Parameter("theta"): 0.5})
+
+        assert len(bound_circuit.parameters) == 0
+        assert float(bound_circuit.data[0][0].params[0]) == 0.5
+
+    def test_sample_results_returns_result_per_experiment_when_probabilities_given(self):
+        circuit = QuantumCircuit(2, 2)
+        circuit.measure([0, 1], [0, 1])
+        backend = Aer.get_backend("aer_simulator")
+        result = backend.run(transpile(circuit, backend), shots=1).result()
+
+        sampled_results = sample_results(result, {1: 0.5, 2: 0.5}, 20, 3, default_rng(0))
+
+        assert len(sampled_results) == 3
+        for sampled_result in sampled_results:
+            counts = sampled_result.get_counts()
+            assert sum(counts.values()) == 20
+            assert set(counts.keys()).issubset({"01", "10"})
+
+    def test_run_by_num_shots_runs_items_with_the_same_shots_together(self, mocker: MockFixture):
+        run = mocker.MagicMock(side_effect=lambda items, num_shots: [f"{item}-{num_shots}" for item in items])
+
+        results = run_by_num_shots(["a", "b", "c", "d"], [10, 2, 10, 2], run)
+
+        assert results == ["a-10", "b-2", "c-10", "d-2"]
+        assert run.call_count == 2